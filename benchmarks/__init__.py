@@ -0,0 +1 @@
+"""Microbenchmarks for the bundled parsers; run with ``python -m benchmarks``."""
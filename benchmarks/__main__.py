@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.suite import CaseResult, compare, default_cases, invalid, run_suite
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Licenscope parser benchmarks")
+    parser.add_argument("-o", "--output", help="Write results as JSON to this path")
+    parser.add_argument(
+        "--baseline", help="Compare against a previous results JSON file"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Allowed throughput drop versus the baseline (default 0.10)",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed repeats per case")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply payload sizes (e.g. 0.1 for a quick run)",
+    )
+    parser.add_argument(
+        "-k", "--select", action="append", help="Only run cases with this prefix"
+    )
+    return parser
+
+
+def _print_result(result: CaseResult) -> None:
+    if not result.valid:
+        print(
+            f"{result.name:<20} {'INVALID':>12} errors={result.errors} "
+            f"({result.description})"
+        )
+        return
+    print(
+        f"{result.name:<20} {result.records_per_s:>12,.0f} rec/s "
+        f"{result.mb_per_s:>8.1f} MB/s "
+        f"peak={result.peak_memory_bytes / 2**20:>7.1f} MiB "
+        f"({result.description})"
+    )
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    cases = default_cases(args.scale)
+    if args.select:
+        cases = [
+            case
+            for case in cases
+            if any(case.name.startswith(prefix) for prefix in args.select)
+        ]
+    report = run_suite(cases, repeats=max(1, args.repeats), progress=_print_result)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    failed = False
+    for line in invalid(report):
+        print(f"INVALID {line}")
+        failed = True
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        for line in compare(baseline, report, threshold=args.threshold):
+            print(f"REGRESSION {line}")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
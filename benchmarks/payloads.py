@@ -0,0 +1,92 @@
+"""Deterministic synthetic payloads for the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+_BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_ORDINALS = {1: "st", 2: "nd", 3: "rd", 21: "st", 22: "nd", 23: "rd", 31: "st"}
+
+
+def _expiry(rng: random.Random) -> datetime:
+    return _BASE + timedelta(seconds=rng.randrange(0, 3 * 365 * 86_400))
+
+
+def json_export(records: int, *, seed: int = 1) -> str:
+    """A vendor-style export: ``{"reply": {"items": [...]}}`` of licence objects."""
+    rng = random.Random(seed)
+    items = [
+        {
+            "system": f"appliance-{index:06d}",
+            "expires_at": _expiry(rng).strftime("%Y-%m-%d %H:%M:%S"),
+            "seats": rng.randrange(1, 500),
+            "edition": rng.choice(("standard", "pro", "enterprise")),
+        }
+        for index in range(records)
+    ]
+    return json.dumps({"reply": {"total": records, "items": items}})
+
+
+def regex_log(size_bytes: int, *, expiry_every: int = 50, seed: int = 2) -> str:
+    """An appliance log with an expiry line every ``expiry_every`` lines."""
+    rng = random.Random(seed)
+    lines: list[str] = []
+    written = 0
+    index = 0
+    while written < size_bytes:
+        if index % expiry_every == 0:
+            line = (
+                f"license fw-{index:08d} expires "
+                f"{_expiry(rng).strftime('%Y-%m-%dT%H:%M:%S')}"
+            )
+        else:
+            line = (
+                f"2026-01-01T00:00:{index % 60:02d} INFO heartbeat "
+                f"node={rng.randrange(1000)} latency_ms={rng.randrange(500)} ok"
+            )
+        lines.append(line)
+        written += len(line) + 1
+        index += 1
+    return "\n".join(lines) + "\n"
+
+
+def csv_payload(rows: int, *, seed: int = 3) -> str:
+    """``system,expires_at`` rows for the Jinja template benchmark."""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"system-{index:06d},{_expiry(rng).strftime('%Y-%m-%d %H:%M:%S')}"
+        for index in range(rows)
+    )
+
+
+JINJA_CSV_TEMPLATE = (
+    "[{% for line in payload.splitlines() %}"
+    "{% set cells = line.split(',') %}"
+    '{"system": "{{ cells[0] }}", "expires_at": "{{ cells[1] }}"}'
+    "{{ ',' if not loop.last }}"
+    "{% endfor %}]"
+)
+
+
+def mixed_datetimes(count: int, *, seed: int = 4) -> list[object]:
+    """Values in the formats ``parse_datetime`` accepts, interleaved."""
+    rng = random.Random(seed)
+    values: list[object] = []
+    for index in range(count):
+        moment = _expiry(rng)
+        kind = index % 5
+        if kind == 0:
+            values.append(moment.isoformat())
+        elif kind == 1:
+            values.append(int(moment.timestamp() * 1000))
+        elif kind == 2:
+            day = moment.day
+            suffix = _ORDINALS.get(day, "th")
+            values.append(f"{moment:%b} {day}{suffix} {moment.year} {moment:%H:%M:%S}")
+        elif kind == 3:
+            values.append(moment.strftime("%Y-%m-%d %H:%M:%S"))
+        else:
+            values.append(moment.strftime("%b %d, %Y %H:%M"))
+    return values
@@ -0,0 +1,233 @@
+"""Parser and datetime microbenchmarks.
+
+Each case times the best of several repeats for throughput and measures
+peak traced memory in a separate, untimed run so that ``tracemalloc``
+overhead does not skew the timings.
+"""
+
+from __future__ import annotations
+
+import gc
+import io
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from benchmarks import payloads
+from licenscope import __version__
+from licenscope.parsers.jinja_parser import JinjaParser
+from licenscope.parsers.json_parser import JsonParser
+from licenscope.parsers.regex_parser import RegexParser
+from licenscope.util.datetime import DateTimeParser, parse_datetime
+
+_CONTEXT = {"default_timezone": "UTC"}
+_REGEX = r"license (?P<system>\S+) expires (?P<expires_at>\S+)"
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[[], Callable[[], tuple[int, int]]]
+    payload_bytes: int
+    description: str
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    name: str
+    description: str
+    records: int
+    errors: int
+    payload_bytes: int
+    seconds: float
+    # ``None`` when any input failed: timing a run that skipped part of its
+    # payload would make a broken parser look fast.
+    records_per_s: float | None
+    mb_per_s: float | None
+    peak_memory_bytes: int
+
+    @property
+    def valid(self) -> bool:
+        return self.records_per_s is not None
+
+
+def _json_case(name: str, records: int, *, stream: bool) -> Case:
+    payload = payloads.json_export(records)
+    encoded = payload.encode("utf-8")
+
+    def setup() -> Callable[[], tuple[int, int]]:
+        parser = JsonParser(key=".reply.items", stream=stream)
+        if stream:
+            return lambda: (
+                len(parser.parse_stream(io.BytesIO(encoded), context=_CONTEXT)),
+                0,
+            )
+        return lambda: (len(parser.parse(payload, context=_CONTEXT)), 0)
+
+    mode = "stream" if stream else "load"
+    return Case(name, setup, len(encoded), f"json export, {records} items, {mode}")
+
+
+def _regex_case(name: str, size_bytes: int, *, stream: bool) -> Case:
+    payload = payloads.regex_log(size_bytes)
+    encoded = payload.encode("utf-8")
+
+    def setup() -> Callable[[], tuple[int, int]]:
+        parser = RegexParser(pattern=_REGEX, stream=stream)
+        if stream:
+            return lambda: (
+                len(parser.parse_stream(io.BytesIO(encoded), context=_CONTEXT)),
+                0,
+            )
+        return lambda: (len(parser.parse(payload, context=_CONTEXT)), 0)
+
+    mode = "stream" if stream else "load"
+    return Case(
+        name, setup, len(encoded), f"log, {len(encoded) / 2**20:.1f} MiB, {mode}"
+    )
+
+
+def _jinja_case(name: str, rows: int) -> Case:
+    payload = payloads.csv_payload(rows)
+
+    def setup() -> Callable[[], tuple[int, int]]:
+        parser = JinjaParser(template=payloads.JINJA_CSV_TEMPLATE)
+        return lambda: (len(parser.parse(payload, context=_CONTEXT)), 0)
+
+    return Case(name, setup, len(payload.encode("utf-8")), f"csv template, {rows} rows")
+
+
+def _datetime_case(name: str, count: int, *, learned: bool) -> Case:
+    values = payloads.mixed_datetimes(count)
+    size = sum(len(str(value)) for value in values)
+
+    def setup() -> Callable[[], tuple[int, int]]:
+        if learned:
+            parser = DateTimeParser()
+            parse: Callable[[object], datetime] = parser.parse
+        else:
+            parse = parse_datetime
+
+        def run() -> tuple[int, int]:
+            errors = 0
+            for value in values:
+                try:
+                    parse(value)
+                except ValueError:
+                    errors += 1
+            return len(values) - errors, errors
+
+        return run
+
+    mode = "DateTimeParser" if learned else "parse_datetime"
+    return Case(name, setup, size, f"{count} mixed values, {mode}")
+
+
+def default_cases(scale: float = 1.0) -> list[Case]:
+    def n(value: int) -> int:
+        return max(1, int(value * scale))
+
+    return [
+        _json_case("json_small", n(1_000), stream=False),
+        _json_case("json_large", n(200_000), stream=False),
+        _json_case("json_large_stream", n(200_000), stream=True),
+        _regex_case("regex_log", n(16 * 2**20), stream=False),
+        _regex_case("regex_log_stream", n(16 * 2**20), stream=True),
+        _jinja_case("jinja_csv", n(50_000)),
+        _datetime_case("datetime_mixed", n(50_000), learned=False),
+        _datetime_case("datetime_learned", n(50_000), learned=True),
+    ]
+
+
+def run_case(case: Case, *, repeats: int) -> CaseResult:
+    best = float("inf")
+    records = errors = 0
+    for _ in range(repeats):
+        run = case.setup()
+        gc.collect()
+        started = time.perf_counter()
+        records, errors = run()
+        best = min(best, time.perf_counter() - started)
+
+    run = case.setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    valid = not errors and best > 0
+    return CaseResult(
+        name=case.name,
+        description=case.description,
+        records=records,
+        errors=errors,
+        payload_bytes=case.payload_bytes,
+        seconds=best,
+        records_per_s=records / best if valid else None,
+        mb_per_s=case.payload_bytes / 2**20 / best if valid else None,
+        peak_memory_bytes=peak,
+    )
+
+
+def run_suite(
+    cases: list[Case],
+    *,
+    repeats: int,
+    progress: Callable[[CaseResult], None] | None = None,
+) -> dict[str, Any]:
+    results = {}
+    for case in cases:
+        result = run_case(case, repeats=repeats)
+        results[case.name] = asdict(result)
+        if progress is not None:
+            progress(result)
+    return {
+        "licenscope_version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "repeats": repeats,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], *, threshold: float
+) -> list[str]:
+    """Describe cases whose throughput dropped by more than ``threshold``.
+
+    Cases without a throughput on either side are skipped; ``invalid``
+    reports the current ones.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous["records_per_s"]:
+            continue
+        if not result["records_per_s"]:
+            continue
+        ratio = result["records_per_s"] / previous["records_per_s"]
+        if ratio < 1.0 - threshold:
+            regressions.append(
+                f"{name}: {result['records_per_s']:.0f} records/s vs "
+                f"{previous['records_per_s']:.0f} ({(1.0 - ratio) * 100:.1f}% slower)"
+            )
+    return regressions
+
+
+def invalid(report: dict[str, Any]) -> list[str]:
+    """Describe cases that had parse errors and so published no throughput."""
+    return [
+        f"{name}: {result['errors']} of {result['records'] + result['errors']} "
+        "values failed to parse"
+        for name, result in report["results"].items()
+        if result["errors"]
+    ]
@@ -1,14 +1,59 @@
 from __future__ import annotations
 
-from typing import Any
+import dataclasses
+import itertools
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
-from licenscope.config.schema import AppConfig
-from licenscope.core.models import LicenseRecord
+from licenscope.config.schema import (
+    AppConfig,
+    DeliveryConfig,
+    LicenseSourceConfig,
+    NotificationConfig,
+)
+from licenscope.core.errors import ConfigError
+from licenscope.core.models import LicenseRecord, RecordBatch
+from licenscope.util import deadline, timing
 from licenscope.util.logging import get_logger
+from licenscope.util.scheduler import RefreshScheduler
 from licenscope.parsers.registry import ParserRegistry
-from licenscope.sources import create_source
+from licenscope.plan import ExecutionPlan, SourcePlan, compile_plan
+from licenscope.notifications.dispatcher import DeliveryTarget, NotificationDispatcher
 from licenscope.notifications.registry import NotificationRegistry
 
+if TYPE_CHECKING:
+    from licenscope.notifications.base import Notifier
+    from licenscope.parsers.pool import ParsePool
+    from licenscope.sharding import ShardOutput
+    from licenscope.util.metrics import MetricsServer, MetricsSnapshot
+    from licenscope.util.state import RecordChange, StateStore
+    from licenscope.util.timing import RunReport, SourceTimings
+
+
+# Upper bound on how long the scheduler sleeps while a worker may have picked
+# up a source it has not observed yet, so per-source deadlines stay accurate.
+# The daemon loop also uses it to notice a stop request while sources run.
+_POLL_INTERVAL = 0.5
+
+# Settings that the running daemon's pools, client, store and exporter were
+# built from; reloading the config does not change them.
+_RESTART_SETTINGS = (
+    "workers",
+    "parse_processes",
+    "http",
+    "retry",
+    "state",
+    "exporter",
+)
+
+# Called with a source's index and records as soon as that source succeeds.
+_ResultCallback = Callable[[int, list[LicenseRecord]], None]
+
 
 class LicenseChecker:
     def __init__(
@@ -18,81 +63,1127 @@ class LicenseChecker:
     ) -> None:
         self._parser_registry = parser_registry
         self._notification_registry = notification_registry
+        self._notifiers: dict[str, Notifier] = {}
+        self._notifiers_lock = threading.Lock()
+        self._dispatcher: tuple[DeliveryConfig, NotificationDispatcher] | None = None
+        self._plan: ExecutionPlan | None = None
         self._logger = get_logger(self.__class__.__name__)
 
-    def run(self, config: AppConfig) -> list[LicenseRecord]:
+    def compile(self, config: AppConfig) -> ExecutionPlan:
+        """Validate ``config`` and build its sources, parsers and notifiers.
+
+        The plan is kept and reused while the same configuration object is
+        passed in, so repeated runs do not rebuild anything. A new
+        configuration only rebuilds the sources that are not carried over
+        from the previous plan. Every invalid source or notifier is reported
+        in a single ``ConfigError``.
+        """
+        previous = self._plan
+        if previous is not None and previous.config is config:
+            return previous
+        problems = []
+        try:
+            plan = compile_plan(config, self._parser_registry, previous=previous)
+        except ConfigError as exc:
+            plan = None
+            problems.append(str(exc))
+        errors = []
+        for notification_config in config.notifications:
+            try:
+                self._get_notifier(notification_config)
+            except Exception as exc:
+                errors.append(f"notification kind={notification_config.kind}: {exc}")
+        if errors:
+            problems.append("Invalid notifications:\n  " + "\n  ".join(errors))
+        if problems:
+            if plan is not None and plan.client is not None:
+                if previous is None or plan.client is not previous.client:
+                    plan.client.close()
+            raise ConfigError("\n".join(problems))
+        if (
+            previous is not None
+            and previous.client is not None
+            and previous.client is not plan.client
+        ):
+            previous.client.close()
+        self._plan = plan
+        return plan
+
+    def close(self) -> None:
+        """Release the HTTP client of the current plan and the notifiers."""
+        plan, self._plan = self._plan, None
+        if plan is not None and plan.client is not None:
+            plan.client.close()
+        with self._notifiers_lock:
+            cached, self._dispatcher = self._dispatcher, None
+            notifiers = list(self._notifiers.values())
+        if cached is not None:
+            cached[1].close()
+        for notifier in notifiers:
+            notifier.close()
+
+    def run(
+        self, config: AppConfig, *, report: RunReport | None = None
+    ) -> list[LicenseRecord]:
+        """Check every source once and notify.
+
+        With a ``report``, per-stage timings of every source and the outcome
+        of every notification delivery are collected into it.
+        """
+        plan = self.compile(config)
+        store = self._open_state_store(config)
+        early = None
+        if config.delivery.critical_days is not None and config.notifications:
+            early = _EarlyNotifications(
+                self, config, store, config.delivery.critical_days, report
+            )
+        try:
+            results = self.collect(
+                config,
+                report=report,
+                on_result=early.source_done if early is not None else None,
+            )
+            if early is not None:
+                early.finish()
+        except BaseException:
+            if store is not None:
+                store.close()
+            raise
+
         records: list[LicenseRecord] = []
+        observed: dict[str, list[LicenseRecord]] = {}
         failures = 0
-        for source_config in config.sources:
+        for source_plan, parsed in zip(plan.sources, results):
+            if parsed is None:
+                failures += 1
+            else:
+                records.extend(parsed)
+                observed.setdefault(source_plan.fingerprint, []).extend(parsed)
+        self._notify_run(
+            config,
+            records,
+            observed,
+            failures,
+            store=store,
+            early=early,
+            report=report,
+        )
+        return records
+
+    def collect(
+        self,
+        config: AppConfig,
+        *,
+        report: RunReport | None = None,
+        on_result: _ResultCallback | None = None,
+    ) -> list[list[LicenseRecord] | None]:
+        """Fetch and parse every source once without notifying.
+
+        Results follow ``config.sources``; ``None`` marks a source that
+        failed or timed out.
+        """
+        plan = self.compile(config)
+        client = plan.client
+        pool = self._build_parse_pool(config)
+        timings = None
+        if report is not None:
+            timings = [
+                report.source(index, source_config.kind, source_config.parser)
+                for index, source_config in enumerate(config.sources)
+            ]
+        try:
+            if (
+                config.workers <= 1
+                and config.source_timeout is None
+                and config.run_timeout is None
+            ):
+                results = self._run_sequential(plan, pool, on_result, timings)
+            else:
+                results = self._run_concurrent(plan, pool, on_result, timings)
+        finally:
+            if pool is not None:
+                pool.close()
+        if client is not None and client.cache is not None:
+            stats = client.cache.stats()
+            self._logger.info(
+                "HTTP cache hits={} misses={} stores={} evictions={} entries={} bytes={}",
+                stats["hits"],
+                stats["misses"],
+                stats["stores"],
+                stats["evictions"],
+                stats["entries"],
+                stats["bytes"],
+            )
+        return results
+
+    def merge(
+        self,
+        config: AppConfig,
+        outputs: list[ShardOutput],
+        *,
+        report: RunReport | None = None,
+    ) -> list[LicenseRecord]:
+        """Notify once over the union of shard outputs written by ``--shard``.
+
+        Results are matched to configured sources by shard and position, so
+        sources that differ only in ``auth`` or ``name`` stay apart. A shard
+        reported by more than one output is taken from the first only, so
+        overlapping outputs cannot alert twice. Configured sources missing
+        from every output count as failures.
+        """
+        from licenscope.sharding import shard_of
+
+        counts = {output.count for output in outputs}
+        if len(counts) != 1:
+            raise ConfigError(
+                f"Shard outputs disagree on the shard count: {sorted(counts)}"
+            )
+        count = counts.pop()
+        shards = [shard_of(source_config, count) for source_config in config.sources]
+        positions: dict[int, list[int]] = {}
+        for position, shard in enumerate(shards):
+            positions.setdefault(shard, []).append(position)
+        missing = sorted(set(range(count)) - {output.index for output in outputs})
+        if missing:
+            self._logger.error(
+                "Merging without shards {} of {}; their sources count as failed",
+                missing,
+                count,
+            )
+
+        records: list[LicenseRecord] = []
+        observed: dict[str, list[LicenseRecord]] = {}
+        merged: set[int] = set()
+        taken: set[int] = set()
+        for output in outputs:
+            if output.index in taken:
+                self._logger.warning(
+                    "Ignoring duplicate output for shard {}/{}",
+                    output.index,
+                    output.count,
+                )
+                continue
+            taken.add(output.index)
+            expected = positions.get(output.index, [])
+            if [result.fingerprint for result in output.results] != [
+                config.sources[position].fingerprint() for position in expected
+            ]:
+                self._logger.error(
+                    "Output of shard {}/{} was written for a different config; "
+                    "its sources count as failed",
+                    output.index,
+                    output.count,
+                )
+                continue
+            for position, result in zip(expected, output.results):
+                if result.records is not None:
+                    merged.add(position)
+                    records.extend(result.records)
+                    observed.setdefault(result.fingerprint, []).extend(result.records)
+
+        failures = 0
+        for position, source_config in enumerate(config.sources):
+            if position in merged:
+                continue
+            failures += 1
+            if shards[position] in taken:
+                continue
+            self._logger.error(
+                "No result for source kind={} parser={} (shard {} missing)",
+                source_config.kind,
+                source_config.parser,
+                shards[position],
+            )
+        self._notify_run(
+            config,
+            records,
+            observed,
+            failures,
+            store=self._open_state_store(config),
+            early=None,
+            report=report,
+        )
+        return records
+
+    def _notify_run(
+        self,
+        config: AppConfig,
+        records: list[LicenseRecord],
+        observed: dict[str, list[LicenseRecord]],
+        failures: int,
+        *,
+        store: StateStore | None,
+        early: _EarlyNotifications | None,
+        report: RunReport | None,
+    ) -> None:
+        batch = RecordBatch(records)
+        if store is not None:
             try:
-                source = create_source(
-                    source_config.kind,
-                    **source_config.options,
-                    auth=source_config.auth,
+                self._notify_changes(
+                    config, store, observed, now=batch.now, early=early, report=report
                 )
-                parser = self._parser_registry.create(
-                    source_config.parser,
-                    **source_config.parser_options,
+            finally:
+                store.close()
+        elif early is None:
+            self._notify(config, batch, report=report)
+        else:
+            self._notify(config, batch, report=report, sent=early.delivered)
+        if report is not None:
+            report.finish()
+        self._logger.info(
+            "Finished processing: total_records={} expired={} failures={}",
+            len(batch),
+            batch.expired_count(),
+            failures,
+        )
+
+    def serve(
+        self,
+        config: AppConfig,
+        stop: threading.Event,
+        *,
+        reload: Callable[[], AppConfig | None] | None = None,
+    ) -> None:
+        """Refresh sources on their own intervals until ``stop`` is set.
+
+        Each source is fetched and parsed independently on the worker pool
+        and rescheduled ``interval`` seconds (plus up to ``jitter``) after it
+        finishes. Notifications are sent for a source's records as soon as
+        that source is refreshed. The latest records of every source are
+        kept between refreshes; a failed refresh keeps the previous ones.
+
+        With ``exporter.port`` set, the latest records and source health are
+        served as Prometheus metrics for as long as the daemon runs.
+
+        ``reload`` is called every ``daemon.reload_interval`` seconds and
+        returns a new configuration when the config files changed, or
+        ``None``. Added and changed sources are built and refreshed right
+        away; unchanged sources keep their schedule and latest records. A
+        configuration that fails to load or validate is logged and ignored.
+        """
+        plan = self.compile(config)
+        # Daemon state is keyed by a slot per source that survives reloads
+        # which keep the source; slots start out as the source positions.
+        slot_ids = itertools.count()
+        slots = {next(slot_ids): source_plan for source_plan in plan.sources}
+        latest: dict[int, list[LicenseRecord]] = {}
+        started: dict[int, float] = {}
+        scheduler = RefreshScheduler()
+        for slot, source_plan in slots.items():
+            scheduler.schedule(
+                slot, 0.0, jitter=self._source_jitter(config, source_plan.config)
+            )
+
+        # Built inside the try below, so a failing exporter still closes them.
+        pool: ParsePool | None = None
+        store: StateStore | None = None
+        metrics_server: MetricsServer | None = None
+        executor: ThreadPoolExecutor | None = None
+
+        def process(slot: int, source_plan: SourcePlan) -> list[LicenseRecord]:
+            started[slot] = time.monotonic()
+            return self._process_source(
+                source_plan, pool, timeout=config.source_timeout
+            )
+
+        def elapsed(slot: int) -> float:
+            start = started.get(slot)
+            return time.monotonic() - start if start is not None else 0.0
+
+        in_flight: dict[Future[list[LicenseRecord]], int] = {}
+        # Timed-out refreshes keep running in their worker; a source is not
+        # refreshed again until that worker is done with its source and parser.
+        abandoned: dict[int, Future[list[LicenseRecord]]] = {}
+        next_reload = time.monotonic() + (config.daemon.reload_interval or 0.0)
+        try:
+            pool = self._build_parse_pool(config)
+            store = self._open_state_store(config)
+            metrics, metrics_server = self._start_exporter(config)
+            executor = ThreadPoolExecutor(
+                max_workers=max(1, config.workers),
+                thread_name_prefix="licenscope-source",
+            )
+            self._logger.info("Daemon started with {} sources", len(slots))
+            while not stop.is_set():
+                if (
+                    reload is not None
+                    and config.daemon.reload_interval is not None
+                    and time.monotonic() >= next_reload
+                ):
+                    reloaded = self._reload_config(config, reload)
+                    if reloaded is not None:
+                        config, plan = reloaded
+                        slots = self._reassign_slots(
+                            config, slots, plan, slot_ids, scheduler
+                        )
+                        for state in (latest, started, abandoned):
+                            for slot in list(state):
+                                if slot not in slots:
+                                    state.pop(slot, None)
+                        if metrics is not None:
+                            metrics.relabel(
+                                {
+                                    slot: source_plan.config.label()
+                                    for slot, source_plan in slots.items()
+                                }
+                            )
+                    if config.daemon.reload_interval is not None:
+                        next_reload = time.monotonic() + config.daemon.reload_interval
+
+                for slot in scheduler.pop_due():
+                    source_plan = slots.get(slot)
+                    if source_plan is None:
+                        # Removed by a reload.
+                        continue
+                    stale = abandoned.get(slot)
+                    if stale is not None and not stale.done():
+                        self._logger.warning(
+                            "Skipping refresh kind={} parser={}: previous refresh still running",
+                            source_plan.config.kind,
+                            source_plan.config.parser,
+                        )
+                        self._reschedule(config, scheduler, slot, source_plan.config)
+                        continue
+                    abandoned.pop(slot, None)
+                    started.pop(slot, None)
+                    in_flight[executor.submit(process, slot, source_plan)] = slot
+
+                timeout = self._next_refresh_wakeup(
+                    config, scheduler, in_flight, started
                 )
-                payload = source.load()
-                self._logger.debug("Loaded payload: {}", payload)
-                parser_context = {
-                    **source.context,
-                    "default_timezone": config.default_timezone,
-                }
-                parsed = parser.parse(payload, context=parser_context)
-                records.extend(parsed)
-                self._logger.info(
-                    "Processed source kind={} parser={} records={}",
-                    source_config.kind,
-                    source_config.parser,
-                    len(parsed),
-                )
-                for record in parsed:
-                    self._logger.info(
-                        "Record system={} expires_at={} days_left={} expired={}",
-                        record.system,
-                        record.expires_at.isoformat(),
-                        record.days_left,
-                        record.is_expired,
+                if in_flight:
+                    done, _ = wait(
+                        in_flight, timeout=timeout, return_when=FIRST_COMPLETED
                     )
+                else:
+                    stop.wait(timeout)
+                    done = set()
+
+                for future in done:
+                    slot = in_flight.pop(future)
+                    source_plan = slots.get(slot)
+                    if source_plan is None:
+                        # The source was removed while it was refreshing.
+                        started.pop(slot, None)
+                        continue
+                    try:
+                        parsed = future.result()
+                    except Exception as exc:
+                        self._log_failure(source_plan.config, exc)
+                        if metrics is not None:
+                            metrics.mark_failed(
+                                slot,
+                                duration=elapsed(slot),
+                                now=datetime.now(timezone.utc),
+                            )
+                    else:
+                        latest[slot] = parsed
+                        if metrics is not None:
+                            metrics.update(slot, parsed, duration=elapsed(slot))
+                        if store is None:
+                            self._notify(config, RecordBatch(parsed))
+                        else:
+                            self._notify_changes(
+                                config,
+                                store,
+                                {source_plan.fingerprint: parsed},
+                                now=RecordBatch(parsed).now,
+                            )
+                    self._reschedule(config, scheduler, slot, source_plan.config)
+
+                if config.source_timeout is None:
+                    continue
+                now = time.monotonic()
+                for future, slot in list(in_flight.items()):
+                    start = started.get(slot)
+                    if start is not None and now - start >= config.source_timeout:
+                        del in_flight[future]
+                        source_plan = slots.get(slot)
+                        if source_plan is None:
+                            continue
+                        abandoned[slot] = future
+                        self._logger.error(
+                            "Timed out processing source kind={} parser={} after {}s",
+                            source_plan.config.kind,
+                            source_plan.config.parser,
+                            config.source_timeout,
+                        )
+                        if metrics is not None:
+                            metrics.mark_failed(
+                                slot,
+                                duration=now - start,
+                                now=datetime.now(timezone.utc),
+                            )
+                        self._reschedule(config, scheduler, slot, source_plan.config)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if metrics_server is not None:
+                metrics_server.close()
+            self.close()
+            if pool is not None:
+                pool.close()
+            if store is not None:
+                store.close()
+        self._logger.info(
+            "Daemon stopped: total_records={}",
+            sum(len(parsed) for parsed in latest.values()),
+        )
+
+    def _reload_config(
+        self, config: AppConfig, reload: Callable[[], AppConfig | None]
+    ) -> tuple[AppConfig, ExecutionPlan] | None:
+        try:
+            updated = reload()
+            if updated is None:
+                return None
+            changed = [
+                name
+                for name in _RESTART_SETTINGS
+                if getattr(updated, name) != getattr(config, name)
+            ]
+            if changed:
+                self._logger.warning(
+                    "Config changes to {} take effect after a restart",
+                    ", ".join(changed),
+                )
+                updated = dataclasses.replace(
+                    updated, **{name: getattr(config, name) for name in changed}
+                )
+            return updated, self.compile(updated)
+        except ConfigError as exc:
+            self._logger.error("Ignoring config reload: {}", exc)
+            return None
+
+    def _reassign_slots(
+        self,
+        config: AppConfig,
+        slots: dict[int, SourcePlan],
+        plan: ExecutionPlan,
+        slot_ids: Iterator[int],
+        scheduler: RefreshScheduler,
+    ) -> dict[int, SourcePlan]:
+        """Map the reloaded plan onto daemon slots.
+
+        A source carried over by the plan keeps its slot; a new or changed
+        one gets a fresh slot that is refreshed immediately.
+        """
+        kept = {id(source_plan.source): slot for slot, source_plan in slots.items()}
+        reassigned: dict[int, SourcePlan] = {}
+        added = 0
+        for source_plan in plan.sources:
+            slot = kept.pop(id(source_plan.source), None)
+            if slot is None:
+                slot = next(slot_ids)
+                scheduler.schedule(
+                    slot, 0.0, jitter=self._source_jitter(config, source_plan.config)
+                )
+                added += 1
+            reassigned[slot] = source_plan
+        self._logger.info(
+            "Reloaded config: sources={} added_or_changed={} removed={}",
+            len(reassigned),
+            added,
+            len(kept),
+        )
+        return reassigned
+
+    def _reschedule(
+        self,
+        config: AppConfig,
+        scheduler: RefreshScheduler,
+        slot: int,
+        source_config: LicenseSourceConfig,
+    ) -> None:
+        interval = source_config.interval or config.daemon.interval
+        due = scheduler.schedule(
+            slot, interval, jitter=self._source_jitter(config, source_config)
+        )
+        self._logger.debug(
+            "Next refresh kind={} parser={} in {:.1f}s",
+            source_config.kind,
+            source_config.parser,
+            due - time.monotonic(),
+        )
+
+    @staticmethod
+    def _source_jitter(config: AppConfig, source_config: LicenseSourceConfig) -> float:
+        jitter = source_config.jitter
+        return config.daemon.jitter if jitter is None else jitter
+
+    @staticmethod
+    def _next_refresh_wakeup(
+        config: AppConfig,
+        scheduler: RefreshScheduler,
+        in_flight: dict[Future[list[LicenseRecord]], int],
+        started: dict[int, float],
+    ) -> float:
+        now = time.monotonic()
+        deadlines = [_POLL_INTERVAL]
+        next_due = scheduler.time_until_next()
+        if next_due is not None:
+            deadlines.append(next_due)
+        if config.source_timeout is not None:
+            for index in in_flight.values():
+                start = started.get(index)
+                if start is not None:
+                    deadlines.append(start + config.source_timeout - now)
+        return max(0.0, min(deadlines))
+
+    @staticmethod
+    def _start_exporter(
+        config: AppConfig,
+    ) -> tuple[MetricsSnapshot | None, MetricsServer | None]:
+        if config.exporter.port is None:
+            return None, None
+        from licenscope.util.metrics import MetricsServer, MetricsSnapshot
+
+        snapshot = MetricsSnapshot([source.label() for source in config.sources])
+        try:
+            server = MetricsServer(snapshot, config.exporter.host, config.exporter.port)
+        except OSError as exc:
+            raise ConfigError(
+                f"Cannot listen on {config.exporter.host}:{config.exporter.port}: {exc}"
+            ) from exc
+        server.start()
+        return snapshot, server
+
+    @staticmethod
+    def _open_state_store(config: AppConfig) -> StateStore | None:
+        if not config.state.path:
+            return None
+        from licenscope.util.state import StateStore
+
+        return StateStore(
+            config.state.path, window=timedelta(days=config.state.window_days)
+        )
+
+    def _build_parse_pool(self, config: AppConfig) -> ParsePool | None:
+        if not config.parse_processes:
+            return None
+        from licenscope.parsers.pool import ParsePool
+
+        return ParsePool(self._parser_registry, config.parse_processes)
+
+    def _run_sequential(
+        self,
+        plan: ExecutionPlan,
+        pool: ParsePool | None,
+        on_result: _ResultCallback | None = None,
+        timings: list[SourceTimings] | None = None,
+    ) -> list[list[LicenseRecord] | None]:
+        results: list[list[LicenseRecord] | None] = []
+        for index, source_plan in enumerate(plan.sources):
+            try:
+                parsed = self._process_source(
+                    source_plan,
+                    pool,
+                    timings[index] if timings is not None else None,
+                    timeout=plan.config.source_timeout,
+                )
             except Exception as exc:
-                failures += 1
-                self._logger.error(
-                    "Failed processing source kind={} parser={}: {}",
-                    source_config.kind,
+                results.append(None)
+                self._log_failure(source_plan.config, exc)
+                continue
+            results.append(parsed)
+            if on_result is not None:
+                on_result(index, parsed)
+        return results
+
+    def _run_concurrent(
+        self,
+        plan: ExecutionPlan,
+        pool: ParsePool | None,
+        on_result: _ResultCallback | None = None,
+        timings: list[SourceTimings] | None = None,
+    ) -> list[list[LicenseRecord] | None]:
+        """Process sources on a thread pool, keeping results in config order.
+
+        Slots stay ``None`` for sources that failed, overran ``source_timeout``
+        or were still pending when ``run_timeout`` expired. Worker threads
+        cannot be interrupted, so an abandoned source keeps running in the
+        background until its I/O gives up at the same deadline; its result
+        is discarded.
+        """
+        config = plan.config
+        sources = config.sources
+        results: list[list[LicenseRecord] | None] = [None] * len(sources)
+        started: dict[int, float] = {}
+        run_deadline = (
+            time.monotonic() + config.run_timeout if config.run_timeout else None
+        )
+
+        def process(index: int) -> list[LicenseRecord]:
+            started[index] = time.monotonic()
+            return self._process_source(
+                plan.sources[index],
+                pool,
+                timings[index] if timings is not None else None,
+                timeout=config.source_timeout,
+                until=run_deadline,
+            )
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, config.workers),
+            thread_name_prefix="licenscope-source",
+        )
+        futures: dict[Future[list[LicenseRecord]], int] = {
+            executor.submit(process, index): index for index in range(len(sources))
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=self._next_wakeup(
+                        config, pending, futures, started, run_deadline
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as exc:
+                        self._log_failure(sources[index], exc)
+                        continue
+                    if on_result is not None:
+                        on_result(index, results[index])
+
+                now = time.monotonic()
+                if run_deadline is not None and now >= run_deadline and pending:
+                    self._logger.error(
+                        "Run deadline of {}s exceeded; abandoning {} sources",
+                        config.run_timeout,
+                        len(pending),
+                    )
+                    for future in pending:
+                        future.cancel()
+                    break
+                if config.source_timeout is None:
+                    continue
+                for future in list(pending):
+                    index = futures[future]
+                    start = started.get(index)
+                    if start is not None and now - start >= config.source_timeout:
+                        pending.discard(future)
+                        self._logger.error(
+                            "Timed out processing source kind={} parser={} after {}s",
+                            sources[index].kind,
+                            sources[index].parser,
+                            config.source_timeout,
+                        )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    @staticmethod
+    def _next_wakeup(
+        config: AppConfig,
+        pending: set[Future[list[LicenseRecord]]],
+        futures: dict[Future[list[LicenseRecord]], int],
+        started: dict[int, float],
+        run_deadline: float | None,
+    ) -> float | None:
+        now = time.monotonic()
+        deadlines: list[float] = []
+        if run_deadline is not None:
+            deadlines.append(run_deadline - now)
+        if config.source_timeout is not None:
+            for future in pending:
+                start = started.get(futures[future])
+                if start is None:
+                    deadlines.append(_POLL_INTERVAL)
+                else:
+                    deadlines.append(start + config.source_timeout - now)
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines))
+
+    def _process_source(
+        self,
+        source_plan: SourcePlan,
+        pool: ParsePool | None = None,
+        timings: SourceTimings | None = None,
+        *,
+        timeout: float | None = None,
+        until: float | None = None,
+    ) -> list[LicenseRecord]:
+        """Load and parse one source under a deadline.
+
+        The deadline is ``timeout`` seconds from now or the monotonic time
+        ``until``, whichever comes first; I/O and retries of the source stop
+        when it passes.
+        """
+        with deadline.scope(timeout, until=until):
+            if timings is None:
+                return self._load_and_parse(source_plan, pool)
+            with timings.activate():
+                parsed = self._load_and_parse(source_plan, pool)
+                timings.count("records", len(parsed))
+            return parsed
+
+    def _load_and_parse(
+        self, source_plan: SourcePlan, pool: ParsePool | None
+    ) -> list[LicenseRecord]:
+        source_config = source_plan.config
+        source = source_plan.source
+        parser = source_plan.parser
+        # Parsers may annotate the context, so each call gets its own copy.
+        parser_context = dict(source_plan.context)
+        if source.paginated:
+            parsed = self._parse_pages(source_plan, pool, parser_context)
+            self._log_records(source_config, parsed)
+            return parsed
+        # Streaming parsers exist to avoid holding the payload in memory, so
+        # they keep parsing in-thread instead of shipping it to a worker.
+        if pool is not None and not parser.streaming:
+            with timing.measure(timing.STAGE_LOAD):
+                payload = source.load()
+            self._logger.debug("Loaded payload: {}", payload)
+            with timing.measure(timing.STAGE_PARSE):
+                parsed = pool.parse(
                     source_config.parser,
-                    exc,
+                    source_config.parser_options,
+                    payload,
+                    context=parser_context,
                 )
+            self._log_records(source_config, parsed)
+            return parsed
+
+        if parser.streaming:
+            # Reading the stream happens inside the parser; transfer and
+            # decode stages nested here are subtracted from the parse time.
+            with timing.measure(timing.STAGE_LOAD):
+                stream = source.open_stream()
+            with stream, timing.measure(timing.STAGE_PARSE):
+                parsed = parser.parse_stream(stream, context=parser_context)
+        else:
+            with timing.measure(timing.STAGE_LOAD):
+                payload = source.load()
+            self._logger.debug("Loaded payload: {}", payload)
+            with timing.measure(timing.STAGE_PARSE):
+                parsed = parser.parse(payload, context=parser_context)
+        self._log_records(source_config, parsed)
+        return parsed
 
-        self._notify(config, records)
-        expired = sum(1 for record in records if record.is_expired)
+    def _parse_pages(
+        self,
+        source_plan: SourcePlan,
+        pool: ParsePool | None,
+        parser_context: dict[str, Any],
+    ) -> list[LicenseRecord]:
+        """Parse each page as it arrives; the source fetches ahead meanwhile."""
+        source_config = source_plan.config
+        parsed: list[LicenseRecord] = []
+        pages = source_plan.source.load_pages()
+        try:
+            while True:
+                with timing.measure(timing.STAGE_LOAD):
+                    page = next(pages, None)
+                if page is None:
+                    break
+                timing.count("pages")
+                self._logger.debug("Loaded page: {}", page)
+                with timing.measure(timing.STAGE_PARSE):
+                    if pool is not None and not source_plan.parser.streaming:
+                        records = pool.parse(
+                            source_config.parser,
+                            source_config.parser_options,
+                            page,
+                            context=parser_context,
+                        )
+                    else:
+                        records = source_plan.parser.parse(page, context=parser_context)
+                parsed.extend(records)
+        finally:
+            pages.close()
+        return parsed
+
+    def _log_records(
+        self, source_config: LicenseSourceConfig, parsed: list[LicenseRecord]
+    ) -> None:
         self._logger.info(
-            "Finished processing: total_records={} expired={} failures={}",
-            len(records),
-            expired,
-            failures,
+            "Processed source kind={} parser={} records={}",
+            source_config.kind,
+            source_config.parser,
+            len(parsed),
         )
-        return records
+        batch = RecordBatch(parsed)
+        for record, days_left, expired in zip(
+            batch, batch.days_left(), batch.is_expired()
+        ):
+            self._logger.info(
+                "Record system={} expires_at={} days_left={} expired={}",
+                record.system,
+                record.expires_at.isoformat(),
+                days_left,
+                expired,
+            )
+
+    def _log_failure(self, source_config: LicenseSourceConfig, exc: Exception) -> None:
+        self._logger.error(
+            "Failed processing source kind={} parser={}: {}",
+            source_config.kind,
+            source_config.parser,
+            exc,
+        )
+
+    def _notify_changes(
+        self,
+        config: AppConfig,
+        store: StateStore,
+        observed: dict[str, list[LicenseRecord]],
+        *,
+        now: datetime,
+        early: _EarlyNotifications | None = None,
+        report: RunReport | None = None,
+    ) -> None:
+        """Notify only records that changed since the stored state.
+
+        Everything observed is written back in one transaction, except the
+        changes some notifier did not accept: those keep their stored state
+        and are retried on the next run. Changes ``early`` notifications
+        already delivered to a notifier are not sent to it again.
+        """
+        from licenscope.util.state import CHANGE_EXPIRY, CHANGE_NEW, CHANGE_WINDOW
+
+        keys = [_notifier_key(item) for item in config.notifications]
+        delivered = {
+            key: set(early.delivered.get(key, ())) if early is not None else set()
+            for key in keys
+        }
+
+        def done(change: RecordChange) -> bool:
+            return all(id(change.record) in delivered[key] for key in keys)
 
-    def _notify(self, config: AppConfig, records: list[LicenseRecord]) -> None:
-        context: dict[str, Any] = {
+        changes = [
+            change
+            for source, parsed in observed.items()
+            for change in store.diff(source, parsed, now=now)
+        ]
+        pending = [change for change in changes if not done(change)]
+        if pending:
+            accepted = self._notify(
+                config,
+                RecordBatch([change.record for change in pending], now=now),
+                changes=pending,
+                report=report,
+                sent=delivered,
+            )
+            for key, ids in accepted.items():
+                delivered[key] |= ids
+        notified = [change for change in changes if done(change)]
+        store.commit(
+            observed,
+            notified,
+            now=now,
+            undelivered=[change for change in changes if not done(change)],
+        )
+        reasons = Counter(change.reason for change in changes)
+        self._logger.info(
+            "State changes new={} changed={} window={}",
+            reasons[CHANGE_NEW],
+            reasons[CHANGE_EXPIRY],
+            reasons[CHANGE_WINDOW],
+        )
+
+    def _notify(
+        self,
+        config: AppConfig,
+        batch: RecordBatch,
+        *,
+        changes: list[RecordChange] | None = None,
+        report: RunReport | None = None,
+        sent: dict[str, set[int]] | None = None,
+    ) -> dict[str, set[int]]:
+        """Send ``batch`` to every configured notifier in parallel.
+
+        ``sent`` maps notifier keys to the ids of records that notifier
+        already received; those are not sent to it again. Returns, per
+        notifier key, the ids of the records it accepted within
+        ``delivery.timeout``.
+        """
+        base_context: dict[str, Any] = {
             "default_timezone": config.default_timezone,
+            "now": batch.now,
         }
+        accepted: dict[str, set[int]] = {}
+        targets: list[tuple[str, DeliveryTarget]] = []
         for notification_config in config.notifications:
+            key = _notifier_key(notification_config)
+            accepted[key] = set()
+            skip = sent.get(key, ()) if sent else ()
+            records = [record for record in batch.records if id(record) not in skip]
+            if skip and not records:
+                continue
             try:
-                notifier = self._notification_registry.create(
-                    notification_config.kind, **notification_config.options
-                )
-                notifier.send(records, context=context)
-                self._logger.info(
-                    "Notification sent kind={} records={}",
-                    notification_config.kind,
-                    len(records),
-                )
+                notifier = self._get_notifier(notification_config)
             except Exception as exc:
                 self._logger.error(
                     "Failed notification kind={}: {}",
                     notification_config.kind,
                     exc,
                 )
+                continue
+            context = dict(base_context)
+            if changes is not None:
+                ids = {id(record) for record in records}
+                context["changes"] = [
+                    change for change in changes if id(change.record) in ids
+                ]
+            targets.append(
+                (
+                    key,
+                    DeliveryTarget(
+                        notification_config.kind, notifier, records, context
+                    ),
+                )
+            )
+
+        deliveries = self._get_dispatcher(config).deliver_all(
+            [target for _, target in targets], timeout=config.delivery.timeout
+        )
+        for (key, target), delivery in zip(targets, deliveries):
+            if report is not None:
+                report.add_delivery(
+                    {**dataclasses.asdict(delivery), "delivered": delivery.delivered}
+                )
+            if delivery.delivered:
+                accepted[key].update(id(record) for record in target.records)
+                self._logger.info(
+                    "Notification sent kind={} records={} chunks={} attempts={} latency_ms={:.0f}",
+                    delivery.kind,
+                    delivery.records,
+                    delivery.chunks,
+                    delivery.attempts,
+                    delivery.latency * 1000,
+                )
+            elif delivery.timed_out:
+                self._logger.error(
+                    "Notification timed out kind={} records={} after {}s",
+                    delivery.kind,
+                    delivery.records,
+                    config.delivery.timeout,
+                )
+            else:
+                self._logger.error(
+                    "Notification incomplete kind={} failed_chunks={}/{} attempts={} latency_ms={:.0f}",
+                    delivery.kind,
+                    delivery.failed_chunks,
+                    delivery.chunks,
+                    delivery.attempts,
+                    delivery.latency * 1000,
+                )
+        return accepted
+
+    def _get_dispatcher(self, config: AppConfig) -> NotificationDispatcher:
+        """Return the dispatcher for ``config.delivery``, built once."""
+        stale = None
+        with self._notifiers_lock:
+            if self._dispatcher is None or self._dispatcher[0] != config.delivery:
+                if self._dispatcher is not None:
+                    stale = self._dispatcher[1]
+                delivery = config.delivery
+                self._dispatcher = (
+                    delivery,
+                    NotificationDispatcher(
+                        max_parallel=delivery.max_parallel,
+                        max_attempts=delivery.max_attempts,
+                        backoff=delivery.backoff,
+                        max_backoff=delivery.max_backoff,
+                    ),
+                )
+            dispatcher = self._dispatcher[1]
+        if stale is not None:
+            stale.close()
+        return dispatcher
+
+    def _get_notifier(self, notification_config: NotificationConfig) -> Notifier:
+        """Return the process-wide notifier instance for this configuration."""
+        key = _notifier_key(notification_config)
+        with self._notifiers_lock:
+            notifier = self._notifiers.get(key)
+            if notifier is None:
+                notifier = self._notification_registry.create(
+                    notification_config.kind, **notification_config.options
+                )
+                self._notifiers[key] = notifier
+        return notifier
+
+
+def _notifier_key(notification_config: NotificationConfig) -> str:
+    """Identify a notifier by its kind and options."""
+    return json.dumps(
+        [notification_config.kind, notification_config.options],
+        sort_keys=True,
+        default=str,
+    )
+
+
+class _EarlyNotifications:
+    """Notify critical records while slower sources are still running.
+
+    Records that are expired or within ``delivery.critical_days`` of expiry
+    are sent in the background as soon as their source finishes. With a
+    state store only critical records that count as changes are sent. The
+    final notification of the run does not send a record again to a
+    notifier that accepted it here.
+    """
+
+    def __init__(
+        self,
+        checker: LicenseChecker,
+        config: AppConfig,
+        store: StateStore | None,
+        critical_days: int,
+        report: RunReport | None = None,
+    ) -> None:
+        self._checker = checker
+        self._report = report
+        self._config = config
+        self._store = store
+        self._critical_days = critical_days
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="licenscope-early"
+        )
+        self._pending: list[Future[dict[str, set[int]]]] = []
+        # Ids of the records each notifier accepted, by notifier key.
+        self.delivered: dict[str, set[int]] = {}
+
+    def source_done(self, index: int, parsed: list[LicenseRecord]) -> None:
+        batch = RecordBatch(parsed)
+        critical = [
+            record
+            for record, days_left, expired in zip(
+                batch, batch.days_left(), batch.is_expired()
+            )
+            if expired or days_left <= self._critical_days
+        ]
+        changes = None
+        if self._store is not None and critical:
+            changes = self._store.diff(
+                self._config.sources[index].fingerprint(), critical, now=batch.now
+            )
+            critical = [change.record for change in changes]
+        if not critical:
+            return
+        future = self._executor.submit(
+            self._checker._notify,
+            self._config,
+            RecordBatch(critical, now=batch.now),
+            changes=changes,
+            report=self._report,
+        )
+        self._pending.append(future)
+
+    def finish(self) -> None:
+        """Wait for background deliveries and record which succeeded."""
+        for future in self._pending:
+            try:
+                accepted = future.result()
+            except Exception:
+                continue
+            for key, ids in accepted.items():
+                self.delivered.setdefault(key, set()).update(ids)
+        self._executor.shutdown(wait=False)
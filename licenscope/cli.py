@@ -1,14 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import signal
 import sys
-
-from licenscope.app import LicenseChecker
-from licenscope.config.loader import load_config
-from licenscope.core.errors import LicenscopeError
-from licenscope.notifications import build_registry as build_notification_registry
-from licenscope.parsers import build_registry as build_parser_registry
-from licenscope.util.logging import get_logger, setup_logging
+import threading
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -26,26 +22,145 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable ANSI color in logs",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of sources processed concurrently (overrides config)",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        help="Number of worker processes used for parsing (overrides config)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running and refresh each source on its own interval",
+    )
+    parser.add_argument(
+        "--exporter",
+        metavar="[HOST:]PORT",
+        help="Serve Prometheus metrics on this address (implies --daemon)",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        help="Write per-source stage timings and deliveries as JSON to PATH",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="INDEX/COUNT",
+        help="Only check this shard's sources and write them to --output "
+        "instead of notifying",
+    )
+    parser.add_argument(
+        "-o", "--output", metavar="PATH", help="Shard output file for --shard"
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    merge = commands.add_parser(
+        "merge", help="Notify once over the combined outputs of all shards"
+    )
+    merge.add_argument("outputs", nargs="+", metavar="OUTPUT", help="Shard outputs")
     return parser
 
 
 def main() -> None:
-    args = build_parser().parse_args()
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.exporter:
+        args.daemon = True
+    if args.report and args.daemon:
+        parser.error("--report cannot be combined with --daemon or --exporter")
+    if args.shard and (args.daemon or args.command):
+        parser.error("--shard cannot be combined with --daemon or merge")
+    if bool(args.shard) != bool(args.output):
+        parser.error("--shard and --output must be used together")
+    if args.command and args.daemon:
+        parser.error("merge cannot be combined with --daemon")
+    # Imported after argument parsing so `--help` and usage errors stay fast.
+    from licenscope.app import LicenseChecker
+    from licenscope.config.loader import ConfigLoader, parse_listen
+    from licenscope.config.schema import AppConfig
+    from licenscope.core.errors import LicenscopeError
+    from licenscope.notifications import build_registry as build_notification_registry
+    from licenscope.parsers import build_registry as build_parser_registry
+    from licenscope.util.logging import get_logger, setup_logging
+
     setup_logging(args.log_level.upper(), use_color=not args.no_color)
     logger = get_logger("licenscope")
+    report = None
+    if args.report:
+        from licenscope.util.timing import RunReport
+
+        report = RunReport()
+    checker = None
     try:
-        config = load_config(args.config)
+
+        def with_overrides(config: AppConfig) -> AppConfig:
+            if args.workers is not None:
+                config = dataclasses.replace(config, workers=max(1, args.workers))
+            if args.parse_processes is not None:
+                config = dataclasses.replace(
+                    config, parse_processes=max(0, args.parse_processes)
+                )
+            if args.exporter:
+                config = dataclasses.replace(
+                    config, exporter=parse_listen(args.exporter)
+                )
+            return config
+
+        def reload() -> AppConfig | None:
+            config = loader.reload()
+            return None if config is None else with_overrides(config)
+
+        loader = ConfigLoader()
+        config = with_overrides(loader.load(args.config))
         checker = LicenseChecker(
             parser_registry=build_parser_registry(),
             notification_registry=build_notification_registry(),
         )
-        checker.run(config)
+        if args.daemon:
+            stop = threading.Event()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, lambda *_: stop.set())
+            checker.serve(config, stop, reload=reload)
+        elif args.command == "merge":
+            from licenscope.sharding import read_shard_output
+
+            outputs = [read_shard_output(path) for path in args.outputs]
+            checker.merge(config, outputs, report=report)
+        elif args.shard:
+            from licenscope.sharding import (
+                parse_shard,
+                select_shard,
+                write_shard_output,
+            )
+
+            index, count = parse_shard(args.shard)
+            config = select_shard(config, index, count)
+            logger.info(
+                "Checking shard {}/{} with {} sources",
+                index,
+                count,
+                len(config.sources),
+            )
+            results = checker.collect(config, report=report)
+            if report is not None:
+                report.finish()
+            write_shard_output(args.output, index, count, config.sources, results)
+        else:
+            checker.run(config, report=report)
     except LicenscopeError as exc:
         logger.error("Licenscope failed: {}", exc)
         sys.exit(1)
     except Exception:
         logger.exception("Unexpected error")
         sys.exit(1)
+    finally:
+        if checker is not None:
+            checker.close()
+        if report is not None:
+            report.write(args.report)
 
 
 if __name__ == "__main__":
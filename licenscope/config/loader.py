@@ -1,12 +1,30 @@
 from __future__ import annotations
 
+import dataclasses
+import glob
+import hashlib
 import tomllib
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from licenscope.config.schema import AppConfig, LicenseSourceConfig, NotificationConfig
+from licenscope.config.schema import (
+    AppConfig,
+    DaemonConfig,
+    DeliveryConfig,
+    ExporterConfig,
+    HostLimitConfig,
+    HttpConfig,
+    LicenseSourceConfig,
+    NotificationConfig,
+    RetryConfig,
+    StateConfig,
+)
 from licenscope.core.errors import ConfigError
 
+# Top-level keys an included file may set.
+_FRAGMENT_KEYS = frozenset({"sources", "notifications"})
+
 
 def _require_list(value: Any, name: str) -> list[dict[str, Any]]:
     if not isinstance(value, list):
@@ -14,34 +32,422 @@ def _require_list(value: Any, name: str) -> list[dict[str, Any]]:
     return value
 
 
-def load_config(path: str | Path) -> AppConfig:
-    config_path = Path(path)
-    if not config_path.exists():
-        raise ConfigError(f"Config file not found: {config_path}")
-    raw = tomllib.loads(config_path.read_text())
-    sources_raw = _require_list(raw.get("sources", []), "sources")
-    notifications_raw = _require_list(raw.get("notifications", []), "notifications")
-
-    sources = [
-        LicenseSourceConfig(
-            kind=source.get("kind", ""),
-            parser=source.get("parser", ""),
-            options=source.get("options", {}),
-            parser_options=source.get("parser_options", {}),
-            auth=source.get("auth", {}),
+def _optional_positive(value: Any, name: str) -> float | None:
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        raise ConfigError(f"Expected '{name}' to be a positive number")
+    return float(value)
+
+
+def _positive_int(value: Any, name: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ConfigError(f"Expected '{name}' to be a positive integer")
+    return value
+
+
+def _non_negative_int(value: Any, name: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ConfigError(f"Expected '{name}' to be a non-negative integer")
+    return value
+
+
+def _optional_non_negative(value: Any, name: str) -> float | None:
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+        raise ConfigError(f"Expected '{name}' to be a non-negative number")
+    return float(value)
+
+
+def _optional_str(value: Any, name: str) -> str | None:
+    if value is None:
+        return None
+    if not isinstance(value, str) or not value:
+        raise ConfigError(f"Expected '{name}' to be a non-empty string")
+    return value
+
+
+def _require_table(value: Any, name: str) -> dict[str, Any]:
+    if not isinstance(value, dict):
+        raise ConfigError(f"Expected '{name}' to be a table")
+    return value
+
+
+def _http_config(raw: dict[str, Any]) -> HttpConfig:
+    defaults = HttpConfig()
+    return HttpConfig(
+        connect_timeout=_optional_positive(
+            raw.get("connect_timeout", defaults.connect_timeout),
+            "http.connect_timeout",
+        ),
+        read_timeout=_optional_positive(
+            raw.get("read_timeout", defaults.read_timeout), "http.read_timeout"
+        ),
+        pool_size=_positive_int(
+            raw.get("pool_size", defaults.pool_size), "http.pool_size"
+        ),
+        cache_dir=_optional_str(raw.get("cache_dir"), "http.cache_dir"),
+        cache_max_bytes=_positive_int(
+            raw.get("cache_max_bytes", defaults.cache_max_bytes),
+            "http.cache_max_bytes",
+        ),
+        limits={
+            host: _host_limit_config(
+                _require_table(limits, f"http.limits.{host}"), f"http.limits.{host}"
+            )
+            for host, limits in _require_table(
+                raw.get("limits", {}), "http.limits"
+            ).items()
+        },
+    )
+
+
+def _host_limit_config(raw: dict[str, Any], name: str) -> HostLimitConfig:
+    defaults = HostLimitConfig()
+    return HostLimitConfig(
+        rate=_optional_positive(raw.get("rate"), f"{name}.rate"),
+        burst=(
+            None
+            if raw.get("burst") is None
+            else _positive_int(raw["burst"], f"{name}.burst")
+        ),
+        max_in_flight=(
+            None
+            if raw.get("max_in_flight") is None
+            else _positive_int(raw["max_in_flight"], f"{name}.max_in_flight")
+        ),
+        max_retries=_non_negative_int(
+            raw.get("max_retries", defaults.max_retries), f"{name}.max_retries"
+        ),
+        max_retry_after=_optional_non_negative(
+            raw.get("max_retry_after", defaults.max_retry_after),
+            f"{name}.max_retry_after",
+        ),
+    )
+
+
+def _daemon_config(raw: dict[str, Any]) -> DaemonConfig:
+    defaults = DaemonConfig()
+    return DaemonConfig(
+        interval=_optional_positive(
+            raw.get("interval", defaults.interval), "daemon.interval"
+        ),
+        jitter=_optional_non_negative(
+            raw.get("jitter", defaults.jitter), "daemon.jitter"
+        ),
+        # 0 turns watching the config files off.
+        reload_interval=_optional_non_negative(
+            raw.get("reload_interval", defaults.reload_interval),
+            "daemon.reload_interval",
         )
-        for source in sources_raw
-    ]
-    notifications = [
-        NotificationConfig(
-            kind=notification.get("kind", ""),
-            options=notification.get("options", {}),
+        or None,
+    )
+
+
+def _state_config(raw: dict[str, Any]) -> StateConfig:
+    defaults = StateConfig()
+    return StateConfig(
+        path=_optional_str(raw.get("path"), "state.path"),
+        window_days=_non_negative_int(
+            raw.get("window_days", defaults.window_days), "state.window_days"
+        ),
+    )
+
+
+def _delivery_config(raw: dict[str, Any]) -> DeliveryConfig:
+    defaults = DeliveryConfig()
+    return DeliveryConfig(
+        max_parallel=_positive_int(
+            raw.get("max_parallel", defaults.max_parallel), "delivery.max_parallel"
+        ),
+        max_attempts=_positive_int(
+            raw.get("max_attempts", defaults.max_attempts), "delivery.max_attempts"
+        ),
+        backoff=_optional_non_negative(
+            raw.get("backoff", defaults.backoff), "delivery.backoff"
+        ),
+        max_backoff=_optional_non_negative(
+            raw.get("max_backoff", defaults.max_backoff), "delivery.max_backoff"
+        ),
+        timeout=_optional_positive(raw.get("timeout"), "delivery.timeout"),
+        critical_days=(
+            None
+            if raw.get("critical_days") is None
+            else _non_negative_int(raw["critical_days"], "delivery.critical_days")
+        ),
+    )
+
+
+def _retry_config(raw: dict[str, Any]) -> RetryConfig:
+    defaults = RetryConfig()
+    statuses = raw.get("retry_statuses", sorted(defaults.retry_statuses))
+    if not isinstance(statuses, list) or not all(
+        isinstance(status, int) and not isinstance(status, bool) and 100 <= status < 600
+        for status in statuses
+    ):
+        raise ConfigError(
+            "Expected 'retry.retry_statuses' to be a list of HTTP statuses"
         )
-        for notification in notifications_raw
-    ]
+    hedge_percentile = _optional_positive(
+        raw.get("hedge_percentile"), "retry.hedge_percentile"
+    )
+    if hedge_percentile is not None and hedge_percentile >= 100:
+        raise ConfigError("Expected 'retry.hedge_percentile' to be below 100")
+    return RetryConfig(
+        max_attempts=_positive_int(
+            raw.get("max_attempts", defaults.max_attempts), "retry.max_attempts"
+        ),
+        backoff=_optional_non_negative(
+            raw.get("backoff", defaults.backoff), "retry.backoff"
+        ),
+        max_backoff=_optional_non_negative(
+            raw.get("max_backoff", defaults.max_backoff), "retry.max_backoff"
+        ),
+        retry_statuses=frozenset(statuses),
+        hedge_percentile=hedge_percentile,
+        # 0 turns the circuit breaker off.
+        breaker_threshold=_non_negative_int(
+            raw.get("breaker_threshold", defaults.breaker_threshold),
+            "retry.breaker_threshold",
+        ),
+        breaker_cooldown=_optional_non_negative(
+            raw.get("breaker_cooldown", defaults.breaker_cooldown),
+            "retry.breaker_cooldown",
+        ),
+    )
+
+
+def parse_listen(value: str) -> ExporterConfig:
+    """Parse a ``host:port`` or bare ``port`` exporter listen address."""
+    host, _, port = value.rpartition(":")
+    try:
+        number = int(port)
+    except ValueError:
+        number = 0
+    if not 0 < number < 65536:
+        raise ConfigError(f"Invalid exporter listen address: {value}")
+    return ExporterConfig(host=host.strip("[]") or ExporterConfig.host, port=number)
+
+
+def _exporter_config(raw: dict[str, Any]) -> ExporterConfig:
+    listen = raw.get("listen")
+    if listen is None:
+        return ExporterConfig()
+    if isinstance(listen, int) and not isinstance(listen, bool):
+        listen = str(listen)
+    if not isinstance(listen, str):
+        raise ConfigError("Expected 'exporter.listen' to be 'host:port' or a port")
+    return parse_listen(listen)
+
+
+def _source_config(source: dict[str, Any]) -> LicenseSourceConfig:
+    return LicenseSourceConfig(
+        kind=source.get("kind", ""),
+        parser=source.get("parser", ""),
+        options=source.get("options", {}),
+        parser_options=source.get("parser_options", {}),
+        auth=source.get("auth", {}),
+        interval=_optional_positive(source.get("interval"), "sources.interval"),
+        jitter=_optional_non_negative(source.get("jitter"), "sources.jitter"),
+        name=_optional_str(source.get("name"), "sources.name"),
+    )
 
+
+def _notification_config(notification: dict[str, Any]) -> NotificationConfig:
+    return NotificationConfig(
+        kind=notification.get("kind", ""),
+        options=notification.get("options", {}),
+    )
+
+
+def _app_config(
+    raw: dict[str, Any],
+    sources: list[LicenseSourceConfig],
+    notifications: list[NotificationConfig],
+) -> AppConfig:
+    http_raw = _require_table(raw.get("http", {}), "http")
+    daemon_raw = _require_table(raw.get("daemon", {}), "daemon")
+    state_raw = _require_table(raw.get("state", {}), "state")
+    delivery_raw = _require_table(raw.get("delivery", {}), "delivery")
+    retry_raw = _require_table(raw.get("retry", {}), "retry")
+    exporter_raw = _require_table(raw.get("exporter", {}), "exporter")
     return AppConfig(
         sources=sources,
         notifications=notifications,
         default_timezone=raw.get("default_timezone", "UTC"),
+        workers=_positive_int(raw.get("workers", 1), "workers"),
+        parse_processes=_non_negative_int(
+            raw.get("parse_processes", 0), "parse_processes"
+        ),
+        source_timeout=_optional_positive(raw.get("source_timeout"), "source_timeout"),
+        run_timeout=_optional_positive(raw.get("run_timeout"), "run_timeout"),
+        http=_http_config(http_raw),
+        daemon=_daemon_config(daemon_raw),
+        state=_state_config(state_raw),
+        delivery=_delivery_config(delivery_raw),
+        retry=_retry_config(retry_raw),
+        exporter=_exporter_config(exporter_raw),
     )
+
+
+@dataclass(frozen=True)
+class _ConfigFile:
+    """One parsed config file and the file state it was parsed from."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    digest: bytes
+    raw: dict[str, Any]
+    sources: list[LicenseSourceConfig]
+    notifications: list[NotificationConfig]
+
+
+class ConfigLoader:
+    """Load a config file together with the files it includes.
+
+    Every file is parsed once and kept until its modification time or size
+    changes; a file that was rewritten with the same content is not parsed
+    again, and its sources and notifications are returned as the same
+    objects as before.
+    """
+
+    def __init__(self) -> None:
+        self._path: Path | None = None
+        self._files: dict[Path, _ConfigFile] = {}
+        self._loaded: list[tuple[Path, bytes]] = []
+        self._last_error: str | None = None
+
+    def load(self, path: str | Path) -> AppConfig:
+        self._path = Path(path)
+        files = self._read_all(self._path)
+        self._loaded = [(file.path, file.digest) for file in files]
+        return self._assemble(files)
+
+    def reload(self) -> AppConfig | None:
+        """Return the config if any of its files changed, else ``None``.
+
+        Unchanged files only cost a ``stat``. An error is raised once per
+        broken state of the files rather than on every call.
+        """
+        if self._path is None:
+            raise RuntimeError("reload() called before load()")
+        try:
+            files = self._read_all(self._path)
+        except ConfigError as exc:
+            if str(exc) == self._last_error:
+                return None
+            self._last_error = str(exc)
+            raise
+        self._last_error = None
+        loaded = [(file.path, file.digest) for file in files]
+        if loaded == self._loaded:
+            return None
+        self._loaded = loaded
+        return self._assemble(files)
+
+    def _read_all(self, path: Path) -> list[_ConfigFile]:
+        if not path.exists():
+            raise ConfigError(f"Config file not found: {path}")
+        main = self._read(path.resolve(), fragment=False)
+        files = [main]
+        for included in self._included(main):
+            files.append(self._read(included, fragment=True))
+        # Forget files that are no longer part of the config.
+        self._files = {file.path: file for file in files}
+        return files
+
+    @staticmethod
+    def _included(main: _ConfigFile) -> list[Path]:
+        patterns = main.raw.get("include", [])
+        if not isinstance(patterns, list) or not all(
+            isinstance(pattern, str) and pattern for pattern in patterns
+        ):
+            raise ConfigError("Expected 'include' to be a list of file patterns")
+        paths: dict[Path, None] = {}
+        for pattern in patterns:
+            full = str(main.path.parent / pattern)
+            matches = sorted(glob.glob(full, recursive=True))
+            if not matches and not any(char in pattern for char in "*?["):
+                raise ConfigError(f"Included config file not found: {full}")
+            for match in matches:
+                included = Path(match).resolve()
+                if included != main.path:
+                    paths.setdefault(included)
+        return list(paths)
+
+    def _read(self, path: Path, *, fragment: bool) -> _ConfigFile:
+        try:
+            stat = path.stat()
+            cached = self._files.get(path)
+            if cached is not None and (cached.mtime_ns, cached.size) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                return cached
+            data = path.read_bytes()
+        except OSError as exc:
+            raise ConfigError(f"Cannot read config file {path}: {exc}") from exc
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if cached is not None and cached.digest == digest:
+            parsed = dataclasses.replace(
+                cached, mtime_ns=stat.st_mtime_ns, size=stat.st_size
+            )
+        else:
+            parsed = self._parse(path, data, fragment=fragment)
+            parsed = dataclasses.replace(
+                parsed, mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=digest
+            )
+        self._files[path] = parsed
+        return parsed
+
+    @staticmethod
+    def _parse(path: Path, data: bytes, *, fragment: bool) -> _ConfigFile:
+        try:
+            raw = tomllib.loads(data.decode("utf-8"))
+        except (UnicodeDecodeError, tomllib.TOMLDecodeError) as exc:
+            raise ConfigError(f"Invalid config file {path}: {exc}") from exc
+        if fragment:
+            unexpected = sorted(raw.keys() - _FRAGMENT_KEYS)
+            if unexpected:
+                raise ConfigError(
+                    f"{path}: included files may only set 'sources' and "
+                    f"'notifications', not {', '.join(map(repr, unexpected))}"
+                )
+        try:
+            sources = [
+                _source_config(source)
+                for source in _require_list(raw.get("sources", []), "sources")
+            ]
+            notifications = [
+                _notification_config(notification)
+                for notification in _require_list(
+                    raw.get("notifications", []), "notifications"
+                )
+            ]
+        except ConfigError as exc:
+            if not fragment:
+                raise
+            raise ConfigError(f"{path}: {exc}") from exc
+        return _ConfigFile(
+            path=path,
+            mtime_ns=0,
+            size=0,
+            digest=b"",
+            raw=raw,
+            sources=sources,
+            notifications=notifications,
+        )
+
+    @staticmethod
+    def _assemble(files: list[_ConfigFile]) -> AppConfig:
+        return _app_config(
+            files[0].raw,
+            [source for file in files for source in file.sources],
+            [notification for file in files for notification in file.notifications],
+        )
+
+
+def load_config(path: str | Path) -> AppConfig:
+    return ConfigLoader().load(path)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -11,6 +13,28 @@ class LicenseSourceConfig:
     options: dict[str, Any] = field(default_factory=dict)
     parser_options: dict[str, Any] = field(default_factory=dict)
     auth: dict[str, Any] = field(default_factory=dict)
+    interval: float | None = None
+    jitter: float | None = None
+    name: str | None = None
+
+    def fingerprint(self) -> str:
+        """Stable identity of the source used to key persisted state."""
+        material = json.dumps(
+            [self.kind, self.parser, self.options, self.parser_options],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def label(self) -> str:
+        """Human-readable name of the source for metrics and reports."""
+        if self.name:
+            return self.name
+        for key in ("system", "url", "path", "host"):
+            value = self.options.get(key)
+            if value:
+                return str(value)
+        return self.kind
 
 
 @dataclass(frozen=True)
@@ -19,8 +43,77 @@ class NotificationConfig:
     options: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class HostLimitConfig:
+    rate: float | None = None
+    burst: int | None = None
+    max_in_flight: int | None = None
+    max_retries: int = 2
+    max_retry_after: float = 60.0
+
+
+@dataclass(frozen=True)
+class HttpConfig:
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    pool_size: int = 4
+    cache_dir: str | None = None
+    cache_max_bytes: int = 64 * 1024 * 1024
+    limits: dict[str, HostLimitConfig] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class DaemonConfig:
+    interval: float = 600.0
+    jitter: float = 0.0
+    reload_interval: float | None = 30.0
+
+
+@dataclass(frozen=True)
+class StateConfig:
+    path: str | None = None
+    window_days: int = 30
+
+
+@dataclass(frozen=True)
+class DeliveryConfig:
+    max_parallel: int = 4
+    max_attempts: int = 3
+    backoff: float = 1.0
+    max_backoff: float = 30.0
+    timeout: float | None = None
+    critical_days: int | None = None
+
+
+@dataclass(frozen=True)
+class RetryConfig:
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 10.0
+    retry_statuses: frozenset[int] = frozenset({502, 503, 504})
+    hedge_percentile: float | None = None
+    breaker_threshold: int = 5
+    breaker_cooldown: float = 30.0
+
+
+@dataclass(frozen=True)
+class ExporterConfig:
+    host: str = "0.0.0.0"
+    port: int | None = None
+
+
 @dataclass(frozen=True)
 class AppConfig:
     sources: list[LicenseSourceConfig]
     notifications: list[NotificationConfig]
     default_timezone: str = "UTC"
+    workers: int = 1
+    parse_processes: int = 0
+    source_timeout: float | None = None
+    run_timeout: float | None = None
+    http: HttpConfig = field(default_factory=HttpConfig)
+    daemon: DaemonConfig = field(default_factory=DaemonConfig)
+    state: StateConfig = field(default_factory=StateConfig)
+    delivery: DeliveryConfig = field(default_factory=DeliveryConfig)
+    retry: RetryConfig = field(default_factory=RetryConfig)
+    exporter: ExporterConfig = field(default_factory=ExporterConfig)
@@ -12,3 +12,29 @@ class ParserError(LicenscopeError):
 
 class SourceError(LicenscopeError):
     """Raised when loading a source fails."""
+
+
+class HttpError(SourceError):
+    """Raised when an HTTP request returns an error status."""
+
+    def __init__(self, message: str, *, status: int, headers: dict[str, str]) -> None:
+        super().__init__(message)
+        self.status = status
+        self.headers = headers
+
+
+class NotificationError(LicenscopeError):
+    """Raised when a notification could not be delivered."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status: int | None = None,
+        retryable: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+        self.retry_after = retry_after
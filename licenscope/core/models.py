@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECONDS_PER_DAY = 86_400 * 1_000_000
 
-@dataclass(frozen=True)
+
+def _epoch_microseconds(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+@dataclass(frozen=True, slots=True)
 class LicenseRecord:
     system: str
     expires_at: datetime
@@ -19,9 +28,71 @@ class LicenseRecord:
 
     @property
     def is_expired(self) -> bool:
-        return self.expires_at <= datetime.now(timezone.utc)
+        return self.is_expired_at(datetime.now(timezone.utc))
 
     @property
     def days_left(self) -> int:
-        delta = self.expires_at - datetime.now(timezone.utc)
-        return max(0, delta.days)
+        return self.days_left_at(datetime.now(timezone.utc))
+
+    def is_expired_at(self, now: datetime) -> bool:
+        return self.expires_at <= now
+
+    def days_left_at(self, now: datetime) -> int:
+        return max(0, (self.expires_at - now).days)
+
+
+class RecordBatch:
+    """Records evaluated together against one captured ``now``.
+
+    Expiry times are kept in an ``array('q')`` of epoch microseconds so
+    ``is_expired``/``days_left`` for the whole batch are integer comparisons
+    rather than per-record datetime arithmetic, and every record in the
+    batch is judged against the same instant.
+    """
+
+    __slots__ = ("_records", "_expires", "_now", "_now_us")
+
+    def __init__(
+        self, records: Iterable[LicenseRecord], *, now: datetime | None = None
+    ) -> None:
+        self._records = list(records)
+        self._expires = array(
+            "q", [_epoch_microseconds(record.expires_at) for record in self._records]
+        )
+        self._now = now or datetime.now(timezone.utc)
+        self._now_us = _epoch_microseconds(self._now)
+
+    @property
+    def now(self) -> datetime:
+        return self._now
+
+    @property
+    def records(self) -> list[LicenseRecord]:
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[LicenseRecord]:
+        return iter(self._records)
+
+    def __getitem__(self, index: int) -> LicenseRecord:
+        return self._records[index]
+
+    def is_expired(self) -> list[bool]:
+        now_us = self._now_us
+        return [expires <= now_us for expires in self._expires]
+
+    def days_left(self) -> array[int]:
+        now_us = self._now_us
+        return array(
+            "q",
+            [
+                max(0, (expires - now_us) // _MICROSECONDS_PER_DAY)
+                for expires in self._expires
+            ],
+        )
+
+    def expired_count(self) -> int:
+        now_us = self._now_us
+        return sum(1 for expires in self._expires if expires <= now_us)
@@ -1,12 +1,13 @@
-from licenscope.notifications.opsgenie import OpsgenieNotifier
-from licenscope.notifications.pagerduty import PagerDutyNotifier
 from licenscope.notifications.registry import NotificationRegistry
-from licenscope.notifications.slack import SlackNotifier
 
 
 def build_registry() -> NotificationRegistry:
     registry = NotificationRegistry()
-    registry.register(SlackNotifier)
-    registry.register(OpsgenieNotifier)
-    registry.register(PagerDutyNotifier)
+    registry.register_lazy("slack", "licenscope.notifications.slack:SlackNotifier")
+    registry.register_lazy(
+        "opsgenie", "licenscope.notifications.opsgenie:OpsgenieNotifier"
+    )
+    registry.register_lazy(
+        "pagerduty", "licenscope.notifications.pagerduty:PagerDutyNotifier"
+    )
     return registry
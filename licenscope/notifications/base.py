@@ -8,7 +8,17 @@ from licenscope.core.models import LicenseRecord
 
 class Notifier(ABC):
     name: str
+    # Largest number of records a single ``send`` call accepts; the
+    # dispatcher splits larger deliveries into chunks. ``None`` means no limit.
+    max_batch_size: int | None = None
 
     @abstractmethod
     def send(self, records: list[LicenseRecord], *, context: dict[str, Any]) -> None:
-        """Send notifications for license records."""
+        """Send notifications for license records.
+
+        Raise ``NotificationError`` with ``retryable=True`` for transient
+        failures so the dispatcher can retry the chunk.
+        """
+
+    def close(self) -> None:
+        """Release connections held between sends."""
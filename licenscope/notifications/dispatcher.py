@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from licenscope.core.errors import NotificationError
+from licenscope.core.models import LicenseRecord
+from licenscope.notifications.base import Notifier
+from licenscope.util.logging import get_logger
+from licenscope.util.ratelimit import parse_retry_after
+
+
+# Fan-out threads only wait on their chunks; they start on demand.
+_FANOUT_WORKERS = 32
+
+
+@dataclass(frozen=True)
+class DeliveryTarget:
+    """Records and context to send to one notifier."""
+
+    kind: str
+    notifier: Notifier
+    records: list[LicenseRecord]
+    context: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class DeliveryReport:
+    kind: str
+    records: int
+    chunks: int
+    failed_chunks: int
+    attempts: int
+    latency: float
+    timed_out: bool = False
+
+    @property
+    def delivered(self) -> bool:
+        return self.failed_chunks == 0 and not self.timed_out
+
+
+def error_for_status(
+    kind: str, status: int, headers: Mapping[str, str], body: str
+) -> NotificationError:
+    """Build the error for a failed HTTP delivery, marking 429/5xx retryable."""
+    retry_after = None
+    for name, value in headers.items():
+        if name.lower() == "retry-after":
+            retry_after = parse_retry_after(value)
+            break
+    return NotificationError(
+        f"{kind} notification failed with HTTP {status}: {body[:200]}",
+        status=status,
+        retryable=status == 429 or status >= 500,
+        retry_after=retry_after,
+    )
+
+
+class NotificationDispatcher:
+    """Deliver records to a notifier in size-limited chunks.
+
+    Records are split by the notifier's ``max_batch_size`` and the chunks are
+    sent concurrently, at most ``max_parallel`` at a time across all
+    deliveries. A chunk that fails with a retryable ``NotificationError`` or
+    a connection error is retried up to ``max_attempts`` times with
+    exponential backoff and jitter; a ``Retry-After`` from the server takes
+    precedence over the computed delay. Delays are capped at ``max_backoff``.
+
+    A dispatcher is meant to be long-lived: its thread pools are shared by
+    every delivery until ``close``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_parallel: int = 4,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._max_attempts = max(1, max_attempts)
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._sleep = sleep
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_parallel),
+            thread_name_prefix="licenscope-notify",
+        )
+        self._fanout = ThreadPoolExecutor(
+            max_workers=_FANOUT_WORKERS, thread_name_prefix="licenscope-fanout"
+        )
+        self._logger = get_logger(self.__class__.__name__)
+
+    def deliver(
+        self,
+        kind: str,
+        notifier: Notifier,
+        records: list[LicenseRecord],
+        *,
+        context: dict[str, Any],
+    ) -> DeliveryReport:
+        started = time.perf_counter()
+        size = notifier.max_batch_size or len(records) or 1
+        chunks = [records[i : i + size] for i in range(0, len(records), size)] or [[]]
+        attempts = 0
+        failed = 0
+        lock = threading.Lock()
+
+        def send(index: int, chunk: list[LicenseRecord]) -> None:
+            nonlocal attempts
+            for attempt in range(1, self._max_attempts + 1):
+                with lock:
+                    attempts += 1
+                try:
+                    notifier.send(chunk, context=context)
+                    return
+                except NotificationError as exc:
+                    if not exc.retryable or attempt == self._max_attempts:
+                        raise
+                    delay = exc.retry_after
+                    error: Exception = exc
+                except OSError as exc:
+                    if attempt == self._max_attempts:
+                        raise
+                    delay = None
+                    error = exc
+                if delay is None:
+                    delay = random.uniform(0.0, self._backoff * 2 ** (attempt - 1))
+                delay = min(delay, self._max_backoff)
+                self._logger.warning(
+                    "Retrying notification kind={} chunk={}/{} in {:.1f}s: {}",
+                    kind,
+                    index + 1,
+                    len(chunks),
+                    delay,
+                    error,
+                )
+                self._sleep(delay)
+
+        futures = [
+            self._executor.submit(send, index, chunk)
+            for index, chunk in enumerate(chunks)
+        ]
+        for index, future in enumerate(futures):
+            try:
+                future.result()
+            except Exception as exc:
+                failed += 1
+                self._logger.error(
+                    "Failed notification kind={} chunk={}/{}: {}",
+                    kind,
+                    index + 1,
+                    len(chunks),
+                    exc,
+                )
+        return DeliveryReport(
+            kind=kind,
+            records=len(records),
+            chunks=len(chunks),
+            failed_chunks=failed,
+            attempts=attempts,
+            latency=time.perf_counter() - started,
+        )
+
+    def deliver_all(
+        self,
+        targets: list[DeliveryTarget],
+        *,
+        timeout: float | None = None,
+    ) -> list[DeliveryReport]:
+        """Deliver to every target in parallel, waiting at most ``timeout``.
+
+        Reports are returned in ``targets`` order. A notifier still sending
+        when the timeout expires is reported as timed out; its remaining
+        chunks keep running in the background and their outcome is ignored.
+        """
+        if not targets:
+            return []
+        started = time.perf_counter()
+        futures = [
+            self._fanout.submit(
+                self.deliver,
+                target.kind,
+                target.notifier,
+                target.records,
+                context=target.context,
+            )
+            for target in targets
+        ]
+        done, _ = wait(futures, timeout=timeout)
+        reports = []
+        for target, future in zip(targets, futures):
+            if future in done:
+                reports.append(future.result())
+            else:
+                future.cancel()
+                reports.append(
+                    DeliveryReport(
+                        kind=target.kind,
+                        records=len(target.records),
+                        chunks=0,
+                        failed_chunks=0,
+                        attempts=0,
+                        latency=time.perf_counter() - started,
+                        timed_out=True,
+                    )
+                )
+        return reports
+
+    def close(self) -> None:
+        self._fanout.shutdown(wait=False, cancel_futures=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
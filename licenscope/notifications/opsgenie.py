@@ -4,19 +4,55 @@ from typing import Any
 
 from licenscope.core.models import LicenseRecord
 from licenscope.notifications.base import Notifier
+from licenscope.notifications.webhook import (
+    JsonWebhook,
+    alert_details,
+    alert_key,
+    alert_now,
+    alert_summary,
+)
 from licenscope.util.logging import get_logger
 
+# Opsgenie truncates longer alert messages.
+_MAX_MESSAGE = 130
+
 
 class OpsgenieNotifier(Notifier):
+    """Create one Opsgenie alert per record through the Alert API.
+
+    Alerts are aliased by system and expiry, so a resent record updates the
+    open alert instead of opening another one. Expired licenses are raised
+    as ``P2``, the others as ``P3``.
+    """
+
     name = "opsgenie"
+    # One alert per request; chunks of one let the dispatcher retry each.
+    max_batch_size = 1
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, api_url: str = "https://api.opsgenie.com") -> None:
         self._api_key = api_key
+        self._alerts_url = f"{api_url.rstrip('/')}/v2/alerts"
+        self._webhook = JsonWebhook(self.name)
         self._logger = get_logger(self.__class__.__name__)
 
     def send(self, records: list[LicenseRecord], *, context: dict[str, Any]) -> None:
-        self._logger.info(
-            "Opsgenie would notify records={} api_key_prefix={}",
-            len(records),
-            self._api_key[:4],
-        )
+        now = alert_now(context)
+        for record in records:
+            summary = alert_summary(record, now)
+            self._webhook.post(
+                self._alerts_url,
+                {
+                    "message": summary[:_MAX_MESSAGE],
+                    "alias": alert_key(record),
+                    "description": summary,
+                    "priority": "P2" if record.is_expired_at(now) else "P3",
+                    "source": "licenscope",
+                    "tags": ["licenscope"],
+                    "details": alert_details(record, context),
+                },
+                headers={"Authorization": f"GenieKey {self._api_key}"},
+            )
+        self._logger.info("Opsgenie alerts created records={}", len(records))
+
+    def close(self) -> None:
+        self._webhook.close()
@@ -4,19 +4,58 @@ from typing import Any
 
 from licenscope.core.models import LicenseRecord
 from licenscope.notifications.base import Notifier
+from licenscope.notifications.webhook import (
+    JsonWebhook,
+    alert_details,
+    alert_key,
+    alert_now,
+    alert_summary,
+)
 from licenscope.util.logging import get_logger
 
 
 class PagerDutyNotifier(Notifier):
+    """Trigger one PagerDuty event per record through the Events API v2.
+
+    Events are deduplicated by system and expiry, so a resent record updates
+    the open incident instead of opening another one. Expired licenses are
+    ``critical``, the others ``warning``.
+    """
+
     name = "pagerduty"
+    # One event per request; chunks of one let the dispatcher retry each.
+    max_batch_size = 1
 
-    def __init__(self, routing_key: str) -> None:
+    def __init__(
+        self,
+        routing_key: str,
+        events_url: str = "https://events.pagerduty.com/v2/enqueue",
+    ) -> None:
         self._routing_key = routing_key
+        self._events_url = events_url
+        self._webhook = JsonWebhook(self.name)
         self._logger = get_logger(self.__class__.__name__)
 
     def send(self, records: list[LicenseRecord], *, context: dict[str, Any]) -> None:
-        self._logger.info(
-            "PagerDuty would notify records={} routing_key_prefix={}",
-            len(records),
-            self._routing_key[:4],
-        )
+        now = alert_now(context)
+        for record in records:
+            self._webhook.post(
+                self._events_url,
+                {
+                    "routing_key": self._routing_key,
+                    "event_action": "trigger",
+                    "dedup_key": alert_key(record),
+                    "payload": {
+                        "summary": alert_summary(record, now),
+                        "source": "licenscope",
+                        "severity": (
+                            "critical" if record.is_expired_at(now) else "warning"
+                        ),
+                        "custom_details": alert_details(record, context),
+                    },
+                },
+            )
+        self._logger.info("PagerDuty events triggered records={}", len(records))
+
+    def close(self) -> None:
+        self._webhook.close()
@@ -4,19 +4,26 @@ from typing import Type
 
 from licenscope.core.errors import ConfigError
 from licenscope.notifications.base import Notifier
+from licenscope.util.plugins import resolve_plugin
+
+ENTRY_POINT_GROUP = "licenscope.notifications"
 
 
 class NotificationRegistry:
     def __init__(self) -> None:
-        self._notifiers: dict[str, Type[Notifier]] = {}
+        self._notifiers: dict[str, Type[Notifier] | str] = {}
 
     def register(self, notifier_cls: Type[Notifier]) -> None:
         if not getattr(notifier_cls, "name", ""):
             raise ConfigError("Notifier is missing a name")
         self._notifiers[notifier_cls.name] = notifier_cls
 
+    def register_lazy(self, name: str, reference: str) -> None:
+        """Register a ``module:attribute`` reference imported on first use."""
+        self._notifiers[name] = reference
+
     def create(self, name: str, **kwargs) -> Notifier:
-        notifier_cls = self._notifiers.get(name)
+        notifier_cls = resolve_plugin(self._notifiers, name, ENTRY_POINT_GROUP)
         if notifier_cls is None:
             raise ConfigError(f"Unknown notifier: {name}")
         return notifier_cls(**kwargs)
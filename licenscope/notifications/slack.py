@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import Any
 
+from licenscope.core.errors import NotificationError
 from licenscope.core.models import LicenseRecord
 from licenscope.notifications.base import Notifier
+from licenscope.notifications.dispatcher import error_for_status
 from licenscope.util.logging import get_logger
 
 from slack_sdk.webhook import WebhookClient
@@ -11,9 +13,13 @@ from slack_sdk.webhook import WebhookClient
 
 class SlackNotifier(Notifier):
     name = "slack"
+    # Slack rejects messages with more than 50 blocks.
+    max_batch_size = 50
 
     def __init__(self, webhook_url: str) -> None:
         self._webhook_url = webhook_url
+        # Retries are handled by the dispatcher, not by slack_sdk.
+        self._webhook = WebhookClient(webhook_url, timeout=10, retry_handlers=[])
         self._logger = get_logger(self.__class__.__name__)
 
     def send(self, records: list[LicenseRecord], *, context: dict[str, Any]) -> None:
@@ -35,13 +41,18 @@ class SlackNotifier(Notifier):
                 }
             )
 
-        webhook = WebhookClient(self._webhook_url, timeout=10)
-        response = webhook.send(
+        response = self._webhook.send(
             text=message,
             blocks=blocks,
         )
-        assert response.status_code == 200
-        assert response.body == "ok"
+        if response.status_code != 200:
+            raise error_for_status(
+                self.name, response.status_code, response.headers, response.body
+            )
+        if response.body != "ok":
+            raise NotificationError(
+                f"Unexpected Slack response body: {response.body[:200]}"
+            )
         self._logger.info(
             "Slack notification delivered status={}", response.status_code
         )
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Any
+from urllib.request import Request
+
+from licenscope.core.errors import HttpError, NotificationError, SourceError
+from licenscope.core.models import LicenseRecord
+from licenscope.notifications.dispatcher import error_for_status
+from licenscope.util.http import HttpClient
+
+
+class JsonWebhook:
+    """POST JSON events to an alerting API over a kept-alive ``HttpClient``.
+
+    HTTP errors become ``NotificationError``, retryable for 429 and 5xx like
+    every other notifier; connection failures are always retryable. Retries
+    themselves are left to the dispatcher.
+    """
+
+    def __init__(self, kind: str, *, timeout: float = 10.0) -> None:
+        self._kind = kind
+        self._client = HttpClient(connect_timeout=timeout, read_timeout=timeout)
+
+    def post(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        *,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        request = Request(
+            url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json", **(headers or {})},
+            method="POST",
+        )
+        try:
+            self._client.fetch_response(request, use_cache=False)
+        except HttpError as exc:
+            raise error_for_status(
+                self._kind, exc.status, exc.headers, str(exc)
+            ) from exc
+        except SourceError as exc:
+            raise NotificationError(
+                f"{self._kind} notification failed: {exc}", retryable=True
+            ) from exc
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def alert_now(context: dict[str, Any]) -> datetime:
+    """The run's evaluation time, as passed to notifiers in ``context``."""
+    return context.get("now") or datetime.now(timezone.utc)
+
+
+def alert_key(record: LicenseRecord) -> str:
+    """Stable id of a record's alert, so a resent alert updates the first."""
+    return f"licenscope:{record.system}:{record.expires_at.isoformat()}"
+
+
+def alert_summary(record: LicenseRecord, now: datetime) -> str:
+    expires = record.expires_at.isoformat()
+    if record.is_expired_at(now):
+        return f"License for {record.system} expired on {expires}"
+    days = record.days_left_at(now)
+    return f"License for {record.system} expires on {expires} ({days} days left)"
+
+
+def alert_details(record: LicenseRecord, context: dict[str, Any]) -> dict[str, str]:
+    now = alert_now(context)
+    details = {
+        "system": record.system,
+        "expires_at": record.expires_at.isoformat(),
+        "days_left": str(record.days_left_at(now)),
+    }
+    for change in context.get("changes") or ():
+        if change.record is record:
+            details["change"] = change.reason
+            break
+    return details
@@ -1,12 +1,9 @@
-from licenscope.parsers.jinja_parser import JinjaParser
-from licenscope.parsers.json_parser import JsonParser
-from licenscope.parsers.regex_parser import RegexParser
 from licenscope.parsers.registry import ParserRegistry
 
 
 def build_registry() -> ParserRegistry:
     registry = ParserRegistry()
-    registry.register(JinjaParser)
-    registry.register(JsonParser)
-    registry.register(RegexParser)
+    registry.register_lazy("jinja", "licenscope.parsers.jinja_parser:JinjaParser")
+    registry.register_lazy("json", "licenscope.parsers.json_parser:JsonParser")
+    registry.register_lazy("regex", "licenscope.parsers.regex_parser:RegexParser")
     return registry
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, BinaryIO
 
 from licenscope.core.models import LicenseRecord
 
 
 class Parser(ABC):
     name: str
+    streaming = False
 
     @abstractmethod
     def parse(self, payload: str, *, context: dict[str, Any]) -> list[LicenseRecord]:
         """Parse payload text into license records."""
+
+    def parse_stream(
+        self, stream: BinaryIO, *, context: dict[str, Any]
+    ) -> list[LicenseRecord]:
+        """Parse a payload byte stream; used when ``streaming`` is enabled."""
+        return self.parse(stream.read().decode("utf-8"), context=context)
+
+    @property
+    def format_stats(self) -> dict[str, int]:
+        """Count of values resolved by each datetime format."""
+        return {}
@@ -1,12 +1,60 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import threading
 from typing import Any
 
 from licenscope.core.errors import ParserError
 from licenscope.core.models import LicenseRecord
 from licenscope.parsers.base import Parser
-from licenscope.util.datetime import parse_datetime
+from licenscope.util.datetime import DateTimeParser
+
+_TEMPLATE_CACHE_SIZE = 512
+
+
+class _TemplateCache:
+    """Process-wide Jinja environment that compiles each template source once.
+
+    Templates are registered under the SHA-256 of their source and loaded
+    through the environment's loader, so compiled templates live in Jinja's
+    own LRU cache and, when a bytecode cache directory is configured, are
+    persisted to disk and reused by later CLI invocations.
+    """
+
+    def __init__(self, bytecode_cache_dir: str | None) -> None:
+        from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache
+
+        sources: dict[str, str] = {}
+
+        class _SourceLoader(BaseLoader):
+            def get_source(self, environment, template):
+                return sources[template], None, lambda: True
+
+        self._sources = sources
+        self._lock = threading.Lock()
+        self._env = Environment(
+            autoescape=False,
+            loader=_SourceLoader(),
+            cache_size=_TEMPLATE_CACHE_SIZE,
+            bytecode_cache=(
+                FileSystemBytecodeCache(bytecode_cache_dir)
+                if bytecode_cache_dir
+                else None
+            ),
+        )
+
+    def get(self, source: str):
+        name = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._sources.setdefault(name, source)
+        return self._env.get_template(name)
+
+
+@functools.cache
+def _template_cache(bytecode_cache_dir: str | None) -> _TemplateCache:
+    return _TemplateCache(bytecode_cache_dir)
 
 
 class JinjaParser(Parser):
@@ -17,20 +65,27 @@ class JinjaParser(Parser):
         template: str,
         date_formats: list[str] | None = None,
         timestamp_unit: str = "auto",
+        bytecode_cache_dir: str | None = None,
     ) -> None:
         self._template = template
-        self._date_formats = date_formats
-        self._timestamp_unit = timestamp_unit
+        self._datetimes = DateTimeParser(
+            formats=date_formats, timestamp_unit=timestamp_unit
+        )
+        self._bytecode_cache_dir = bytecode_cache_dir
+        self._compiled = None
 
-    def parse(self, payload: str, *, context: dict[str, Any]) -> list[LicenseRecord]:
-        try:
-            from jinja2 import Environment
-        except ImportError as exc:
-            raise ParserError("jinja2 is required for the jinja parser") from exc
+    @property
+    def format_stats(self) -> dict[str, int]:
+        return self._datetimes.format_stats
 
-        env = Environment(autoescape=False)
-        tmpl = env.from_string(self._template)
-        rendered = tmpl.render(payload=payload, **context)
+    def parse(self, payload: str, *, context: dict[str, Any]) -> list[LicenseRecord]:
+        if self._compiled is None:
+            try:
+                cache = _template_cache(self._bytecode_cache_dir)
+            except ImportError as exc:
+                raise ParserError("jinja2 is required for the jinja parser") from exc
+            self._compiled = cache.get(self._template)
+        rendered = self._compiled.render(payload=payload, **context)
         try:
             data = json.loads(rendered)
         except json.JSONDecodeError as exc:
@@ -44,11 +99,9 @@ class JinjaParser(Parser):
         records = []
         for item in data:
             try:
-                expires_at = parse_datetime(
+                expires_at = self._datetimes.parse(
                     item["expires_at"],
-                    formats=self._date_formats,
                     timezone_name=context.get("default_timezone", "UTC"),
-                    timestamp_unit=self._timestamp_unit,
                 )
             except (KeyError, ValueError) as exc:
                 raise ParserError("Missing or invalid expires_at field") from exc
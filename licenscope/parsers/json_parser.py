@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, BinaryIO
 
 from licenscope.core.errors import ParserError
 from licenscope.core.models import LicenseRecord
 from licenscope.parsers.base import Parser
+from licenscope.util.datetime import ISO_LABEL, TIMESTAMP_LABEL, FormatLearner
+from licenscope.util.json_stream import iter_json_path
 
 
 _ORDINAL_RE = re.compile(r"(\d+)(st|nd|rd|th)", re.IGNORECASE)
@@ -31,7 +34,7 @@ def _resolve_path(payload: Any, key: str) -> Any:
 
 
 def _parse_datetime(
-    value: Any, date_formats: list[str], timestamp_unit: str
+    value: Any, date_formats: FormatLearner, timestamp_unit: str
 ) -> datetime:
     if isinstance(value, (int, float)):
         if timestamp_unit == "milliseconds":
@@ -40,21 +43,27 @@ def _parse_datetime(
             seconds = float(value)
         else:
             seconds = float(value) / 1000.0 if float(value) > 10**11 else float(value)
+        date_formats.resolved(TIMESTAMP_LABEL)
         return datetime.fromtimestamp(seconds, tz=timezone.utc)
 
     if not isinstance(value, str):
         raise ParserError("expires_at must be a string or timestamp")
 
     cleaned = _strip_ordinals(value)
-    if date_formats:
-        for fmt in date_formats:
+    if date_formats.formats:
+        preferred = date_formats.preferred
+        candidates = date_formats.formats
+        if preferred is not None:
+            candidates = (preferred, *(f for f in candidates if f != preferred))
+        for fmt in candidates:
             try:
                 parsed = datetime.strptime(cleaned, fmt)
-                if parsed.tzinfo is None:
-                    return parsed.replace(tzinfo=timezone.utc)
-                return parsed
             except ValueError:
                 continue
+            date_formats.resolved(fmt)
+            if parsed.tzinfo is None:
+                return parsed.replace(tzinfo=timezone.utc)
+            return parsed
         raise ParserError("No matching date format")
 
     try:
@@ -63,6 +72,7 @@ def _parse_datetime(
         raise ParserError(
             "expires_at must be ISO format or match date_formats"
         ) from exc
+    date_formats.resolved(ISO_LABEL)
 
     if parsed.tzinfo is None:
         parsed = parsed.replace(tzinfo=timezone.utc)
@@ -77,10 +87,16 @@ class JsonParser(Parser):
         key: str,
         date_formats: list[str] | None = None,
         timestamp_unit: str = "auto",
+        stream: bool = False,
     ) -> None:
         self._key = key
-        self._date_formats = date_formats or []
+        self._date_formats = FormatLearner(date_formats or [])
         self._timestamp_unit = timestamp_unit
+        self.streaming = stream
+
+    @property
+    def format_stats(self) -> dict[str, int]:
+        return self._date_formats.counts
 
     def parse(self, payload: str, *, context: dict[str, Any]) -> list[LicenseRecord]:
         try:
@@ -90,7 +106,21 @@ class JsonParser(Parser):
 
         resolved = _resolve_path(data, self._key)
         items = resolved if isinstance(resolved, list) else [resolved]
+        return self._build_records(items, context)
+
+    def parse_stream(
+        self, stream: BinaryIO, *, context: dict[str, Any]
+    ) -> list[LicenseRecord]:
+        try:
+            return self._build_records(iter_json_path(stream, self._key), context)
+        except LookupError as exc:
+            raise ParserError(f"Path not found in payload: {self._key}") from exc
+        except ValueError as exc:
+            raise ParserError("Payload is not valid JSON") from exc
 
+    def _build_records(
+        self, items: Iterable[Any], context: dict[str, Any]
+    ) -> list[LicenseRecord]:
         records: list[LicenseRecord] = []
         for item in items:
             if isinstance(item, dict):
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any
+
+from licenscope.core.errors import ParserError
+from licenscope.core.models import LicenseRecord
+from licenscope.parsers.base import Parser
+from licenscope.parsers.registry import ParserRegistry
+
+# Rows travel between processes as plain tuples; pickling a tuple of
+# builtins is much cheaper than pickling dataclass instances.
+_Row = tuple[str, datetime, dict[str, Any]]
+
+_worker_registry: ParserRegistry | None = None
+_worker_parsers: dict[str, Parser] = {}
+
+
+class ParsePool:
+    """Parse payloads on a pool of worker processes.
+
+    Only the parser name, its options, the payload text and the parser
+    context are sent to a worker. Each worker builds a parser through the
+    registry the first time it sees a given name and option set and reuses
+    it afterwards, so template compilation and learned date formats are paid
+    once per worker rather than once per payload.
+    """
+
+    def __init__(self, registry: ParserRegistry, processes: int) -> None:
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(registry,),
+        )
+
+    def parse(
+        self,
+        name: str,
+        options: dict[str, Any],
+        payload: str,
+        *,
+        context: dict[str, Any],
+    ) -> list[LicenseRecord]:
+        rows = self._executor.submit(
+            _parse_in_worker, name, options, payload, context
+        ).result()
+        return [
+            LicenseRecord(system=system, expires_at=expires_at, meta=meta)
+            for system, expires_at, meta in rows
+        ]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _init_worker(registry: ParserRegistry) -> None:
+    global _worker_registry
+    _worker_registry = registry
+    _worker_parsers.clear()
+
+
+def _parse_in_worker(
+    name: str, options: dict[str, Any], payload: str, context: dict[str, Any]
+) -> list[_Row]:
+    if _worker_registry is None:
+        raise ParserError("Parse worker was started without a parser registry")
+    key = json.dumps([name, options], sort_keys=True, default=repr)
+    parser = _worker_parsers.get(key)
+    if parser is None:
+        parser = _worker_registry.create(name, **options)
+        _worker_parsers[key] = parser
+    records = parser.parse(payload, context=context)
+    return [(record.system, record.expires_at, record.meta) for record in records]
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, BinaryIO
 
 from licenscope.core.errors import ParserError
 from licenscope.core.models import LicenseRecord
 from licenscope.parsers.base import Parser
-from licenscope.util.datetime import parse_datetime
+from licenscope.util.datetime import DateTimeParser
+
+_CHUNK_SIZE = 1024 * 1024
+_DEFAULT_MAX_MATCH_BYTES = 64 * 1024
 
 
 class RegexParser(Parser):
@@ -18,38 +22,101 @@ class RegexParser(Parser):
         flags: int = 0,
         date_formats: list[str] | None = None,
         timestamp_unit: str = "auto",
+        stream: bool = False,
+        max_match_bytes: int = _DEFAULT_MAX_MATCH_BYTES,
+        encoding: str = "utf-8",
     ) -> None:
         if not pattern:
             raise ParserError("Regex pattern is required")
+        if max_match_bytes <= 0:
+            raise ParserError("max_match_bytes must be a positive integer")
         self._regex = re.compile(pattern, flags)
-        self._date_formats = date_formats
-        self._timestamp_unit = timestamp_unit
-
-    def parse(self, payload: str, *, context: dict[str, Any]) -> list[LicenseRecord]:
-        records = []
-        for match in self._regex.finditer(payload):
-            groupdict = match.groupdict()
-            expires_value = groupdict.get("expires_at")
-            if not expires_value:
-                raise ParserError("Regex must define an expires_at named group")
+        self._datetimes = DateTimeParser(
+            formats=date_formats, timestamp_unit=timestamp_unit
+        )
+        self._encoding = encoding
+        self._max_match_bytes = max_match_bytes
+        self.streaming = stream
+        if stream:
             try:
-                expires_at = parse_datetime(
-                    expires_value,
-                    formats=self._date_formats,
-                    timezone_name=context.get("default_timezone", "UTC"),
-                    timestamp_unit=self._timestamp_unit,
-                )
-            except ValueError as exc:
+                self._bytes_regex = re.compile(pattern.encode(encoding), flags)
+            except (re.error, ValueError) as exc:
                 raise ParserError(
-                    "expires_at must be a supported datetime format"
+                    f"Regex pattern cannot be used in stream mode: {exc}"
                 ) from exc
-            system = groupdict.get("system", context.get("system", "unknown"))
-            meta = {
-                key.removeprefix("meta_"): value
-                for key, value in groupdict.items()
-                if key.startswith("meta_")
+
+    @property
+    def format_stats(self) -> dict[str, int]:
+        return self._datetimes.format_stats
+
+    def parse(self, payload: str, *, context: dict[str, Any]) -> list[LicenseRecord]:
+        return [
+            self._build_record(match.groupdict(), context)
+            for match in self._regex.finditer(payload)
+        ]
+
+    def parse_stream(
+        self, stream: BinaryIO, *, context: dict[str, Any]
+    ) -> list[LicenseRecord]:
+        records = []
+        for match in self._iter_stream_matches(stream):
+            groupdict = {
+                key: value.decode(self._encoding, errors="replace")
+                if value is not None
+                else None
+                for key, value in match.groupdict().items()
             }
-            records.append(
-                LicenseRecord(system=system, expires_at=expires_at, meta=meta)
-            )
+            records.append(self._build_record(groupdict, context))
         return records
+
+    def _iter_stream_matches(self, stream: BinaryIO) -> Iterator[re.Match[bytes]]:
+        """Yield bytes matches over ``stream`` in fixed-size chunks.
+
+        A match starting within ``max_match_bytes`` of the end of the buffer
+        may continue into the next chunk, so it is deferred until more data
+        is read. Up to ``max_match_bytes`` of already-scanned bytes are kept
+        ahead of the search position so anchors and lookbehinds still see
+        their context; matches longer than ``max_match_bytes`` can be missed
+        or truncated at a chunk boundary.
+        """
+        overlap = self._max_match_bytes
+        chunk_size = max(_CHUNK_SIZE, 2 * overlap)
+        buffer = b""
+        pos = 0
+        eof = False
+        while not eof:
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            cutoff = len(buffer) if eof else len(buffer) - overlap
+            for match in self._bytes_regex.finditer(buffer, pos):
+                if match.start() >= cutoff and not eof:
+                    break
+                yield match
+                # Mirror finditer: an empty match advances the search by one.
+                pos = match.end() if match.end() > match.start() else match.end() + 1
+            pos = max(pos, cutoff)
+            keep = max(0, pos - overlap)
+            buffer = buffer[keep:]
+            pos -= keep
+
+    def _build_record(
+        self, groupdict: dict[str, str | None], context: dict[str, Any]
+    ) -> LicenseRecord:
+        expires_value = groupdict.get("expires_at")
+        if not expires_value:
+            raise ParserError("Regex must define an expires_at named group")
+        try:
+            expires_at = self._datetimes.parse(
+                expires_value,
+                timezone_name=context.get("default_timezone", "UTC"),
+            )
+        except ValueError as exc:
+            raise ParserError("expires_at must be a supported datetime format") from exc
+        system = groupdict.get("system", context.get("system", "unknown"))
+        meta = {
+            key.removeprefix("meta_"): value
+            for key, value in groupdict.items()
+            if key.startswith("meta_")
+        }
+        return LicenseRecord(system=system, expires_at=expires_at, meta=meta)
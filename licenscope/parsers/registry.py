@@ -4,19 +4,26 @@ from typing import Type
 
 from licenscope.core.errors import ConfigError
 from licenscope.parsers.base import Parser
+from licenscope.util.plugins import resolve_plugin
+
+ENTRY_POINT_GROUP = "licenscope.parsers"
 
 
 class ParserRegistry:
     def __init__(self) -> None:
-        self._parsers: dict[str, Type[Parser]] = {}
+        self._parsers: dict[str, Type[Parser] | str] = {}
 
     def register(self, parser_cls: Type[Parser]) -> None:
         if not getattr(parser_cls, "name", ""):
             raise ConfigError("Parser is missing a name")
         self._parsers[parser_cls.name] = parser_cls
 
+    def register_lazy(self, name: str, reference: str) -> None:
+        """Register a ``module:attribute`` reference imported on first use."""
+        self._parsers[name] = reference
+
     def create(self, name: str, **kwargs) -> Parser:
-        parser_cls = self._parsers.get(name)
+        parser_cls = resolve_plugin(self._parsers, name, ENTRY_POINT_GROUP)
         if parser_cls is None:
             raise ConfigError(f"Unknown parser: {name}")
         return parser_cls(**kwargs)
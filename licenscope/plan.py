@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from licenscope.config.schema import AppConfig, LicenseSourceConfig
+from licenscope.core.errors import ConfigError, LicenscopeError
+from licenscope.parsers.base import Parser
+from licenscope.parsers.registry import ParserRegistry
+from licenscope.sources import create_source, source_accepts
+from licenscope.sources.base import LicenseSource
+
+if TYPE_CHECKING:
+    from licenscope.util.http import HttpClient
+
+
+@dataclass(frozen=True)
+class SourcePlan:
+    """A configured source with its source and parser objects built."""
+
+    index: int
+    config: LicenseSourceConfig
+    source: LicenseSource
+    parser: Parser
+    context: dict[str, Any]
+    fingerprint: str
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Validated, ready-to-run form of an ``AppConfig``.
+
+    Sources, parsers and auth providers are built once here and reused by
+    every run and daemon refresh of the same configuration. The HTTP client
+    shared by URL sources, with its idle connections and hedging threads,
+    lives as long as the plan: it is closed when a new plan stops using it
+    or when the ``LicenseChecker`` is closed.
+    """
+
+    config: AppConfig
+    sources: list[SourcePlan]
+    client: HttpClient | None
+
+
+def compile_plan(
+    config: AppConfig,
+    parser_registry: ParserRegistry,
+    *,
+    previous: ExecutionPlan | None = None,
+) -> ExecutionPlan:
+    """Build every source and parser, reporting all invalid sources at once.
+
+    No network I/O happens here, so configuration mistakes surface before
+    any source is fetched. Sources configured exactly as in a ``previous``
+    plan keep their source and parser objects instead of being rebuilt, as
+    long as the HTTP and retry settings and default timezone are unchanged.
+    """
+    reusable: dict[str, list[SourcePlan]] = {}
+    if (
+        previous is not None
+        and previous.config.http == config.http
+        and previous.config.retry == config.retry
+        and previous.config.default_timezone == config.default_timezone
+    ):
+        client = previous.client or build_http_client(config)
+        for source_plan in previous.sources:
+            reusable.setdefault(source_plan.fingerprint, []).append(source_plan)
+    else:
+        client = build_http_client(config)
+    sources: list[SourcePlan] = []
+    errors: list[str] = []
+    for index, source_config in enumerate(config.sources):
+        fingerprint = source_config.fingerprint()
+        kept = _take_matching(reusable.get(fingerprint), source_config)
+        if kept is not None:
+            sources.append(
+                kept if kept.index == index else dataclasses.replace(kept, index=index)
+            )
+            continue
+        try:
+            source = create_source(
+                source_config.kind,
+                **source_config.options,
+                auth=source_config.auth,
+                client=client,
+                retry=config.retry,
+            )
+            parser = parser_registry.create(
+                source_config.parser, **source_config.parser_options
+            )
+        except (LicenscopeError, TypeError, ValueError) as exc:
+            errors.append(
+                f"source #{index} kind={source_config.kind} "
+                f"parser={source_config.parser}: {exc}"
+            )
+            continue
+        sources.append(
+            SourcePlan(
+                index=index,
+                config=source_config,
+                source=source,
+                parser=parser,
+                context={
+                    **source.context,
+                    "default_timezone": config.default_timezone,
+                },
+                fingerprint=fingerprint,
+            )
+        )
+    if errors:
+        if client is not None and (previous is None or client is not previous.client):
+            client.close()
+        raise ConfigError("Invalid sources:\n  " + "\n  ".join(errors))
+    return ExecutionPlan(config=config, sources=sources, client=client)
+
+
+def _take_matching(
+    candidates: list[SourcePlan] | None, source_config: LicenseSourceConfig
+) -> SourcePlan | None:
+    for position, candidate in enumerate(candidates or ()):
+        if candidate.config == source_config:
+            return candidates.pop(position)
+    return None
+
+
+def build_http_client(config: AppConfig) -> HttpClient | None:
+    # Only import the HTTP stack when a configured source can use it.
+    # Unknown kinds are reported when their source is built.
+    for source in config.sources:
+        try:
+            if source_accepts(source.kind, "client"):
+                break
+        except ConfigError:
+            continue
+    else:
+        return None
+    from licenscope.util.http import HttpClient
+    from licenscope.util.http_cache import ResponseCache
+
+    cache = None
+    if config.http.cache_dir:
+        cache = ResponseCache(
+            config.http.cache_dir, max_bytes=config.http.cache_max_bytes
+        )
+    limits = None
+    if config.http.limits:
+        from licenscope.util.ratelimit import HostLimits
+
+        limits = HostLimits(config.http.limits)
+    return HttpClient(
+        connect_timeout=config.http.connect_timeout,
+        read_timeout=config.http.read_timeout,
+        pool_size=config.http.pool_size,
+        cache=cache,
+        limits=limits,
+        retry=config.retry,
+    )
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from licenscope.config.schema import AppConfig, LicenseSourceConfig
+from licenscope.core.errors import ConfigError
+from licenscope.core.models import LicenseRecord
+
+SHARD_FORMAT = "licenscope-shard"
+_SHARD_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    """Outcome of one source in a shard; ``records`` is ``None`` on failure."""
+
+    fingerprint: str
+    kind: str
+    parser: str
+    records: list[LicenseRecord] | None
+
+
+@dataclass(frozen=True)
+class ShardOutput:
+    index: int
+    count: int
+    created_at: datetime
+    results: list[ShardResult]
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse ``INDEX/COUNT`` with a zero-based index."""
+    index, _, count = value.partition("/")
+    try:
+        shard = int(index), int(count)
+    except ValueError:
+        shard = (-1, 0)
+    if not 0 <= shard[0] < shard[1]:
+        raise ConfigError(f"Invalid shard {value!r}; expected INDEX/COUNT like 0/4")
+    return shard
+
+
+def shard_of(source: LicenseSourceConfig, count: int) -> int:
+    """Assign ``source`` to a shard by rendezvous hashing of its fingerprint.
+
+    The shard depends only on the source's own configuration, so adding or
+    removing other sources never moves it, and changing ``count`` moves only
+    the share of sources that the new shard layout requires.
+    """
+    fingerprint = source.fingerprint()
+    return max(
+        range(count),
+        key=lambda shard: hashlib.blake2b(
+            f"{fingerprint}:{shard}".encode("ascii"), digest_size=8
+        ).digest(),
+    )
+
+
+def select_shard(config: AppConfig, index: int, count: int) -> AppConfig:
+    return dataclasses.replace(
+        config,
+        sources=[
+            source for source in config.sources if shard_of(source, count) == index
+        ],
+    )
+
+
+def record_to_dict(record: LicenseRecord) -> dict[str, Any]:
+    return {
+        "system": record.system,
+        "expires_at": record.expires_at.isoformat(),
+        "meta": record.meta,
+    }
+
+
+def record_from_dict(data: dict[str, Any]) -> LicenseRecord:
+    return LicenseRecord(
+        system=data["system"],
+        expires_at=datetime.fromisoformat(data["expires_at"]),
+        meta=data.get("meta") or {},
+    )
+
+
+def write_shard_output(
+    path: str | Path,
+    index: int,
+    count: int,
+    sources: list[LicenseSourceConfig],
+    results: list[list[LicenseRecord] | None],
+) -> None:
+    """Write a shard's results; metadata that is not JSON is stored as text."""
+    document = {
+        "format": SHARD_FORMAT,
+        "version": _SHARD_VERSION,
+        "shard": {"index": index, "count": count},
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "sources": [
+            {
+                "fingerprint": source.fingerprint(),
+                "kind": source.kind,
+                "parser": source.parser,
+                "records": (
+                    None
+                    if parsed is None
+                    else [record_to_dict(record) for record in parsed]
+                ),
+            }
+            for source, parsed in zip(sources, results)
+        ],
+    }
+    target = Path(path)
+    partial = target.with_name(target.name + ".tmp")
+    partial.write_text(json.dumps(document, default=str))
+    partial.replace(target)
+
+
+def read_shard_output(path: str | Path) -> ShardOutput:
+    try:
+        document = json.loads(Path(path).read_text())
+        if document.get("format") != SHARD_FORMAT:
+            raise ConfigError(f"{path} is not a Licenscope shard output")
+        if document.get("version") != _SHARD_VERSION:
+            raise ConfigError(
+                f"{path} has unsupported shard output version {document.get('version')}"
+            )
+        return ShardOutput(
+            index=int(document["shard"]["index"]),
+            count=int(document["shard"]["count"]),
+            created_at=datetime.fromisoformat(document["created_at"]),
+            results=[
+                ShardResult(
+                    fingerprint=source["fingerprint"],
+                    kind=source["kind"],
+                    parser=source["parser"],
+                    records=(
+                        None
+                        if source["records"] is None
+                        else [record_from_dict(item) for item in source["records"]]
+                    ),
+                )
+                for source in document["sources"]
+            ],
+        )
+    except OSError as exc:
+        raise ConfigError(f"Cannot read shard output {path}: {exc}") from exc
+    except (KeyError, TypeError, ValueError, AttributeError) as exc:
+        raise ConfigError(f"Malformed shard output {path}: {exc}") from exc
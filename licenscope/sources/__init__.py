@@ -1,23 +1,40 @@
 from typing import Any, Callable
+import functools
 import inspect
 
 from licenscope.core.errors import ConfigError
-from licenscope.sources.certificate import CertificateSource
-from licenscope.sources.file import FileSource
-from licenscope.sources.url import UrlSource
+from licenscope.util.plugins import resolve_plugin
 
+ENTRY_POINT_GROUP = "licenscope.sources"
 
-SOURCE_FACTORIES: dict[str, Callable[..., Any]] = {
-    CertificateSource.kind: CertificateSource,
-    FileSource.kind: FileSource,
-    UrlSource.kind: UrlSource,
+# Factories are imported the first time a config names their kind; values
+# are either callables or ``module:attribute`` references.
+SOURCE_FACTORIES: dict[str, Callable[..., Any] | str] = {
+    "certificates": "licenscope.sources.bulk_certificate:BulkCertificateSource",
+    "certificate": "licenscope.sources.certificate:CertificateSource",
+    "file": "licenscope.sources.file:FileSource",
+    "url": "licenscope.sources.url:UrlSource",
 }
 
 
-def create_source(kind: str, **kwargs):
-    factory = SOURCE_FACTORIES.get(kind)
+def get_source_factory(kind: str) -> Callable[..., Any]:
+    factory = resolve_plugin(SOURCE_FACTORIES, kind, ENTRY_POINT_GROUP)
     if factory is None:
         raise ConfigError(f"Unknown source kind: {kind}")
-    params = inspect.signature(factory).parameters
+    return factory
+
+
+@functools.cache
+def _parameters(factory: Callable[..., Any]) -> frozenset[str]:
+    return frozenset(inspect.signature(factory).parameters)
+
+
+def source_accepts(kind: str, parameter: str) -> bool:
+    return parameter in _parameters(get_source_factory(kind))
+
+
+def create_source(kind: str, **kwargs):
+    factory = get_source_factory(kind)
+    params = _parameters(factory)
     filtered = {key: value for key, value in kwargs.items() if key in params}
     return factory(**filtered)
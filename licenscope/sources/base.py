@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import io
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, BinaryIO
 
 
 class LicenseSource(ABC):
@@ -11,6 +13,19 @@ class LicenseSource(ABC):
     def load(self) -> str:
         """Load raw payload for parsing."""
 
+    def open_stream(self) -> BinaryIO:
+        """Open the raw payload as a byte stream for streaming parsers."""
+        return io.BytesIO(self.load().encode("utf-8"))
+
+    @property
+    def paginated(self) -> bool:
+        """Whether the payload is read with ``load_pages`` instead of ``load``."""
+        return False
+
+    def load_pages(self) -> Iterator[str]:
+        """Yield the raw payload one page at a time."""
+        yield self.load()
+
     @property
     def context(self) -> dict[str, Any]:
         return {}
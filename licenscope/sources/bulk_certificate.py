@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import contextlib
+import ipaddress
+import itertools
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from licenscope.core.errors import SourceError
+from licenscope.sources.base import LicenseSource
+from licenscope.sources.certificate import certificate_payload, default_ssl_context
+from licenscope.util import deadline, timing
+from licenscope.util.logging import get_logger
+from licenscope.util.tls import (
+    TlsEndpoint,
+    TlsScanner,
+    TlsScanResult,
+    address_ssl_context,
+)
+
+# Largest CIDR range a single target may expand to.
+_MAX_RANGE_ADDRESSES = 1 << 16
+
+_Network = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+@dataclass(frozen=True)
+class _Target:
+    """A configured host or CIDR range, before ports are applied."""
+
+    host: str | _Network
+    port: int | None = None
+    server_name: str | None = None
+    system: str | None = None
+
+
+@dataclass
+class _CertificateGroup:
+    """Endpoints that served the same certificate, by input position."""
+
+    payload: dict[str, Any]
+    endpoints: list[tuple[int, TlsEndpoint]] = field(default_factory=list)
+
+
+def _parse_host(host: str, value: object) -> str | _Network:
+    if "/" not in host:
+        return host
+    try:
+        network = ipaddress.ip_network(host, strict=False)
+    except ValueError as exc:
+        raise SourceError(f"Invalid certificate target range: {value}") from exc
+    if network.num_addresses > _MAX_RANGE_ADDRESSES:
+        raise SourceError(
+            f"Certificate target range {value} has more than "
+            f"{_MAX_RANGE_ADDRESSES} addresses"
+        )
+    return network
+
+
+def _parse_port(port: Any, value: object) -> int:
+    try:
+        number = int(port)
+    except (TypeError, ValueError) as exc:
+        raise SourceError(f"Invalid certificate endpoint port: {value}") from exc
+    if not 0 < number < 65536:
+        raise SourceError(f"Invalid certificate endpoint port: {value}")
+    return number
+
+
+def _parse_target(value: str | dict[str, Any]) -> _Target:
+    """Parse ``host``, ``host:port``, ``[v6]:port`` or a CIDR range."""
+    if isinstance(value, dict):
+        if not value.get("host"):
+            raise SourceError("Certificate endpoint is missing host")
+        port = value.get("port")
+        return _Target(
+            host=_parse_host(value["host"], value),
+            port=None if port is None else _parse_port(port, value),
+            server_name=value.get("server_name"),
+            system=value.get("system"),
+        )
+    text = value.strip()
+    if text.startswith("["):
+        host, _, rest = text[1:].partition("]")
+        port = rest.removeprefix(":") or None
+    elif text.count(":") == 1:
+        host, _, port = text.partition(":")
+    else:
+        host, port = text, None
+    if not host:
+        raise SourceError(f"Invalid certificate endpoint: {value}")
+    return _Target(
+        host=_parse_host(host, value),
+        port=None if port is None else _parse_port(port, value),
+    )
+
+
+class BulkCertificateSource(LicenseSource):
+    """Fetch certificates from many endpoints concurrently.
+
+    Targets come from ``endpoints`` and from ``targets_file`` (one per line)
+    and may be hosts or CIDR ranges; those without a port are tried on every
+    port in ``ports``. Targets are expanded lazily while the scan runs.
+    Certificates of IP targets without a ``server_name`` are verified
+    against the trusted CAs but not matched against the address.
+
+    Emits a JSON list of certificate payloads, so it pairs with the ``json``
+    parser and ``key = "."``. With ``dedupe`` there is one payload per
+    distinct certificate, listing every endpoint that served it.
+    """
+
+    kind = "certificates"
+
+    def __init__(
+        self,
+        endpoints: list[str | dict[str, Any]] | None = None,
+        targets_file: str | None = None,
+        port: int = 443,
+        ports: list[int] | None = None,
+        server_name: str | None = None,
+        dedupe: bool = True,
+        concurrency: int = 100,
+        timeout: float = 10.0,
+    ) -> None:
+        if not endpoints and not targets_file:
+            raise SourceError("Certificate endpoints or targets_file are required")
+        self._targets = [_parse_target(item) for item in endpoints or ()]
+        self._targets_file = Path(targets_file) if targets_file else None
+        self._ports = [_parse_port(item, item) for item in ports or (port,)]
+        self._server_name = server_name
+        self._dedupe = dedupe
+        self._scanner = TlsScanner(
+            concurrency=concurrency,
+            timeout=timeout,
+            context=default_ssl_context(),
+            address_context=address_ssl_context(),
+        )
+        self._logger = get_logger(self.__class__.__name__)
+
+    def load(self) -> str:
+        groups: dict[str | int, _CertificateGroup] = {}
+        # Payload or error per certificate fingerprint, so a certificate
+        # served by many endpoints is only validated once per run.
+        validated: dict[str, dict[str, Any] | SourceError] = {}
+        scanned = failures = 0
+
+        def handle(index: int, result: TlsScanResult) -> None:
+            nonlocal scanned, failures
+            scanned += 1
+            endpoint = result.endpoint
+            if result.cert is None:
+                failures += 1
+                self._logger.warning(
+                    "Failed to fetch certificate from {}: {}",
+                    endpoint.label,
+                    result.error,
+                )
+                return
+            fingerprint = result.fingerprint or f"#{index}"
+            payload = validated.get(fingerprint)
+            if payload is None:
+                try:
+                    payload = certificate_payload(result.cert, endpoint.label)
+                except SourceError as exc:
+                    payload = exc
+                validated[fingerprint] = payload
+            if isinstance(payload, SourceError):
+                failures += 1
+                self._logger.warning(
+                    "Invalid certificate from {}: {}", endpoint.label, payload
+                )
+                return
+            key = fingerprint if self._dedupe else index
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = _CertificateGroup(
+                    {**payload, "fingerprint": result.fingerprint}
+                )
+            group.endpoints.append((index, endpoint))
+
+        with contextlib.ExitStack() as stack:
+            lines: Iterable[str] = ()
+            if self._targets_file is not None:
+                try:
+                    lines = stack.enter_context(
+                        self._targets_file.open(encoding="utf-8")
+                    )
+                except OSError as exc:
+                    raise SourceError(
+                        f"Failed to read certificate targets from {self._targets_file}"
+                    ) from exc
+            try:
+                self._scanner.scan_each(
+                    self._endpoints(lines), handle, timeout=deadline.remaining()
+                )
+            except TimeoutError as exc:
+                raise SourceError(
+                    f"Deadline exceeded after scanning {scanned} endpoints"
+                ) from exc
+            finally:
+                timing.count("connections", scanned)
+
+        if not scanned:
+            raise SourceError("No certificate targets to scan")
+        payloads = []
+        for group in groups.values():
+            group.endpoints.sort(key=lambda item: item[0])
+        for group in sorted(groups.values(), key=lambda group: group.endpoints[0][0]):
+            first = group.endpoints[0][1]
+            payload = {**group.payload, "system": first.system or first.label}
+            if self._dedupe:
+                payload["endpoints"] = [
+                    endpoint.label for _, endpoint in group.endpoints
+                ]
+            payloads.append(payload)
+        if not payloads:
+            raise SourceError(
+                f"Failed to fetch certificates from all {failures} endpoints"
+            )
+        self._logger.debug(
+            "Scanned certificates endpoints={} certificates={} failures={}",
+            scanned,
+            len(validated),
+            failures,
+        )
+        return json.dumps(payloads)
+
+    def _endpoints(self, lines: Iterable[str]) -> Iterator[TlsEndpoint]:
+        """Expand configured and file targets, skipping repeated targets.
+
+        Only targets are remembered, not the endpoints they expand to, so
+        memory stays proportional to the input. Overlapping ranges are not
+        detected and may scan an address twice.
+        """
+        seen: set[tuple[object, ...]] = set()
+        for target in itertools.chain(self._targets, self._file_targets(lines)):
+            key = self._target_key(target)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield from self._expand(target)
+
+    def _target_key(self, target: _Target) -> tuple[object, ...]:
+        host = target.host.lower() if isinstance(target.host, str) else target.host
+        ports = self._ports if target.port is None else (target.port,)
+        return (
+            host,
+            tuple(ports),
+            target.server_name or self._server_name,
+            target.system,
+        )
+
+    def _file_targets(self, lines: Iterable[str]) -> Iterator[_Target]:
+        for number, line in enumerate(lines, start=1):
+            text = line.split("#", 1)[0].strip()
+            if not text:
+                continue
+            try:
+                yield _parse_target(text)
+            except SourceError as exc:
+                # Raising here would end the scan; report the line instead.
+                self._logger.warning(
+                    "Skipping {} line {}: {}", self._targets_file, number, exc
+                )
+
+    def _expand(self, target: _Target) -> Iterator[TlsEndpoint]:
+        if isinstance(target.host, str):
+            hosts: Iterable[str] = (target.host,)
+        else:
+            hosts = map(str, target.host.hosts())
+        ports = self._ports if target.port is None else (target.port,)
+        server_name = target.server_name or self._server_name
+        for host in hosts:
+            for port in ports:
+                yield TlsEndpoint(
+                    host=host,
+                    port=port,
+                    server_name=server_name,
+                    system=target.system,
+                )
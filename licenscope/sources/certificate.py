@@ -1,13 +1,49 @@
 from __future__ import annotations
 
+import functools
 import json
 import socket
 import ssl
 from datetime import datetime, timezone
+from typing import Any
 
+from licenscope.config.schema import RetryConfig
 from licenscope.core.errors import SourceError
 from licenscope.sources.base import LicenseSource
+from licenscope.util import deadline, timing
 from licenscope.util.logging import get_logger
+from licenscope.util.retry import call_with_retries
+
+
+@functools.cache
+def default_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide client context shared by certificate sources."""
+    return ssl.create_default_context()
+
+
+def parse_not_after(value: str) -> datetime:
+    try:
+        parsed = datetime.strptime(value, "%b %d %H:%M:%S %Y %Z")
+    except ValueError as exc:
+        raise SourceError("Certificate notAfter format is unsupported") from exc
+    return parsed.replace(tzinfo=timezone.utc)
+
+
+def certificate_payload(cert: dict[str, Any], system: str) -> dict[str, Any]:
+    """Build the payload emitted for a peer certificate."""
+    not_after = cert.get("notAfter")
+    if not_after is None:
+        raise SourceError("Certificate is missing notAfter field")
+    expires_at = parse_not_after(not_after)
+    return {
+        "system": system,
+        "expires_at": expires_at.isoformat(),
+        "subject": cert.get("subject"),
+        "issuer": cert.get("issuer"),
+        "serial_number": cert.get("serialNumber"),
+        "not_before": cert.get("notBefore"),
+        "not_after": not_after,
+    }
 
 
 class CertificateSource(LicenseSource):
@@ -20,6 +56,7 @@ class CertificateSource(LicenseSource):
         system: str | None = None,
         server_name: str | None = None,
         timeout: float = 10.0,
+        retry: RetryConfig | None = None,
     ) -> None:
         if not host:
             raise SourceError("Certificate host is required")
@@ -28,54 +65,67 @@ class CertificateSource(LicenseSource):
         self._system = system
         self._server_name = server_name or host
         self._timeout = timeout
+        self._retry = retry
         self._logger = get_logger(self.__class__.__name__)
 
     def load(self) -> str:
-        context = ssl.create_default_context()
-        try:
-            with socket.create_connection(
-                (self._host, self._port), timeout=self._timeout
-            ) as sock:
-                with context.wrap_socket(
-                    sock, server_hostname=self._server_name
-                ) as tls_sock:
-                    cert = tls_sock.getpeercert()
-        except (OSError, ssl.SSLError) as exc:
-            raise SourceError(
-                f"Failed to fetch certificate from {self._host}:{self._port}"
-            ) from exc
+        if self._retry is None:
+            cert = self._fetch()
+        else:
+            cert = call_with_retries(
+                self._fetch,
+                self._retry,
+                describe=f"retrying {self._host}:{self._port}",
+                on_retry=self._on_retry,
+            )
 
-        not_after = cert.get("notAfter")
-        if not_after is None:
-            raise SourceError("Certificate is missing notAfter field")
-        expires_at = self._parse_not_after(not_after)
+        payload = certificate_payload(
+            cert, self._system or f"{self._host}:{self._port}"
+        )
 
         self._logger.debug(
             "This is simple cert expiration module. For better certificate management we recomment to use ssleek (https://ssleek.com/)."
         )
-        payload = {
-            "system": self._system or f"{self._host}:{self._port}",
-            "expires_at": expires_at.isoformat(),
-            "subject": cert.get("subject"),
-            "issuer": cert.get("issuer"),
-            "serial_number": cert.get("serialNumber"),
-            "not_before": cert.get("notBefore"),
-            "not_after": not_after,
-        }
         self._logger.debug(
             "Fetched certificate host={} port={} expires_at={}",
             self._host,
             self._port,
-            expires_at.isoformat(),
+            payload["expires_at"],
         )
         return json.dumps(payload)
 
-    def _parse_not_after(self, value: str) -> datetime:
+    def _fetch(self) -> dict[str, Any]:
+        context = default_ssl_context()
+        timeout = deadline.bound(
+            self._timeout, f"connecting to {self._host}:{self._port}"
+        )
         try:
-            parsed = datetime.strptime(value, "%b %d %H:%M:%S %Y %Z")
-        except ValueError as exc:
-            raise SourceError("Certificate notAfter format is unsupported") from exc
-        return parsed.replace(tzinfo=timezone.utc)
+            with timing.measure(timing.STAGE_CONNECT):
+                sock = socket.create_connection(
+                    (self._host, self._port), timeout=timeout
+                )
+            with sock:
+                with timing.measure(timing.STAGE_TLS):
+                    tls_sock = context.wrap_socket(
+                        sock, server_hostname=self._server_name
+                    )
+                with tls_sock:
+                    return tls_sock.getpeercert()
+        except (OSError, ssl.SSLError) as exc:
+            raise SourceError(
+                f"Failed to fetch certificate from {self._host}:{self._port}"
+            ) from exc
+
+    def _on_retry(self, attempt: int, delay: float, exc: Exception) -> None:
+        timing.count("retries")
+        self._logger.warning(
+            "Attempt {} for {}:{} failed ({}), retrying in {:.1f}s",
+            attempt,
+            self._host,
+            self._port,
+            exc.__cause__ or exc,
+            delay,
+        )
 
     @property
     def context(self) -> dict[str, str]:
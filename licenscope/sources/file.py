@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import BinaryIO
 
 from licenscope.core.errors import SourceError
 from licenscope.sources.base import LicenseSource
@@ -18,6 +19,12 @@ class FileSource(LicenseSource):
             raise SourceError(f"File not found: {self._path}")
         return self._path.read_text()
 
+    def open_stream(self) -> BinaryIO:
+        try:
+            return self._path.open("rb")
+        except FileNotFoundError as exc:
+            raise SourceError(f"File not found: {self._path}") from exc
+
     @property
     def context(self) -> dict[str, str]:
         context = {}
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from email.message import Message
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from licenscope.core.errors import SourceError
+
+_DEFAULT_MAX_PAGES = 1000
+
+
+def _lookup(payload: Any, path: str) -> Any:
+    """Resolve a dotted path, returning ``None`` where it does not exist."""
+    path = path.strip(".")
+    if not path:
+        return payload
+    current = payload
+    for part in path.split("."):
+        if not isinstance(current, dict):
+            return None
+        current = current.get(part)
+    return current
+
+
+def _next_link(value: str) -> str | None:
+    """Return the target of the ``rel="next"`` entry of a ``Link`` header."""
+    for link in value.split(","):
+        target, _, params = link.partition(";")
+        target = target.strip()
+        if not (target.startswith("<") and target.endswith(">")):
+            continue
+        for param in params.split(";"):
+            name, _, rel = param.partition("=")
+            if name.strip().lower() == "rel" and "next" in rel.strip(' "').split():
+                return target[1:-1]
+    return None
+
+
+def _with_query(url: str, **params: Any) -> str:
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key not in params]
+    query.extend((key, str(value)) for key, value in params.items())
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _load_json(body: str) -> Any:
+    try:
+        return json.loads(body)
+    except ValueError as exc:
+        raise SourceError(f"Paginated response is not JSON: {exc}") from exc
+
+
+class Paginator(ABC):
+    """Work out the URL of the page after the one just fetched."""
+
+    # Whether the next URL depends only on the body, so a 304 served from
+    # the response cache is as good as a fresh response.
+    cacheable = True
+
+    def __init__(self, max_pages: int = _DEFAULT_MAX_PAGES) -> None:
+        if max_pages < 1:
+            raise SourceError("pagination.max_pages must be at least 1")
+        self.max_pages = max_pages
+
+    def first_url(self, url: str) -> str:
+        return url
+
+    @abstractmethod
+    def next_url(self, url: str, headers: Message, body: str) -> str | None:
+        """Return the next page's URL, or ``None`` after the last page."""
+
+
+class LinkPaginator(Paginator):
+    """Follow ``Link: <...>; rel="next"`` response headers."""
+
+    cacheable = False
+
+    def next_url(self, url: str, headers: Message, body: str) -> str | None:
+        for value in headers.get_all("Link") or ():
+            target = _next_link(value)
+            if target is not None:
+                return urljoin(url, target)
+        return None
+
+
+class CursorPaginator(Paginator):
+    """Read the next cursor from the JSON body.
+
+    With ``cursor_param`` the cursor is sent in that query parameter;
+    otherwise it is taken to be the next page's URL.
+    """
+
+    def __init__(
+        self,
+        cursor_path: str,
+        cursor_param: str | None = None,
+        max_pages: int = _DEFAULT_MAX_PAGES,
+    ) -> None:
+        super().__init__(max_pages)
+        if not cursor_path:
+            raise SourceError("pagination.cursor_path is required")
+        self._cursor_path = cursor_path
+        self._cursor_param = cursor_param
+
+    def next_url(self, url: str, headers: Message, body: str) -> str | None:
+        cursor = _lookup(_load_json(body), self._cursor_path)
+        if cursor is None or cursor == "":
+            return None
+        if self._cursor_param:
+            return _with_query(url, **{self._cursor_param: cursor})
+        return urljoin(url, str(cursor))
+
+
+class OffsetPaginator(Paginator):
+    """Step ``offset_param`` by the number of items on each page.
+
+    Paging stops at the first page holding fewer than ``limit`` items at
+    ``items_path``.
+    """
+
+    def __init__(
+        self,
+        items_path: str = ".",
+        limit: int = 100,
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+        start: int = 0,
+        max_pages: int = _DEFAULT_MAX_PAGES,
+    ) -> None:
+        super().__init__(max_pages)
+        if limit < 1:
+            raise SourceError("pagination.limit must be at least 1")
+        self._items_path = items_path
+        self._limit = limit
+        self._offset_param = offset_param
+        self._limit_param = limit_param
+        self._start = start
+
+    def first_url(self, url: str) -> str:
+        return _with_query(
+            url, **{self._offset_param: self._start, self._limit_param: self._limit}
+        )
+
+    def next_url(self, url: str, headers: Message, body: str) -> str | None:
+        items = _lookup(_load_json(body), self._items_path)
+        if not isinstance(items, list):
+            raise SourceError(f"pagination.items_path {self._items_path} is not a list")
+        if len(items) < self._limit:
+            return None
+        offset = int(dict(parse_qsl(urlsplit(url).query))[self._offset_param])
+        return _with_query(url, **{self._offset_param: offset + len(items)})
+
+
+PAGINATORS: dict[str, type[Paginator]] = {
+    "link": LinkPaginator,
+    "cursor": CursorPaginator,
+    "offset": OffsetPaginator,
+}
+
+
+def build_paginator(options: dict[str, Any]) -> Paginator:
+    options = dict(options)
+    kind = options.pop("type", None)
+    paginator_class = PAGINATORS.get(kind or "")
+    if paginator_class is None:
+        raise SourceError(f"Unsupported pagination type: {kind}")
+    try:
+        return paginator_class(**options)
+    except TypeError as exc:
+        raise SourceError(f"Invalid {kind} pagination options: {exc}") from exc
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import itertools
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, BinaryIO
 from urllib.request import Request
 
 from licenscope.auth import AUTH_PROVIDERS
+from licenscope.auth.base import AuthProvider
 from licenscope.core.errors import SourceError
 from licenscope.sources.base import LicenseSource
+from licenscope.sources.pagination import build_paginator
+from licenscope.util import deadline, timing
 from licenscope.util.http import HttpClient
 from licenscope.util.logging import get_logger
 
@@ -20,17 +27,81 @@ class UrlSource(LicenseSource):
         method: str = "GET",
         headers: dict[str, str] | None = None,
         body: str | bytes | None = None,
+        pagination: dict[str, Any] | None = None,
+        client: HttpClient | None = None,
     ) -> None:
         self._url = url
-        self._auth = auth or {}
+        self._auth = _build_auth_provider(auth or {})
         self._system = system
         self._method = method.upper()
         self._headers = headers or {}
         self._body = body
-        self._client = HttpClient()
+        self._paginator = build_paginator(pagination) if pagination else None
+        self._client = client or HttpClient()
         self._logger = get_logger(self.__class__.__name__)
 
     def load(self) -> str:
+        return self._client.fetch(self._build_request())
+
+    def open_stream(self) -> BinaryIO:
+        return self._client.open(self._build_request())
+
+    @property
+    def paginated(self) -> bool:
+        return self._paginator is not None
+
+    def load_pages(self) -> Iterator[str]:
+        """Yield pages in order, fetching each next page while the caller
+        processes the current one.
+
+        The first page is fetched in the calling thread so that it shows up
+        in the source's timings; later pages are fetched one ahead on a
+        helper thread, and only the time spent waiting for them is seen by
+        the caller.
+        """
+        paginator = self._paginator
+        if paginator is None:
+            yield self.load()
+            return
+        page, url = self._fetch_page(paginator.first_url(self._url))
+        executor: ThreadPoolExecutor | None = None
+        try:
+            for number in itertools.count(2):
+                pending: Future[tuple[str, str | None]] | None = None
+                if url is not None:
+                    if number > paginator.max_pages:
+                        raise SourceError(
+                            f"{self._url} has more than {paginator.max_pages} pages"
+                        )
+                    if executor is None:
+                        executor = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="licenscope-page"
+                        )
+                    pending = executor.submit(
+                        self._prefetch_page, url, deadline.current()
+                    )
+                yield page
+                if pending is None:
+                    return
+                page, url = pending.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_page(self, url: str) -> tuple[str, str | None]:
+        """Fetch one page and work out the URL of the next one."""
+        body, headers = self._client.fetch_response(
+            self._build_request(url), use_cache=self._paginator.cacheable
+        )
+        return body, self._paginator.next_url(url, headers, body)
+
+    def _prefetch_page(self, url: str, until: float | None) -> tuple[str, str | None]:
+        # The helper thread does not see the caller's deadline otherwise.
+        with deadline.scope(until=until):
+            return self._fetch_page(url)
+
+    def _build_request(self, url: str | None = None) -> Request:
+        url = url or self._url
         data = None
         if self._body is not None:
             if self._method == "GET":
@@ -40,18 +111,10 @@ class UrlSource(LicenseSource):
                 if isinstance(self._body, str)
                 else self._body
             )
-        request = Request(
-            self._url, data=data, method=self._method, headers=self._headers
-        )
-        auth_type = self._auth.get("type")
-        if auth_type:
-            provider_cls = AUTH_PROVIDERS.get(auth_type)
-            if provider_cls is None:
-                raise SourceError(f"Unknown auth provider: {auth_type}")
-            provider = provider_cls(
-                **{k: v for k, v in self._auth.items() if k != "type"}
-            )
-            request = provider.apply(request)
+        request = Request(url, data=data, method=self._method, headers=self._headers)
+        if self._auth is not None:
+            with timing.measure(timing.STAGE_AUTH):
+                request = self._auth.apply(request)
         body_len = len(data) if data is not None else 0
         headers_to_log = {
             k: v
@@ -61,12 +124,12 @@ class UrlSource(LicenseSource):
         self._logger.debug(
             "URL request method={} url={} system={} headers={} body_bytes={}",
             self._method,
-            self._url,
+            url,
             self._system or "unknown",
             headers_to_log,
             body_len,
         )
-        return self._client.fetch(request)
+        return request
 
     @property
     def context(self) -> dict[str, str]:
@@ -74,3 +137,18 @@ class UrlSource(LicenseSource):
         if self._system:
             context["system"] = self._system
         return context
+
+
+def _build_auth_provider(auth: dict[str, str]) -> AuthProvider | None:
+    auth_type = auth.get("type")
+    if not auth_type:
+        return None
+    provider_cls = AUTH_PROVIDERS.get(auth_type)
+    if provider_cls is None:
+        raise SourceError(f"Unknown auth provider: {auth_type}")
+    try:
+        return provider_cls(**{k: v for k, v in auth.items() if k != "type"})
+    except TypeError as exc:
+        raise SourceError(
+            f"Invalid options for auth provider {auth_type}: {exc}"
+        ) from exc
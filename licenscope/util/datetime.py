@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import functools
 import re
-from datetime import datetime, timezone
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone, tzinfo
 from typing import Iterable
 from zoneinfo import ZoneInfo
 
-_ORDINAL_RE = re.compile(r"(\\d{1,2})(st|nd|rd|th)")
-_MULTISPACE_RE = re.compile(r"\\s+")
+_ORDINAL_RE = re.compile(r"(\d{1,2})(st|nd|rd|th)")
+_MULTISPACE_RE = re.compile(r"\s+")
 
 DEFAULT_FORMATS = (
     "%b %d %Y %H:%M:%S",
@@ -21,6 +23,101 @@ DEFAULT_FORMATS = (
     "%Y-%m-%d",
 )
 
+# Labels used in format statistics for values not resolved by a strptime format.
+DATETIME_LABEL = "datetime"
+TIMESTAMP_LABEL = "timestamp"
+ISO_LABEL = "iso"
+
+_RECENT_CACHE_SIZE = 4096
+
+
+class FormatLearner:
+    """Track which format a caller's values use.
+
+    The most recently successful ``strptime`` format (or ISO 8601) becomes the
+    preferred one and is tried first on the next value. Every resolution is
+    counted per label so callers can report which formats their input uses.
+    """
+
+    def __init__(self, formats: Iterable[str]) -> None:
+        self._formats = tuple(formats)
+        self._preferred: str | None = None
+        self._counts: Counter[str] = Counter()
+
+    @property
+    def formats(self) -> tuple[str, ...]:
+        return self._formats
+
+    @property
+    def preferred(self) -> str | None:
+        return self._preferred
+
+    @property
+    def counts(self) -> dict[str, int]:
+        return dict(self._counts)
+
+    def resolved(self, label: str) -> None:
+        self._counts[label] += 1
+        if label == ISO_LABEL or label in self._formats:
+            self._preferred = label
+
+
+class DateTimeParser:
+    """Stateful ``parse_datetime`` for a single caller.
+
+    Remembers the winning format, caches ``ZoneInfo`` lookups and keeps a
+    bounded LRU of recently parsed strings, which pays off for sources that
+    emit many values in one fixed format. When several configured formats
+    could match the same text, the learned format takes precedence.
+    """
+
+    def __init__(
+        self,
+        *,
+        formats: Iterable[str] | None = None,
+        timestamp_unit: str = "auto",
+        cache_size: int = _RECENT_CACHE_SIZE,
+    ) -> None:
+        self._learner = FormatLearner(formats or DEFAULT_FORMATS)
+        self._timestamp_unit = timestamp_unit
+        self._cache_size = cache_size
+        self._recent: OrderedDict[tuple[str, str | None], tuple[datetime, str]] = (
+            OrderedDict()
+        )
+
+    @property
+    def format_stats(self) -> dict[str, int]:
+        return self._learner.counts
+
+    def parse(self, value: object, *, timezone_name: str | None = "UTC") -> datetime:
+        if not isinstance(value, str):
+            dt, label = _parse_value(
+                value, formats=(), timestamp_unit=self._timestamp_unit
+            )
+            self._learner.resolved(label)
+            return _apply_timezone(dt, timezone_name)
+
+        key = (value, timezone_name)
+        cached = self._recent.get(key)
+        if cached is not None:
+            self._recent.move_to_end(key)
+            dt, label = cached
+            self._learner.resolved(label)
+            return dt
+
+        dt, label = _parse_datetime_str(
+            value,
+            formats=self._learner.formats,
+            timestamp_unit=self._timestamp_unit,
+            preferred=self._learner.preferred,
+        )
+        self._learner.resolved(label)
+        dt = _apply_timezone(dt, timezone_name)
+        self._recent[key] = (dt, label)
+        if len(self._recent) > self._cache_size:
+            self._recent.popitem(last=False)
+        return dt
+
 
 def parse_datetime(
     value: object,
@@ -29,47 +126,72 @@ def parse_datetime(
     timezone_name: str | None = "UTC",
     timestamp_unit: str = "auto",
 ) -> datetime:
+    dt, _ = _parse_value(
+        value, formats=formats or DEFAULT_FORMATS, timestamp_unit=timestamp_unit
+    )
+    return _apply_timezone(dt, timezone_name)
+
+
+def _parse_value(
+    value: object,
+    *,
+    formats: Iterable[str],
+    timestamp_unit: str,
+) -> tuple[datetime, str]:
     if isinstance(value, datetime):
-        dt = value
-    elif isinstance(value, (int, float)):
-        dt = _from_timestamp(float(value), unit=timestamp_unit)
-    elif isinstance(value, str):
-        dt = _parse_datetime_str(
+        return value, DATETIME_LABEL
+    if isinstance(value, (int, float)):
+        return _from_timestamp(float(value), unit=timestamp_unit), TIMESTAMP_LABEL
+    if isinstance(value, str):
+        return _parse_datetime_str(
             value,
             formats=formats,
             timestamp_unit=timestamp_unit,
         )
-    else:
-        raise ValueError(f"Unsupported datetime value: {type(value).__name__}")
+    raise ValueError(f"Unsupported datetime value: {type(value).__name__}")
+
 
+def _apply_timezone(dt: datetime, timezone_name: str | None) -> datetime:
     if dt.tzinfo is None and timezone_name:
-        try:
-            tzinfo = ZoneInfo(timezone_name)
-        except Exception as exc:  # pragma: no cover - defensive for invalid zones
-            raise ValueError(f"Unknown timezone: {timezone_name}") from exc
-        dt = dt.replace(tzinfo=tzinfo)
+        dt = dt.replace(tzinfo=_zone(timezone_name))
     return dt
 
 
+@functools.lru_cache(maxsize=64)
+def _zone(timezone_name: str) -> tzinfo:
+    try:
+        return ZoneInfo(timezone_name)
+    except Exception as exc:  # pragma: no cover - defensive for invalid zones
+        raise ValueError(f"Unknown timezone: {timezone_name}") from exc
+
+
 def _parse_datetime_str(
     value: str,
     *,
-    formats: Iterable[str] | None,
+    formats: Iterable[str],
     timestamp_unit: str,
-) -> datetime:
+    preferred: str | None = None,
+) -> tuple[datetime, str]:
     text = _normalize_datetime_text(value)
     if not text:
         raise ValueError("Datetime string is empty")
     if _looks_like_number(text):
-        return _from_timestamp(float(text), unit=timestamp_unit)
+        return _from_timestamp(float(text), unit=timestamp_unit), TIMESTAMP_LABEL
+    if preferred is not None and preferred != ISO_LABEL:
+        try:
+            return datetime.strptime(text, preferred), preferred
+        except ValueError:
+            pass
     try:
-        return datetime.fromisoformat(text)
+        return datetime.fromisoformat(text), ISO_LABEL
     except ValueError:
         pass
 
-    for fmt in formats or DEFAULT_FORMATS:
+    for fmt in formats:
+        if fmt == preferred:
+            continue
         try:
-            return datetime.strptime(text, fmt)
+            return datetime.strptime(text, fmt), fmt
         except ValueError:
             continue
     raise ValueError(f"Unsupported datetime format: {value}")
@@ -80,7 +202,7 @@ def _normalize_datetime_text(value: str) -> str:
     if not text:
         return text
     text = text.replace(",", " ")
-    text = _ORDINAL_RE.sub(r"\\1", text)
+    text = _ORDINAL_RE.sub(r"\1", text)
     text = _MULTISPACE_RE.sub(" ", text)
     return text
 
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import contextlib
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+
+from licenscope.core.errors import SourceError
+
+_deadline: ContextVar[float | None] = ContextVar("licenscope_deadline", default=None)
+
+
+def current() -> float | None:
+    """Monotonic time the work of this thread must finish by, if any."""
+    return _deadline.get()
+
+
+def remaining() -> float | None:
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def scope(
+    seconds: float | None = None, *, until: float | None = None
+) -> Iterator[None]:
+    """Limit the enclosed work to ``seconds`` from now or to ``until``.
+
+    An enclosing deadline that is earlier stays in force.
+    """
+    candidates = [
+        value
+        for value in (
+            _deadline.get(),
+            None if seconds is None else time.monotonic() + seconds,
+            until,
+        )
+        if value is not None
+    ]
+    token = _deadline.set(min(candidates) if candidates else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def bound(timeout: float, what: str) -> float:
+    """Clamp ``timeout`` to the time left, failing once there is none."""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise SourceError(f"Deadline exceeded before {what}")
+    return min(timeout, left)
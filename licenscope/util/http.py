@@ -1,9 +1,727 @@
 from __future__ import annotations
 
-from urllib.request import Request, urlopen
+import http.client
+import io
+import ssl
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import BinaryIO, TypeVar
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass
+
+from licenscope import __version__
+from licenscope.config.schema import RetryConfig
+from licenscope.core.errors import HttpError, SourceError
+from licenscope.util import deadline, timing
+from licenscope.util.http_cache import CacheEntry, ResponseCache
+from licenscope.util.logging import get_logger
+from licenscope.util.ratelimit import HostLimits, parse_retry_after
+from licenscope.util.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyWindow,
+    call_with_retries,
+    is_transient,
+)
+
+T = TypeVar("T")
+
+_CHUNK_SIZE = 64 * 1024
+_MAX_REDIRECTS = 5
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Dropped when a redirect leaves the original scheme, host and port.
+_CREDENTIAL_HEADERS = ("authorization", "proxy-authorization", "cookie")
+_THROTTLE_STATUSES = {429, 503}
+
+# Errors raised when a pooled keep-alive connection was closed by the peer
+# while idle; the request is retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+_PoolKey = tuple[str, str, int, str | None]
 
 
 class HttpClient:
+    """HTTP/1.1 client with per-host keep-alive pooling.
+
+    One client is meant to be shared by every URL source in a run so requests
+    to the same vendor host reuse connections instead of paying a new TCP and
+    TLS handshake each time. Responses are requested with gzip/deflate
+    encoding and decompressed incrementally while the body is read.
+
+    With a ``cache``, GET responses carrying ETag or Last-Modified validators
+    are stored and revalidated on later requests; a 304 reply is served from
+    the cached body.
+
+    With ``limits``, requests to a limited host queue for its rate and
+    in-flight budget. A 429, or a 503 with ``Retry-After``, from such a host
+    pauses every request to it and the throttled request is retried.
+
+    With ``retry``, requests failing with connection errors or one of its
+    retry statuses are repeated with jittered backoff, without running past
+    the deadline of the calling source. A host failing ``breaker_threshold``
+    times in a row is not contacted again until ``breaker_cooldown`` has
+    passed. With ``hedge_percentile``, a GET slower than that percentile of
+    the host's recent responses is sent a second time and whichever copy
+    answers first is used.
+    """
+
+    def __init__(
+        self,
+        *,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 30.0,
+        pool_size: int = 4,
+        context: ssl.SSLContext | None = None,
+        cache: ResponseCache | None = None,
+        limits: HostLimits | None = None,
+        retry: RetryConfig | None = None,
+    ) -> None:
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._pool_size = pool_size
+        self._context = context or ssl.create_default_context()
+        self._cache = cache
+        self._limits = limits
+        self._retry = retry
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._latency: dict[str, LatencyWindow] = {}
+        self._hedge_pool: ThreadPoolExecutor | None = None
+        self._idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._logger = get_logger(self.__class__.__name__)
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._cache
+
     def fetch(self, request: Request) -> str:
-        with urlopen(request, timeout=30) as response:
-            return response.read().decode("utf-8")
+        return self.fetch_response(request)[0]
+
+    def fetch_response(
+        self, request: Request, *, use_cache: bool = True
+    ) -> tuple[str, http.client.HTTPMessage]:
+        """Fetch the decoded body together with the response headers.
+
+        A body served from the cache comes with the headers of the ``304``
+        reply. With ``use_cache=False`` the cache is bypassed entirely.
+        The cache is consulted and updated once, around the network fetch,
+        however many attempts or hedged copies that fetch takes.
+        """
+        hedge = request.get_method() == "GET"
+        if not use_cache or self._cache is None or not hedge:
+            data, charset, headers, _ = self._call(
+                request, lambda: self._download(request, {}), hedge=hedge
+            )
+            with timing.measure(timing.STAGE_DECODE):
+                return data.decode(charset or "utf-8"), headers
+
+        key, entry = self._cache_lookup(request)
+        extra_headers = entry.conditional_headers() if entry else {}
+        data, charset, headers, status = self._call(
+            request, lambda: self._download(request, extra_headers), hedge=True
+        )
+        if status == 304 and entry is not None:
+            self._cache.record_hit(key)
+            timing.count("cache_hits")
+            with timing.measure(timing.STAGE_DECODE):
+                return entry.body.decode(entry.charset or "utf-8"), headers
+        self._cache.record_miss()
+        self._cache.store(
+            key,
+            data,
+            charset=charset,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with timing.measure(timing.STAGE_DECODE):
+            return data.decode(charset or "utf-8"), headers
+
+    def _download(
+        self, request: Request, extra_headers: dict[str, str]
+    ) -> tuple[bytes, str | None, http.client.HTTPMessage, int]:
+        """Read the whole response: body, charset, headers and status."""
+        with self._open(request, extra_headers) as stream:
+            return stream.read(), stream.charset, stream.headers, stream.status
+
+    def open(self, request: Request) -> BinaryIO:
+        """Open the decompressed response body as a buffered byte stream.
+
+        Failures are only retried until the response headers arrive; the
+        body is read by the caller.
+        """
+        return self._call(request, lambda: self._open_once(request))
+
+    def _open_once(self, request: Request) -> BinaryIO:
+        if self._cache is None or request.get_method() != "GET":
+            return io.BufferedReader(self._open(request), _CHUNK_SIZE)
+
+        key, entry = self._cache_lookup(request)
+        extra_headers = entry.conditional_headers() if entry else {}
+        stream = self._open(request, extra_headers)
+        if stream.status == 304 and entry is not None:
+            with stream:
+                stream.read()
+            self._cache.record_hit(key)
+            timing.count("cache_hits")
+            return io.BytesIO(entry.body)
+        self._cache.record_miss()
+        return io.BufferedReader(_CachingStream(stream, self._cache, key), _CHUNK_SIZE)
+
+    def _cache_lookup(self, request: Request) -> tuple[str, CacheEntry | None]:
+        key = self._cache.key_for(
+            request.get_method(), request.full_url, dict(request.header_items())
+        )
+        return key, self._cache.get(key)
+
+    def _call(
+        self, request: Request, operation: Callable[[], T], *, hedge: bool = False
+    ) -> T:
+        if self._retry is None:
+            return operation()
+        url = request.full_url
+        host = (urlsplit(url).hostname or "").lower()
+
+        def on_retry(attempt: int, delay: float, exc: Exception) -> None:
+            timing.count("retries")
+            self._logger.warning(
+                "Attempt {} for {} failed ({}), retrying in {:.1f}s",
+                attempt,
+                url,
+                exc,
+                delay,
+            )
+
+        return call_with_retries(
+            lambda: self._attempt(host, url, operation, hedge),
+            self._retry,
+            describe=f"retrying {url}",
+            on_retry=on_retry,
+        )
+
+    def _attempt(
+        self, host: str, url: str, operation: Callable[[], T], hedge: bool
+    ) -> T:
+        breaker = self._breaker_for(host)
+        if breaker is not None and not breaker.allow():
+            timing.count("circuit_open")
+            raise CircuitOpenError(f"Circuit breaker open for {host}, skipping {url}")
+        hedge = hedge and self._retry.hedge_percentile is not None
+        ok = False
+        try:
+            started = time.monotonic()
+            delay = (
+                self._latency_for(host).hedge_delay(self._retry.hedge_percentile)
+                if hedge
+                else None
+            )
+            result = operation() if delay is None else self._hedged(operation, delay)
+            if hedge:
+                self._latency_for(host).add(time.monotonic() - started)
+            ok = True
+            return result
+        except SourceError as exc:
+            # A host answering with a non-retryable error is still up.
+            ok = not is_transient(exc, self._retry.retry_statuses)
+            raise
+        finally:
+            if breaker is not None:
+                breaker.record(ok)
+
+    def _hedged(self, operation: Callable[[], T], delay: float) -> T:
+        """Run ``operation``, starting a second copy if it is slower than
+        ``delay``, and return the first copy to succeed.
+
+        The copies run on helper threads, so their stages are recorded as
+        transfer time of the calling source. The slower copy cannot be
+        interrupted and finishes in the background.
+        """
+        until = deadline.current()
+
+        def run() -> T:
+            with deadline.scope(until=until):
+                return operation()
+
+        pool = self._hedge_executor()
+        with timing.measure(timing.STAGE_TRANSFER):
+            first = pool.submit(run)
+            done, _ = wait([first], timeout=delay)
+            if done:
+                return first.result()
+            timing.count("hedged")
+            pending: set[Future[T]] = {first, pool.submit(run)}
+            error: BaseException | None = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    exc = future.exception()
+                    if exc is None:
+                        return future.result()
+                    error = error or exc
+        raise error
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(
+                    thread_name_prefix="licenscope-hedge"
+                )
+            return self._hedge_pool
+
+    def _breaker_for(self, host: str) -> CircuitBreaker | None:
+        if not self._retry.breaker_threshold:
+            return None
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(
+                    self._retry.breaker_threshold, self._retry.breaker_cooldown
+                )
+            return breaker
+
+    def _latency_for(self, host: str) -> LatencyWindow:
+        with self._lock:
+            window = self._latency.get(host)
+            if window is None:
+                window = self._latency[host] = LatencyWindow()
+            return window
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+            hedge_pool, self._hedge_pool = self._hedge_pool, None
+        if hedge_pool is not None:
+            hedge_pool.shutdown(wait=False)
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _open(
+        self, request: Request, extra_headers: dict[str, str] | None = None
+    ) -> HttpResponseStream:
+        method = request.get_method()
+        url = request.full_url
+        data = request.data
+        headers = {**dict(request.header_items()), **(extra_headers or {})}
+        _set_default_header(headers, "Accept-Encoding", "gzip, deflate")
+        _set_default_header(headers, "User-Agent", f"licenscope/{__version__}")
+        if data is not None:
+            _set_default_header(
+                headers, "Content-Type", "application/x-www-form-urlencoded"
+            )
+        redirects = throttled = 0
+        while True:
+            response, release = self._send(method, url, data, headers)
+            if response.status in _THROTTLE_STATUSES and self._throttled(
+                url, response, throttled
+            ):
+                release(_drain(response))
+                throttled += 1
+                continue
+            location = response.getheader("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                break
+            release(_drain(response))
+            if redirects == _MAX_REDIRECTS:
+                raise SourceError(f"Too many redirects fetching {request.full_url}")
+            redirects += 1
+            previous, url = url, urljoin(url, location)
+            if _origin(url) != _origin(previous):
+                headers = {
+                    name: value
+                    for name, value in headers.items()
+                    if name.lower() not in _CREDENTIAL_HEADERS
+                }
+            if response.status == 303 or (
+                response.status in (301, 302) and method == "POST"
+            ):
+                method, data = "GET", None
+                headers = {
+                    name: value
+                    for name, value in headers.items()
+                    if name.lower() not in ("content-type", "content-length")
+                }
+
+        if response.status >= 400:
+            response_headers = dict(response.getheaders())
+            release(_drain(response))
+            raise HttpError(
+                f"HTTP {response.status} {response.reason} from {url}",
+                status=response.status,
+                headers=response_headers,
+            )
+        return HttpResponseStream(response, release)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[http.client.HTTPResponse, Callable[[bool], None]]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise SourceError(f"Unsupported URL: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = self._proxy_for(scheme, parts.hostname)
+        key: _PoolKey = (scheme, parts.hostname, port, proxy)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        if proxy and scheme == "http":
+            target = url
+
+        limiter = self._limits.for_host(parts.hostname) if self._limits else None
+        if limiter is not None:
+            with timing.measure(timing.STAGE_QUEUE):
+                try:
+                    limiter.acquire(timeout=deadline.remaining())
+                except TimeoutError as exc:
+                    # Not transient: the deadline is what ran out.
+                    raise SourceError(
+                        f"Deadline exceeded waiting to fetch {url}: {exc}"
+                    ) from None
+        try:
+            read_timeout = deadline.bound(self._read_timeout, f"fetching {url}")
+            reused, connection = self._acquire(key)
+            if reused:
+                # The connection may have been opened under another deadline.
+                connection.sock.settimeout(read_timeout)
+            try:
+                try:
+                    with timing.measure(timing.STAGE_TRANSFER):
+                        connection.request(method, target, body=data, headers=headers)
+                        response = connection.getresponse()
+                except _STALE_CONNECTION_ERRORS:
+                    connection.close()
+                    if not reused:
+                        raise
+                    connection = self._connect(key)
+                    with timing.measure(timing.STAGE_TRANSFER):
+                        connection.request(method, target, body=data, headers=headers)
+                        response = connection.getresponse()
+            except OSError as exc:
+                connection.close()
+                raise SourceError(f"Failed to fetch {url}: {exc}") from exc
+        except BaseException:
+            if limiter is not None:
+                limiter.release()
+            raise
+
+        def release(reusable: bool) -> None:
+            if reusable and not response.will_close:
+                self._release(key, connection)
+            else:
+                connection.close()
+            if limiter is not None:
+                limiter.release()
+
+        return response, release
+
+    def _throttled(
+        self, url: str, response: http.client.HTTPResponse, attempt: int
+    ) -> bool:
+        """Pause a limited host that throttled us; return whether to retry."""
+        host = urlsplit(url).hostname or ""
+        limiter = self._limits.for_host(host) if self._limits else None
+        if limiter is None:
+            return False
+        config = self._limits.config_for(host)
+        delay = parse_retry_after(response.getheader("Retry-After"))
+        if delay is None:
+            if response.status != 429:
+                return False
+            delay = 2.0**attempt
+        limiter.pause(min(delay, config.max_retry_after))
+        timing.count("throttled")
+        if attempt >= config.max_retries or delay > config.max_retry_after:
+            return False
+        left = deadline.remaining()
+        if left is not None and delay >= left:
+            return False
+        self._logger.warning(
+            "HTTP {} from {}, retrying in {:.1f}s", response.status, host, delay
+        )
+        return True
+
+    def _acquire(self, key: _PoolKey) -> tuple[bool, http.client.HTTPConnection]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return True, idle.pop()
+        return False, self._connect(key)
+
+    def _release(self, key: _PoolKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._pool_size:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _connect(self, key: _PoolKey) -> http.client.HTTPConnection:
+        scheme, host, port, proxy = key
+        connect_host, connect_port = host, port
+        if proxy:
+            proxy_parts = urlsplit(proxy)
+            connect_host = proxy_parts.hostname or host
+            connect_port = proxy_parts.port or 80
+        if scheme == "https":
+            connection: http.client.HTTPConnection = http.client.HTTPSConnection(
+                connect_host,
+                connect_port,
+                timeout=deadline.bound(self._connect_timeout, f"connecting to {host}"),
+                context=self._context,
+            )
+            if proxy:
+                connection.set_tunnel(host, port)
+        else:
+            connection = http.client.HTTPConnection(
+                connect_host,
+                connect_port,
+                timeout=deadline.bound(self._connect_timeout, f"connecting to {host}"),
+            )
+        timings = timing.current()
+        try:
+            if timings is None:
+                connection.connect()
+            else:
+                _timed_connect(connection, timings, tls=scheme == "https")
+        except OSError as exc:
+            connection.close()
+            raise SourceError(f"Failed to connect to {host}:{port}: {exc}") from exc
+        connection.sock.settimeout(
+            deadline.bound(self._read_timeout, f"fetching from {host}")
+        )
+        return connection
+
+    @staticmethod
+    def _proxy_for(scheme: str, host: str) -> str | None:
+        proxy = getproxies().get(scheme)
+        if not proxy or proxy_bypass(host):
+            return None
+        return proxy
+
+
+class HttpResponseStream(io.RawIOBase):
+    """Readable, decompressed view of a response body.
+
+    The underlying connection goes back to the pool once the body has been
+    read to the end; closing the stream early discards the connection.
+    """
+
+    def __init__(
+        self,
+        response: http.client.HTTPResponse,
+        release: Callable[[bool], None],
+    ) -> None:
+        super().__init__()
+        try:
+            self._decoder = _decoder_for(response.getheader("Content-Encoding"))
+        except SourceError:
+            release(False)
+            raise
+        self._response = response
+        self._release: Callable[[bool], None] | None = release
+        self._pending = b""
+        self._offset = 0
+        self._eof = False
+
+    @property
+    def status(self) -> int:
+        return self._response.status
+
+    @property
+    def headers(self) -> http.client.HTTPMessage:
+        return self._response.headers
+
+    @property
+    def charset(self) -> str | None:
+        return self._response.headers.get_content_charset()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._offset >= len(self._pending):
+            if self._eof:
+                return 0
+            self._fill()
+        size = min(len(buffer), len(self._pending) - self._offset)
+        buffer[:size] = self._pending[self._offset : self._offset + size]
+        self._offset += size
+        return size
+
+    def readall(self) -> bytes:
+        chunks = [self._pending[self._offset :]]
+        self._pending, self._offset = b"", 0
+        while not self._eof:
+            self._fill()
+            chunks.append(self._pending)
+            self._pending = b""
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        if self._release is not None:
+            release, self._release = self._release, None
+            release(self._eof)
+        super().close()
+
+    def _fill(self) -> None:
+        try:
+            with timing.measure(timing.STAGE_TRANSFER):
+                chunk = self._response.read1(_CHUNK_SIZE)
+        except (OSError, http.client.HTTPException) as exc:
+            raise SourceError(f"Failed reading response body: {exc}") from exc
+        timing.count("bytes_received", len(chunk))
+        self._offset = 0
+        if not chunk:
+            self._pending = self._decoder.flush() if self._decoder else b""
+            self._eof = True
+            if self._release is not None:
+                release, self._release = self._release, None
+                release(True)
+            return
+        if self._decoder is None:
+            self._pending = chunk
+            return
+        try:
+            with timing.measure(timing.STAGE_DECODE):
+                self._pending = self._decoder.decompress(chunk)
+        except zlib.error as exc:
+            raise SourceError(f"Failed to decompress response body: {exc}") from exc
+
+
+class _CachingStream(io.RawIOBase):
+    """Pass a response body through while storing it in the response cache.
+
+    The body is buffered only up to the cache's size limit; larger bodies are
+    streamed without being cached.
+    """
+
+    def __init__(
+        self, stream: HttpResponseStream, cache: ResponseCache, key: str
+    ) -> None:
+        super().__init__()
+        self._stream = stream
+        self._cache = cache
+        self._key = key
+        self._body: bytearray | None = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = self._stream.readinto(buffer)
+        if self._body is None:
+            return size
+        if size == 0:
+            body, self._body = bytes(self._body), None
+            headers = self._stream.headers
+            self._cache.store(
+                self._key,
+                body,
+                charset=self._stream.charset,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            )
+        elif len(self._body) + size > self._cache.max_bytes:
+            self._body = None
+        else:
+            self._body += memoryview(buffer)[:size]
+        return size
+
+    def close(self) -> None:
+        self._stream.close()
+        super().close()
+
+
+class _DeflateDecoder:
+    """Decode ``deflate`` bodies sent either zlib-wrapped or as raw deflate."""
+
+    def __init__(self) -> None:
+        self._decoder = zlib.decompressobj(zlib.MAX_WBITS)
+        self._started = False
+
+    def decompress(self, data: bytes) -> bytes:
+        if not self._started:
+            self._started = True
+            try:
+                return self._decoder.decompress(data)
+            except zlib.error:
+                self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decoder.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._decoder.flush()
+
+
+def _timed_connect(
+    connection: http.client.HTTPConnection, timings: timing.SourceTimings, *, tls: bool
+) -> None:
+    """Connect, recording TCP connect and TLS handshake time separately."""
+    create_connection = connection._create_connection
+    tcp = 0.0
+
+    # ``HTTPSConnection.connect`` opens the TCP socket through this hook and
+    # then wraps it, so whatever remains of the total is the handshake.
+    def timed_create_connection(*args, **kwargs):
+        nonlocal tcp
+        started = time.perf_counter()
+        try:
+            return create_connection(*args, **kwargs)
+        finally:
+            tcp += time.perf_counter() - started
+
+    connection._create_connection = timed_create_connection
+    started = time.perf_counter()
+    try:
+        connection.connect()
+    finally:
+        timings.add(timing.STAGE_CONNECT, tcp)
+        if tls:
+            timings.add(timing.STAGE_TLS, time.perf_counter() - started - tcp)
+        timings.count("connections")
+
+
+def _set_default_header(headers: dict[str, str], name: str, value: str) -> None:
+    if not any(key.lower() == name.lower() for key in headers):
+        headers[name] = value
+
+
+def _origin(url: str) -> tuple[str, str | None, int | None]:
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    return scheme, parts.hostname, port or {"https": 443, "http": 80}.get(scheme)
+
+
+def _decoder_for(encoding: str | None):
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return _DeflateDecoder()
+    if encoding in ("", "identity"):
+        return None
+    raise SourceError(f"Unsupported Content-Encoding: {encoding}")
+
+
+def _drain(response: http.client.HTTPResponse) -> bool:
+    """Discard a response body so its connection can be reused."""
+    try:
+        response.read()
+    except OSError, http.client.HTTPException:
+        return False
+    return True
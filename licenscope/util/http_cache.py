@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from licenscope.util.logging import get_logger
+
+# Request headers that do not change the response body and are left out of
+# the cache key.
+_IGNORED_HEADERS = {
+    "accept-encoding",
+    "connection",
+    "if-modified-since",
+    "if-none-match",
+    "user-agent",
+}
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    body: bytes
+    charset: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """On-disk store of validated response bodies for conditional requests.
+
+    Each entry is a ``<key>.body`` file with a ``<key>.json`` sidecar holding
+    the ETag/Last-Modified validators. Entries are evicted least recently used
+    first once their total body size exceeds ``max_bytes``; recency is kept
+    in the body file's mtime so it survives between runs.
+    """
+
+    def __init__(self, directory: str | Path, *, max_bytes: int) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._logger = get_logger(self.__class__.__name__)
+        self._load_index()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @staticmethod
+    def key_for(method: str, url: str, headers: dict[str, str]) -> str:
+        relevant = sorted(
+            (name.lower(), value)
+            for name, value in headers.items()
+            if name.lower() not in _IGNORED_HEADERS
+        )
+        material = json.dumps([method.upper(), url, relevant])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            if key not in self._index:
+                return None
+        try:
+            meta = json.loads(self._meta_path(key).read_text())
+            body = self._body_path(key).read_bytes()
+        except OSError, ValueError:
+            self._discard(key)
+            return None
+        return CacheEntry(
+            body=body,
+            charset=meta.get("charset"),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def record_hit(self, key: str) -> None:
+        with self._lock:
+            self._stats["hits"] += 1
+            if key in self._index:
+                self._index.move_to_end(key)
+        try:
+            os.utime(self._body_path(key))
+        except OSError:
+            pass
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self._stats["misses"] += 1
+
+    def store(
+        self,
+        key: str,
+        body: bytes,
+        *,
+        charset: str | None,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        if not etag and not last_modified:
+            self._discard(key)
+            return
+        if len(body) > self._max_bytes:
+            return
+        meta = {"charset": charset, "etag": etag, "last_modified": last_modified}
+        try:
+            self._write_atomic(self._body_path(key), body)
+            self._write_atomic(self._meta_path(key), json.dumps(meta).encode("utf-8"))
+        except OSError as exc:
+            self._logger.warning("Failed to write HTTP cache entry: {}", exc)
+            return
+        with self._lock:
+            self._size -= self._index.pop(key, 0)
+            self._index[key] = len(body)
+            self._size += len(body)
+            self._stats["stores"] += 1
+            evicted = self._evict_locked()
+        for stale in evicted:
+            self._remove_files(stale)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._index), "bytes": self._size}
+
+    def _load_index(self) -> None:
+        entries = []
+        for body_path in self._directory.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            if self._meta_path(body_path.stem).exists():
+                entries.append((stat.st_mtime, body_path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+        for stale in self._evict_locked():
+            self._remove_files(stale)
+
+    def _evict_locked(self) -> list[str]:
+        evicted = []
+        while self._size > self._max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._size -= size
+            self._stats["evictions"] += 1
+            evicted.append(key)
+        return evicted
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            self._size -= self._index.pop(key, 0)
+        self._remove_files(key)
+
+    def _remove_files(self, key: str) -> None:
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _body_path(self, key: str) -> Path:
+        return self._directory / f"{key}.body"
+
+    def _meta_path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Iterator
+from typing import Any, BinaryIO
+
+_CHUNK_SIZE = 256 * 1024
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = ",]}" + _WHITESPACE
+_STRUCTURAL_RE = re.compile(r'["\[\]{}]')
+_PRIMITIVE_END_RE = re.compile(r"[,\]}\s]")
+
+
+def iter_json_path(stream: BinaryIO, key: str) -> Iterator[Any]:
+    """Yield the value at a dotted ``key`` path from a JSON byte stream.
+
+    Only the subtree at ``key`` is decoded into Python objects; everything
+    else is skipped while scanning. When the value is an array its elements
+    are yielded one at a time, otherwise the value itself is yielded once.
+    Paths follow the same rules as the ``json`` parser: ``.`` is the
+    document root and each dotted part selects an object member.
+
+    Raises ``LookupError`` when the path does not exist and ``ValueError``
+    when the stream is not valid JSON up to the end of the selected value.
+    """
+    scanner = _Scanner(stream)
+    path = key.lstrip(".")
+    for part in path.split(".") if path else []:
+        scanner.enter_member(part, key)
+    if scanner.peek() == "[":
+        scanner.advance()
+        if scanner.peek() == "]":
+            return
+        while True:
+            yield scanner.decode_value()
+            separator = scanner.peek()
+            scanner.advance()
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError("Expected ',' or ']' in JSON array")
+    else:
+        yield scanner.decode_value()
+
+
+class _Scanner:
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._mark: int | None = None
+        self._eof = False
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at EOF."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def advance(self) -> None:
+        self._pos += 1
+
+    def enter_member(self, name: str, key: str) -> None:
+        if self.peek() != "{":
+            raise LookupError(key)
+        self.advance()
+        if self.peek() == "}":
+            raise LookupError(key)
+        while True:
+            member = self._read_string()
+            if self.peek() != ":":
+                raise ValueError("Expected ':' after JSON object key")
+            self.advance()
+            if member == name:
+                return
+            self._scan_value()
+            separator = self.peek()
+            self.advance()
+            if separator == "}":
+                raise LookupError(key)
+            if separator != ",":
+                raise ValueError("Expected ',' or '}' in JSON object")
+
+    def decode_value(self) -> Any:
+        self.peek()
+        # Fast path: decode straight from the buffer. Strings and containers
+        # are self-delimiting, but a bare number cut by the chunk boundary
+        # decodes as a valid prefix, so only trust it when a delimiter
+        # follows. Anything else falls back to scanning the value's extent.
+        try:
+            value, end = _DECODER.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if (
+                isinstance(value, (str, list, dict))
+                or (end == len(self._buffer) and self._eof)
+                or (end < len(self._buffer) and self._buffer[end] in _DELIMITERS)
+            ):
+                self._pos = end
+                return value
+        self._mark = self._pos
+        try:
+            self._scan_value()
+            text = self._buffer[self._mark : self._pos]
+        finally:
+            self._mark = None
+        return json.loads(text)
+
+    def _read_string(self) -> str:
+        self.peek()
+        self._mark = self._pos
+        try:
+            self._scan_string()
+            text = self._buffer[self._mark : self._pos]
+        finally:
+            self._mark = None
+        return json.loads(text)
+
+    def _scan_value(self) -> None:
+        char = self.peek()
+        if char == "":
+            raise ValueError("Unexpected end of JSON input")
+        if char == '"':
+            self._scan_string()
+        elif char in "[{":
+            self._scan_container()
+        else:
+            self._scan_primitive()
+
+    def _scan_string(self) -> None:
+        if self._buffer[self._pos] != '"':
+            raise ValueError("Expected JSON string")
+        self._pos += 1
+        while True:
+            buffer = self._buffer
+            index = buffer.find('"', self._pos)
+            while index != -1:
+                back = index - 1
+                while back >= 0 and buffer[back] == "\\":
+                    back -= 1
+                if (index - 1 - back) % 2 == 0:
+                    self._pos = index + 1
+                    return
+                index = buffer.find('"', index + 1)
+            # Consume what was scanned but keep a trailing run of backslashes
+            # so an escaped quote split across chunks is still recognised.
+            end = len(buffer)
+            while end > self._pos and buffer[end - 1] == "\\":
+                end -= 1
+            self._pos = end
+            if not self._fill():
+                raise ValueError("Unterminated JSON string")
+
+    def _scan_container(self) -> None:
+        depth = 0
+        while True:
+            match = _STRUCTURAL_RE.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise ValueError("Unexpected end of JSON input")
+                continue
+            char = match.group()
+            self._pos = match.start()
+            if char == '"':
+                self._scan_string()
+                continue
+            self._pos += 1
+            if char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _scan_primitive(self) -> None:
+        while True:
+            match = _PRIMITIVE_END_RE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return
+            self._pos = len(self._buffer)
+            if not self._fill():
+                return
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(_CHUNK_SIZE)
+        if chunk:
+            text = self._decoder.decode(chunk)
+        else:
+            self._eof = True
+            text = self._decoder.decode(b"", final=True)
+        keep = self._pos if self._mark is None else self._mark
+        self._buffer = self._buffer[keep:] + text
+        self._pos -= keep
+        if self._mark is not None:
+            self._mark -= keep
+        return bool(chunk) or bool(text)
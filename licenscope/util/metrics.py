@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import gzip
+import http.server
+import threading
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+
+from licenscope.core.models import LicenseRecord, RecordBatch
+from licenscope.util.logging import get_logger
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (name, type, help) for series labelled by source and system.
+_RECORD_FAMILIES = (
+    (
+        "licenscope_license_days_left",
+        "gauge",
+        "Whole days until the license expires, as of the last refresh.",
+    ),
+    (
+        "licenscope_license_expires_at_seconds",
+        "gauge",
+        "License expiry as a Unix timestamp.",
+    ),
+    (
+        "licenscope_license_expired",
+        "gauge",
+        "1 if the license had expired at the last refresh.",
+    ),
+)
+# (name, type, help) for series labelled by source only.
+_SOURCE_FAMILIES = (
+    ("licenscope_source_up", "gauge", "1 if the last refresh of the source succeeded."),
+    (
+        "licenscope_source_last_refresh_timestamp_seconds",
+        "gauge",
+        "Unix time the source was last refreshed.",
+    ),
+    (
+        "licenscope_source_fetch_duration_seconds",
+        "gauge",
+        "Time the last refresh took to fetch and parse the source.",
+    ),
+    (
+        "licenscope_source_records",
+        "gauge",
+        "Records returned by the last successful refresh.",
+    ),
+)
+_FAMILIES = _RECORD_FAMILIES + _SOURCE_FAMILIES
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsSnapshot:
+    """Latest records and health of every source as Prometheus text.
+
+    Sources are identified by integer keys, which are their positions in
+    ``labels`` until ``relabel`` replaces the set of sources. Each update
+    renders only the lines of the source that changed; the full exposition
+    is assembled from those fragments on the next scrape after a change and
+    is served from cache until the following change.
+    """
+
+    def __init__(self, labels: Sequence[str]) -> None:
+        self._labels: dict[int, str] = {}
+        # Per source: (system, days left, expiry timestamp, expired) rows
+        # and (up, refresh timestamp, duration, record count) health.
+        self._rows: dict[int, list[tuple[str, int, float, int]]] = {}
+        self._health: dict[int, tuple[int, float, float, int | None]] = {}
+        self._fragments: dict[int, dict[str, str]] = {}
+        self._body: bytes | None = None
+        self._compressed: bytes | None = None
+        self._lock = threading.Lock()
+        self._set_labels(dict(enumerate(labels)))
+
+    def relabel(self, labels: Mapping[int, str]) -> None:
+        """Replace the set of sources, keeping the series of kept keys."""
+        with self._lock:
+            self._set_labels(labels)
+            for key in list(self._fragments):
+                if key in self._labels:
+                    self._fragments[key] = self._render_source(key)
+                else:
+                    del self._fragments[key], self._health[key]
+                    self._rows.pop(key, None)
+            self._body = self._compressed = None
+
+    def _set_labels(self, labels: Mapping[int, str]) -> None:
+        # Sources sharing a label are told apart by their position.
+        seen: set[str] = set()
+        self._labels = {}
+        for position, (key, label) in enumerate(labels.items()):
+            if label in seen:
+                label = f"{label}#{position}"
+            seen.add(label)
+            self._labels[key] = _escape(label)
+
+    def update(
+        self, key: int, records: list[LicenseRecord], *, duration: float
+    ) -> None:
+        batch = RecordBatch(records)
+        # A system reported twice by one source keeps its last record, as
+        # duplicate series would be rejected by the scraper.
+        rows = {
+            record.system: (
+                _escape(record.system),
+                days_left,
+                record.expires_at.timestamp(),
+                int(expired),
+            )
+            for record, days_left, expired in zip(
+                batch, batch.days_left(), batch.is_expired()
+            )
+        }
+        with self._lock:
+            if key not in self._labels:
+                return
+            self._rows[key] = list(rows.values())
+            self._health[key] = (1, batch.now.timestamp(), duration, len(records))
+            self._fragments[key] = self._render_source(key)
+            self._body = self._compressed = None
+
+    def mark_failed(self, key: int, *, duration: float, now: datetime) -> None:
+        """Flag a failed refresh, keeping the source's previous records."""
+        with self._lock:
+            if key not in self._labels:
+                return
+            previous = self._health.get(key)
+            records = previous[3] if previous is not None else None
+            self._health[key] = (0, now.timestamp(), duration, records)
+            self._fragments[key] = self._render_source(key)
+            self._body = self._compressed = None
+
+    def _render_source(self, key: int) -> dict[str, str]:
+        label = self._labels[key]
+        days, expires, expired_lines = [], [], []
+        for system, days_left, expires_at, expired in self._rows.get(key, ()):
+            labels = f'{{source="{label}",system="{system}"}}'
+            days.append(f"licenscope_license_days_left{labels} {days_left}\n")
+            expires.append(
+                f"licenscope_license_expires_at_seconds{labels} {expires_at:.0f}\n"
+            )
+            expired_lines.append(f"licenscope_license_expired{labels} {expired}\n")
+        up, now, duration, records = self._health[key]
+        labels = f'{{source="{label}"}}'
+        return {
+            "licenscope_license_days_left": "".join(days),
+            "licenscope_license_expires_at_seconds": "".join(expires),
+            "licenscope_license_expired": "".join(expired_lines),
+            "licenscope_source_up": f"licenscope_source_up{labels} {up}\n",
+            "licenscope_source_last_refresh_timestamp_seconds": (
+                f"licenscope_source_last_refresh_timestamp_seconds{labels} {now:.3f}\n"
+            ),
+            "licenscope_source_fetch_duration_seconds": (
+                f"licenscope_source_fetch_duration_seconds{labels} {duration:.6f}\n"
+            ),
+            "licenscope_source_records": (
+                ""
+                if records is None
+                else f"licenscope_source_records{labels} {records}\n"
+            ),
+        }
+
+    def render(self, *, compressed: bool = False) -> bytes:
+        with self._lock:
+            if self._body is None:
+                parts = []
+                for name, kind, help_text in _FAMILIES:
+                    parts.append(f"# HELP {name} {help_text}\n# TYPE {name} {kind}\n")
+                    parts.extend(
+                        self._fragments[key].get(name, "")
+                        for key in self._labels
+                        if key in self._fragments
+                    )
+                self._body = "".join(parts).encode("utf-8")
+            if not compressed:
+                return self._body
+            if self._compressed is None:
+                self._compressed = gzip.compress(self._body, compresslevel=1)
+            return self._compressed
+
+
+class MetricsServer:
+    """Serve a ``MetricsSnapshot`` at ``/metrics`` from a background thread.
+
+    Scrapes only read the cached exposition; they never trigger a refresh.
+    """
+
+    def __init__(self, snapshot: MetricsSnapshot, host: str, port: int) -> None:
+        self._snapshot = snapshot
+        self._logger = get_logger(self.__class__.__name__)
+        self._server = http.server.ThreadingHTTPServer(
+            (host, port), self._handler_class()
+        )
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="licenscope-metrics",
+            daemon=True,
+        )
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> None:
+        self._thread.start()
+        self._logger.info("Serving metrics on http://{}:{}/metrics", *self.address)
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self) -> type[http.server.BaseHTTPRequestHandler]:
+        snapshot = self._snapshot
+        logger = self._logger
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self._reply(404, b"Not found\n", "text/plain; charset=utf-8")
+                    return
+                accept = self.headers.get("Accept-Encoding", "")
+                compressed = "gzip" in accept.lower()
+                self._reply(
+                    200,
+                    snapshot.render(compressed=compressed),
+                    _CONTENT_TYPE,
+                    encoding="gzip" if compressed else None,
+                )
+
+            def _reply(
+                self,
+                status: int,
+                body: bytes,
+                content_type: str,
+                *,
+                encoding: str | None = None,
+            ) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if encoding:
+                    self.send_header("Content-Encoding", encoding)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug(
+                    "Metrics request from {}: {}", self.address_string(), format % args
+                )
+
+        return Handler
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+from licenscope.core.errors import ConfigError
+
+
+def load_reference(reference: str) -> Any:
+    """Import ``module:attribute`` and return the attribute."""
+    module_name, _, attribute = reference.partition(":")
+    try:
+        target: Any = importlib.import_module(module_name)
+        for part in attribute.split(".") if attribute else []:
+            target = getattr(target, part)
+    except (ImportError, AttributeError) as exc:
+        raise ConfigError(f"Failed to load plugin {reference}: {exc}") from exc
+    return target
+
+
+def resolve_plugin(plugins: dict[str, Any], name: str, group: str) -> Any | None:
+    """Return the plugin registered under ``name``, importing it on first use.
+
+    Values in ``plugins`` are either loaded objects or ``module:attribute``
+    references. Names that are not registered are looked up in the
+    ``group`` entry-point group of installed distributions. Loaded plugins
+    replace their reference in ``plugins`` so each is imported only once.
+    """
+    plugin = plugins.get(name)
+    if plugin is None:
+        plugin = _entry_point_reference(group, name)
+        if plugin is None:
+            return None
+    if isinstance(plugin, str):
+        plugin = load_reference(plugin)
+        plugins[name] = plugin
+    return plugin
+
+
+def _entry_point_reference(group: str, name: str) -> str | None:
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=group, name=name):
+        return entry_point.value
+    return None
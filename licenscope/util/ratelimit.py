@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from licenscope.config.schema import HostLimitConfig
+
+# Limits under this key apply to every host without limits of its own.
+DEFAULT_HOST = "*"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostLimiter:
+    """Token bucket and in-flight cap for the requests to one host.
+
+    Requests are admitted strictly in arrival order: a request waits until
+    it is first in line, the host is not paused by a ``Retry-After``, fewer
+    than ``max_in_flight`` requests are running, and a token is available.
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` per
+    second; without a ``rate`` only the in-flight cap applies.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float | None = None,
+        burst: int | None = None,
+        max_in_flight: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._burst = float(burst or 1)
+        self._max_in_flight = max_in_flight
+        self._clock = clock
+        self._tokens = self._burst
+        self._updated = clock()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._waiting: deque[object] = deque()
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout: float | None = None) -> float:
+        """Block until the request may be sent; return the seconds waited.
+
+        Raises ``TimeoutError`` as soon as it is clear the request will not
+        be admitted within ``timeout`` seconds.
+        """
+        started = self._clock()
+        until = None if timeout is None else started + timeout
+        ticket = object()
+        with self._condition:
+            self._waiting.append(ticket)
+            try:
+                while (delay := self._delay(ticket)) != 0.0:
+                    if until is not None:
+                        left = until - self._clock()
+                        if left <= 0 or (delay is not None and delay > left):
+                            raise TimeoutError(
+                                f"Request not admitted within {timeout:.1f}s"
+                            )
+                        if delay is None:
+                            delay = left
+                    self._condition.wait(delay)
+            except BaseException:
+                self._waiting.remove(ticket)
+                self._condition.notify_all()
+                raise
+            self._waiting.popleft()
+            if self._rate is not None:
+                self._tokens -= 1.0
+            self._in_flight += 1
+            # The next request in line may be admissible right away.
+            self._condition.notify_all()
+        return self._clock() - started
+
+    def release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request to the host for ``seconds``."""
+        with self._condition:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def _delay(self, ticket: object) -> float | None:
+        """Seconds until ``ticket`` may go, ``0.0`` now, ``None`` unknown."""
+        if self._waiting[0] is not ticket:
+            return None
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._max_in_flight is not None and self._in_flight >= self._max_in_flight:
+            return None
+        if self._rate is None:
+            return 0.0
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self._rate
+
+
+class HostLimits:
+    """Hand out one ``HostLimiter`` per host from the configured limits."""
+
+    def __init__(self, limits: Mapping[str, HostLimitConfig]) -> None:
+        self._limits = {host.lower(): config for host, config in limits.items()}
+        self._limiters: dict[str, HostLimiter | None] = {}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._limits)
+
+    def config_for(self, host: str) -> HostLimitConfig | None:
+        host = host.lower()
+        return self._limits.get(host) or self._limits.get(DEFAULT_HOST)
+
+    def for_host(self, host: str) -> HostLimiter | None:
+        host = host.lower()
+        with self._lock:
+            if host not in self._limiters:
+                config = self.config_for(host)
+                self._limiters[host] = (
+                    None
+                    if config is None
+                    else HostLimiter(
+                        rate=config.rate,
+                        burst=config.burst,
+                        max_in_flight=config.max_in_flight,
+                    )
+                )
+            return self._limiters[host]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import http.client
+import random
+import ssl
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import TypeVar
+
+from licenscope.config.schema import RetryConfig
+from licenscope.core.errors import HttpError, SourceError
+from licenscope.util import deadline
+
+T = TypeVar("T")
+
+# Samples a host needs before its latency percentile is trusted for hedging.
+_HEDGE_MIN_SAMPLES = 20
+_HEDGE_WINDOW = 200
+# Never hedge sooner than this, however fast the host usually answers.
+_HEDGE_MIN_DELAY = 0.05
+
+
+class CircuitOpenError(SourceError):
+    """Raised instead of contacting a host whose circuit breaker is open."""
+
+
+def is_transient(exc: BaseException, retry_statuses: frozenset[int]) -> bool:
+    """Whether a failed attempt is worth repeating.
+
+    Connection, timeout and read errors are, as are HTTP errors with one of
+    ``retry_statuses``. Certificate verification failures, bad URLs and
+    malformed responses are not.
+    """
+    if isinstance(exc, HttpError):
+        return exc.status in retry_statuses
+    if isinstance(exc, CircuitOpenError):
+        return False
+    cause = exc.__cause__ if isinstance(exc, SourceError) else exc
+    if isinstance(cause, ssl.SSLCertVerificationError):
+        return False
+    return isinstance(cause, (OSError, http.client.HTTPException))
+
+
+def backoff_delay(config: RetryConfig, attempt: int) -> float:
+    """Full-jitter exponential backoff after the ``attempt``-th failure."""
+    return random.uniform(
+        0.0, min(config.max_backoff, config.backoff * 2 ** (attempt - 1))
+    )
+
+
+def call_with_retries(
+    operation: Callable[[], T],
+    config: RetryConfig,
+    *,
+    describe: str,
+    on_retry: Callable[[int, float, Exception], None] | None = None,
+) -> T:
+    """Run ``operation`` until it succeeds or a retry would be pointless.
+
+    Gives up after ``max_attempts``, on a non-transient error, or when the
+    backoff would run past the current deadline.
+    """
+    attempt = 1
+    while True:
+        try:
+            return operation()
+        except SourceError as exc:
+            if attempt >= config.max_attempts or not is_transient(
+                exc, config.retry_statuses
+            ):
+                raise
+            delay = backoff_delay(config, attempt)
+            left = deadline.remaining()
+            if left is not None and delay >= left:
+                raise
+            if on_retry is not None:
+                on_retry(attempt, delay, exc)
+        time.sleep(delay)
+        deadline.bound(0.0, describe)
+        attempt += 1
+
+
+class CircuitBreaker:
+    """Fail fast for a host after ``threshold`` consecutive failures.
+
+    Once open, calls are refused for ``cooldown`` seconds; then one trial
+    call is let through, which closes the breaker if it succeeds and opens
+    it again if it fails.
+    """
+
+    def __init__(
+        self,
+        threshold: int,
+        cooldown: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial or self._clock() - self._opened_at < self._cooldown:
+                return False
+            self._trial = True
+            return True
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self._trial = False
+            if ok:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self._threshold:
+                self._opened_at = self._clock()
+
+
+class LatencyWindow:
+    """Recent response times of a host, for picking a hedging delay."""
+
+    def __init__(self) -> None:
+        self._samples: deque[float] = deque(maxlen=_HEDGE_WINDOW)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def hedge_delay(self, percentile: float) -> float | None:
+        """The ``percentile`` latency, or ``None`` with too few samples."""
+        with self._lock:
+            if len(self._samples) < _HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return max(_HEDGE_MIN_DELAY, ordered[index])
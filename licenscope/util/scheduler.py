@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import time
+from collections.abc import Callable
+
+
+class RefreshScheduler:
+    """Keep keys ordered by when they are next due.
+
+    Each call to ``schedule`` adds a random delay of up to ``jitter`` seconds
+    on top of ``delay`` so that keys sharing an interval drift apart instead
+    of firing together on every cycle.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._heap: list[tuple[float, int, int]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, key: int, delay: float, *, jitter: float = 0.0) -> float:
+        """Schedule ``key`` and return the monotonic time it becomes due."""
+        due = self._clock() + delay
+        if jitter > 0:
+            due += self._rng.uniform(0.0, jitter)
+        heapq.heappush(self._heap, (due, next(self._sequence), key))
+        return due
+
+    def pop_due(self) -> list[int]:
+        """Remove and return every key whose due time has passed."""
+        now = self._clock()
+        due: list[int] = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def time_until_next(self) -> float | None:
+        """Seconds until the next key is due, or ``None`` when empty."""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - self._clock())
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from licenscope.core.models import LicenseRecord
+
+CHANGE_NEW = "new"
+CHANGE_EXPIRY = "changed"
+CHANGE_WINDOW = "window"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    source TEXT NOT NULL,
+    system TEXT NOT NULL,
+    expires_at INTEGER NOT NULL,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,
+    last_notified INTEGER,
+    PRIMARY KEY (source, system, expires_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS records_expires_at ON records (expires_at);
+"""
+
+_UPSERT = """
+INSERT INTO records (source, system, expires_at, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (source, system, expires_at) DO UPDATE SET
+    last_seen = excluded.last_seen
+"""
+
+
+def _to_micros(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+@dataclass(frozen=True, slots=True)
+class RecordChange:
+    source: str
+    record: LicenseRecord
+    reason: str
+    previous_expires_at: datetime | None = None
+
+
+class StateStore:
+    """SQLite store of previously seen records.
+
+    Rows are keyed by (source, system, expiry), so a system may hold several
+    licenses. A record whose expiry is not stored yet is paired with a
+    stored expiry of the same system that is no longer reported, and counts
+    as a changed expiry; without one it is new.
+
+    ``diff`` compares freshly parsed records with the stored state without
+    writing anything; ``commit`` then upserts everything observed in a run
+    and stamps the records that were notified, in a single transaction.
+    A record is reported when it is new, when its expiry changed, or when it
+    entered the notification window since it was last notified. Changes
+    whose delivery failed are left out of the upsert, so ``diff`` reports
+    them again on the next run.
+    """
+
+    def __init__(self, path: str | Path, *, window: timedelta) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._window_us = window // timedelta(microseconds=1)
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def diff(
+        self, source: str, records: Iterable[LicenseRecord], *, now: datetime
+    ) -> list[RecordChange]:
+        rows = self._connection.execute(
+            "SELECT system, expires_at, last_notified FROM records WHERE source = ?",
+            (source,),
+        )
+        known: dict[str, dict[int, int | None]] = {}
+        for system, expires, notified in rows:
+            known.setdefault(system, {})[expires] = notified
+        records = list(records)
+        reported: dict[str, set[int]] = {}
+        for record in records:
+            reported.setdefault(record.system, set()).add(_to_micros(record.expires_at))
+        # Stored expiries a system no longer reports, oldest first, to pair
+        # with the expiries it reports for the first time.
+        replaced = {
+            system: sorted(set(stored) - reported.get(system, set()))
+            for system, stored in known.items()
+        }
+        now_us = _to_micros(now)
+        seen: set[tuple[str, int]] = set()
+        changes: list[RecordChange] = []
+        for record in records:
+            expires_us = _to_micros(record.expires_at)
+            if (record.system, expires_us) in seen:
+                continue
+            seen.add((record.system, expires_us))
+            stored = known.get(record.system, {})
+            if expires_us not in stored:
+                previous = replaced.get(record.system)
+                if not previous:
+                    changes.append(RecordChange(source, record, CHANGE_NEW))
+                    continue
+                changes.append(
+                    RecordChange(
+                        source,
+                        record,
+                        CHANGE_EXPIRY,
+                        _EPOCH + timedelta(microseconds=previous.pop(0)),
+                    )
+                )
+                continue
+            last_notified = stored[expires_us]
+            window_start = expires_us - self._window_us
+            if now_us >= window_start and (
+                last_notified is None or last_notified < window_start
+            ):
+                changes.append(RecordChange(source, record, CHANGE_WINDOW))
+        return changes
+
+    def commit(
+        self,
+        observed: Mapping[str, Iterable[LicenseRecord]],
+        notified: Iterable[RecordChange],
+        *,
+        now: datetime,
+        undelivered: Iterable[RecordChange] = (),
+    ) -> None:
+        now_us = _to_micros(now)
+        undelivered = list(undelivered)
+        held = {
+            (change.source, change.record.system, _to_micros(change.record.expires_at))
+            for change in undelivered
+        }
+        # Held expiry changes keep the expiry they replace until delivered.
+        kept = held | {
+            (change.source, change.record.system, _to_micros(previous))
+            for change in undelivered
+            if (previous := change.previous_expires_at) is not None
+        }
+        rows = []
+        for source, records in observed.items():
+            for record in records:
+                key = (source, record.system, _to_micros(record.expires_at))
+                if key not in held:
+                    rows.append((*key, now_us, now_us))
+        reported: dict[tuple[str, str], set[int]] = {}
+        for source, system, expires_us, _, _ in rows:
+            reported.setdefault((source, system), set()).add(expires_us)
+        with self._connection:
+            # Expiries a system no longer reports were replaced.
+            stale = [
+                (source, system, expires_us)
+                for source in {source for source, _ in reported}
+                for system, expires_us in self._connection.execute(
+                    "SELECT system, expires_at FROM records WHERE source = ?",
+                    (source,),
+                )
+                if (source, system) in reported
+                and expires_us not in reported[(source, system)]
+                and (source, system, expires_us) not in kept
+            ]
+            self._connection.executemany(
+                "DELETE FROM records "
+                "WHERE source = ? AND system = ? AND expires_at = ?",
+                stale,
+            )
+            self._connection.executemany(_UPSERT, rows)
+            self._connection.executemany(
+                "UPDATE records SET last_seen = ? "
+                "WHERE source = ? AND system = ? AND expires_at = ?",
+                ((now_us, *key) for key in kept),
+            )
+            self._connection.executemany(
+                "UPDATE records SET last_notified = ? "
+                "WHERE source = ? AND system = ? AND expires_at = ?",
+                (
+                    (
+                        now_us,
+                        change.source,
+                        change.record.system,
+                        _to_micros(change.record.expires_at),
+                    )
+                    for change in notified
+                ),
+            )
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Stage names recorded by the instrumented code paths.
+STAGE_AUTH = "auth"
+STAGE_QUEUE = "queue"
+STAGE_CONNECT = "connect"
+STAGE_TLS = "tls_handshake"
+STAGE_TRANSFER = "transfer"
+STAGE_DECODE = "decode"
+STAGE_LOAD = "load"
+STAGE_PARSE = "parse"
+
+_current: ContextVar[SourceTimings | None] = ContextVar(
+    "licenscope_timings", default=None
+)
+_DISABLED = contextlib.nullcontext()
+# Number of source indices listed under "slowest" in a run report.
+_SLOWEST = 20
+
+
+class SourceTimings:
+    """Per-stage wall time and counters for one source.
+
+    Stages nest: time spent in an inner stage is subtracted from the stage
+    around it, so the recorded values add up to the source's duration
+    instead of counting the same seconds twice. An instance is only written
+    by the thread processing its source.
+    """
+
+    def __init__(self, index: int, kind: str, parser: str) -> None:
+        self.index = index
+        self.kind = kind
+        self.parser = parser
+        self.status = "pending"
+        self.error: str | None = None
+        self.duration = 0.0
+        self.started: float | None = None
+        self.stages: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+        self._nested: list[float] = []
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Record ``seconds`` spent in ``stage`` outside of ``measure``."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        if self._nested:
+            self._nested[-1] += seconds
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextlib.contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        self._nested.append(0.0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            inner = self._nested.pop()
+            self.stages[stage] = self.stages.get(stage, 0.0) + elapsed - inner
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[SourceTimings]:
+        """Make these timings current for the calling thread."""
+        token = _current.set(self)
+        self.status = "running"
+        self.started = time.perf_counter()
+        try:
+            yield self
+        except BaseException as exc:
+            self._settle("failed", str(exc))
+            raise
+        else:
+            self._settle("ok")
+        finally:
+            _current.reset(token)
+
+    def _settle(self, status: str, error: str | None = None) -> None:
+        # A source abandoned by a timeout keeps its "timeout" status even if
+        # its worker thread finishes after the report was closed.
+        if self.status != "running":
+            return
+        self.status = status
+        self.error = error
+        if self.started is not None:
+            self.duration = time.perf_counter() - self.started
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "index": self.index,
+            "kind": self.kind,
+            "parser": self.parser,
+            "status": self.status,
+            "duration": round(self.duration, 6),
+            "stages": {name: round(value, 6) for name, value in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+def current() -> SourceTimings | None:
+    """Timings of the source being processed by this thread, if any."""
+    return _current.get()
+
+
+def measure(stage: str) -> contextlib.AbstractContextManager[Any]:
+    """Time ``stage`` for the current source; a shared no-op when disabled."""
+    timings = _current.get()
+    if timings is None:
+        return _DISABLED
+    return timings.measure(stage)
+
+
+def count(name: str, value: int = 1) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.count(name, value)
+
+
+class RunReport:
+    """Collect source timings and notification deliveries for one run."""
+
+    def __init__(self) -> None:
+        self._started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self._duration: float | None = None
+        self._sources: dict[int, SourceTimings] = {}
+        self._deliveries: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def source(self, index: int, kind: str, parser: str) -> SourceTimings:
+        timings = SourceTimings(index, kind, parser)
+        with self._lock:
+            self._sources[index] = timings
+        return timings
+
+    def add_delivery(self, delivery: dict[str, Any]) -> None:
+        with self._lock:
+            self._deliveries.append(delivery)
+
+    def finish(self) -> None:
+        self._duration = time.perf_counter() - self._started
+        with self._lock:
+            sources = list(self._sources.values())
+        # Sources still unfinished were abandoned by a timeout.
+        for timings in sources:
+            if timings.status == "running":
+                timings._settle("timeout")
+            elif timings.status == "pending":
+                timings.status = "timeout"
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            sources = [
+                self._sources[index].to_dict() for index in sorted(self._sources)
+            ]
+            deliveries = list(self._deliveries)
+        totals: dict[str, float] = {}
+        counters: dict[str, int] = {}
+        statuses: dict[str, int] = {}
+        for source in sources:
+            for name, value in source["stages"].items():
+                totals[name] = totals.get(name, 0.0) + value
+            for name, value in source["counters"].items():
+                counters[name] = counters.get(name, 0) + value
+            statuses[source["status"]] = statuses.get(source["status"], 0) + 1
+        duration = self._duration
+        if duration is None:
+            duration = time.perf_counter() - self._started
+        return {
+            "started_at": self._started_at.isoformat(),
+            "duration": round(duration, 6),
+            "sources": sources,
+            "slowest": [
+                source["index"]
+                for source in sorted(
+                    sources, key=lambda source: source["duration"], reverse=True
+                )[:_SLOWEST]
+            ],
+            "totals": {
+                "statuses": statuses,
+                "stages": {name: round(value, 6) for name, value in totals.items()},
+                "counters": counters,
+            },
+            "notifications": deliveries,
+        }
+
+    def write(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n")
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import ipaddress
+import itertools
+import ssl
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class TlsEndpoint:
+    host: str
+    port: int = 443
+    server_name: str | None = None
+    system: str | None = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.host}:{self.port}"
+
+
+@dataclass(frozen=True)
+class TlsScanResult:
+    endpoint: TlsEndpoint
+    cert: dict[str, Any] | None = None
+    error: Exception | None = None
+    # SHA-256 of the DER-encoded peer certificate.
+    fingerprint: str | None = None
+
+
+def _is_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+@functools.cache
+def address_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide context for endpoints known only by address.
+
+    The chain is still verified, but the certificate is not expected to
+    name the address, since certificates rarely carry IP SANs.
+    """
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    return context
+
+
+class TlsScanner:
+    """Fetch peer certificates from many endpoints concurrently.
+
+    At most ``concurrency`` handshakes are in flight at any time and every
+    connection shares one SSL context. Endpoints given by IP address without
+    a ``server_name`` use ``address_context`` instead. Endpoints are pulled
+    from the input iterable lazily, so generators of any size can be scanned
+    without being materialized.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 100,
+        timeout: float = 10.0,
+        context: ssl.SSLContext | None = None,
+        address_context: ssl.SSLContext | None = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._concurrency = concurrency
+        self._timeout = timeout
+        self._context = context or ssl.create_default_context()
+        self._address_context = address_context or address_ssl_context()
+
+    def scan(self, endpoints: Iterable[TlsEndpoint]) -> list[TlsScanResult]:
+        """Scan endpoints from synchronous code, returning results in input order."""
+        indexed: list[tuple[int, TlsScanResult]] = []
+        self.scan_each(endpoints, lambda index, result: indexed.append((index, result)))
+        indexed.sort(key=lambda item: item[0])
+        return [result for _, result in indexed]
+
+    def scan_each(
+        self,
+        endpoints: Iterable[TlsEndpoint],
+        handle: Callable[[int, TlsScanResult], None],
+        *,
+        timeout: float | None = None,
+    ) -> None:
+        """Scan endpoints from synchronous code without keeping the results.
+
+        ``handle`` is called on the event loop with each endpoint's input
+        position and result as soon as its handshake completes. With
+        ``timeout``, a scan still running after that many seconds is
+        abandoned with ``TimeoutError``.
+        """
+
+        async def consume() -> None:
+            async with asyncio.timeout(timeout):
+                async for index, result in self._scan_indexed(iter(endpoints)):
+                    handle(index, result)
+
+        asyncio.run(consume())
+
+    async def iter_scan(
+        self, endpoints: Iterable[TlsEndpoint]
+    ) -> AsyncIterator[TlsScanResult]:
+        """Yield results as handshakes complete."""
+        async for _, result in self._scan_indexed(iter(endpoints)):
+            yield result
+
+    async def _scan_indexed(
+        self, endpoints: Iterator[TlsEndpoint]
+    ) -> AsyncIterator[tuple[int, TlsScanResult]]:
+        queue: asyncio.Queue[tuple[int, TlsScanResult] | None] = asyncio.Queue()
+        counter = itertools.count()
+
+        async def worker() -> None:
+            try:
+                # Workers share one iterator; pulling from it between awaits
+                # is safe because the event loop runs them one at a time.
+                for endpoint in endpoints:
+                    index = next(counter)
+                    await queue.put((index, await self._fetch(endpoint)))
+            finally:
+                await queue.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self._concurrency)]
+        remaining = len(workers)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _fetch(self, endpoint: TlsEndpoint) -> TlsScanResult:
+        context = self._context
+        if endpoint.server_name is None and _is_address(endpoint.host):
+            context = self._address_context
+        writer = None
+        try:
+            async with asyncio.timeout(self._timeout):
+                _, writer = await asyncio.open_connection(
+                    endpoint.host,
+                    endpoint.port,
+                    ssl=context,
+                    server_hostname=endpoint.server_name or endpoint.host,
+                )
+            cert = writer.get_extra_info("peercert")
+            der = writer.get_extra_info("ssl_object").getpeercert(binary_form=True)
+        except (OSError, ssl.SSLError, TimeoutError) as exc:
+            return TlsScanResult(endpoint=endpoint, error=exc)
+        finally:
+            if writer is not None:
+                # Only the handshake is needed; skip the close_notify exchange.
+                writer.transport.abort()
+        if not cert:
+            return TlsScanResult(
+                endpoint=endpoint,
+                error=ssl.SSLError("Peer did not present a certificate"),
+            )
+        return TlsScanResult(
+            endpoint=endpoint,
+            cert=cert,
+            fingerprint=hashlib.sha256(der).hexdigest() if der else None,
+        )
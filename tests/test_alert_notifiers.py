@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from licenscope.core.errors import NotificationError
+from licenscope.core.models import LicenseRecord
+from licenscope.notifications.opsgenie import OpsgenieNotifier
+from licenscope.notifications.pagerduty import PagerDutyNotifier
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+EXPIRED = LicenseRecord("jira", NOW - timedelta(days=1))
+EXPIRING = LicenseRecord("wiki", NOW + timedelta(days=10))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append((self.path, dict(self.headers), json.loads(body)))
+        if self.path.startswith("/throttled"):
+            self.send_response(429)
+            self.send_header("Retry-After", "7")
+        else:
+            self.send_response(202)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class AlertNotifierTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.received = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def test_opsgenie_creates_one_alert_per_record(self) -> None:
+        notifier = OpsgenieNotifier("secret", api_url=self.url)
+        self.addCleanup(notifier.close)
+        notifier.send([EXPIRED, EXPIRING], context={"now": NOW})
+
+        (path, headers, expired), (_, _, expiring) = self.server.received
+        self.assertEqual(path, "/v2/alerts")
+        self.assertEqual(headers["Authorization"], "GenieKey secret")
+        self.assertEqual(expired["priority"], "P2")
+        self.assertEqual(expiring["priority"], "P3")
+        self.assertIn("10 days left", expiring["message"])
+        self.assertNotEqual(expired["alias"], expiring["alias"])
+
+    def test_pagerduty_triggers_deduplicated_events(self) -> None:
+        notifier = PagerDutyNotifier("routing", events_url=f"{self.url}/enqueue")
+        self.addCleanup(notifier.close)
+        notifier.send([EXPIRED], context={"now": NOW})
+        notifier.send([EXPIRED], context={"now": NOW})
+
+        (_, _, first), (_, _, second) = self.server.received
+        self.assertEqual(first["routing_key"], "routing")
+        self.assertEqual(first["event_action"], "trigger")
+        self.assertEqual(first["payload"]["severity"], "critical")
+        self.assertEqual(first["dedup_key"], second["dedup_key"])
+
+    def test_throttled_delivery_is_retryable(self) -> None:
+        notifier = PagerDutyNotifier("routing", events_url=f"{self.url}/throttled")
+        self.addCleanup(notifier.close)
+        with self.assertRaises(NotificationError) as raised:
+            notifier.send([EXPIRING], context={"now": NOW})
+        self.assertTrue(raised.exception.retryable)
+        self.assertEqual(raised.exception.status, 429)
+        self.assertEqual(raised.exception.retry_after, 7.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from licenscope.util.datetime import DateTimeParser, parse_datetime
+
+EXPECTED = datetime(2030, 3, 3, 10, 0, tzinfo=ZoneInfo("UTC"))
+
+
+class ParseDatetimeTest(unittest.TestCase):
+    def test_ordinal_day(self) -> None:
+        self.assertEqual(parse_datetime("Mar 3rd 2030 10:00:00"), EXPECTED)
+        self.assertEqual(parse_datetime("March 3rd, 2030 10:00"), EXPECTED)
+
+    def test_repeated_whitespace(self) -> None:
+        self.assertEqual(parse_datetime("Mar  3   2030\t10:00:00"), EXPECTED)
+
+    def test_parser_normalizes_like_parse_datetime(self) -> None:
+        parser = DateTimeParser()
+        self.assertEqual(parser.parse("Mar 3rd 2030 10:00:00"), EXPECTED)
+        self.assertEqual(parser.parse("Mar  3  2030 10:00:00"), EXPECTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Cold-start import budget of the CLI.
+
+Only imports triggered by Licenscope are counted; modules the interpreter
+loads at startup (``site`` and whatever ``.pth`` files pull in) are not.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_MARKER = "--licenscope-imports--"
+_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)")
+
+# Generous so that slow CI machines pass; a plugin imported eagerly again
+# blows well past them.
+HELP_BUDGET_MS = 75
+FILE_RUN_BUDGET_MS = 300
+REPEATS = 3
+
+# Heavy dependencies that only configs using them may import.
+LAZY_MODULES = ("slack_sdk", "jinja2", "http.client")
+
+_CONFIG = """
+[[sources]]
+kind = "file"
+parser = "regex"
+options = {{ path = "{path}" }}
+parser_options = {{ pattern = "(?P<system>\\\\w+) expires (?P<expires_at>\\\\S+)" }}
+"""
+
+
+def _profile(*argv: str) -> tuple[float, set[str]]:
+    """Run the CLI once; return its import time in ms and the modules imported."""
+    code = (
+        "import sys\n"
+        f"print({_MARKER!r}, file=sys.stderr, flush=True)\n"
+        f"sys.argv = ['licenscope', *{list(argv)!r}]\n"
+        "from licenscope.cli import main\n"
+        "main()\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if completed.returncode != 0:
+        raise AssertionError(f"licenscope {' '.join(argv)} failed:\n{completed.stderr}")
+    _, _, profile = completed.stderr.partition(_MARKER)
+    total_us = 0
+    modules: set[str] = set()
+    for match in _LINE.finditer(profile):
+        cumulative, indent, module = match.groups()
+        modules.add(module)
+        # Top-level imports only; nested ones are part of their cumulative time.
+        if len(indent) == 1:
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+class ImportTimeTest(unittest.TestCase):
+    def assert_budget(self, budget_ms: float, *argv: str) -> None:
+        timings = []
+        for _ in range(REPEATS):
+            elapsed_ms, modules = _profile(*argv)
+            timings.append(elapsed_ms)
+            for module in LAZY_MODULES:
+                self.assertNotIn(module, modules, f"{module} imported eagerly")
+        self.assertLess(
+            min(timings),
+            budget_ms,
+            f"licenscope {' '.join(argv)} imports took {min(timings):.1f} ms",
+        )
+
+    def test_help(self) -> None:
+        self.assert_budget(HELP_BUDGET_MS, "--help")
+
+    def test_file_regex_run(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            licenses = Path(directory) / "licenses.txt"
+            licenses.write_text("jira expires 2030-01-01\n")
+            config = Path(directory) / "licenscope.toml"
+            config.write_text(_CONFIG.format(path=licenses.as_posix()))
+            self.assert_budget(
+                FILE_RUN_BUDGET_MS, "-c", str(config), "--log-level", "ERROR"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from licenscope.app import LicenseChecker
+from licenscope.config.loader import ConfigLoader
+from licenscope.core.errors import NotificationError
+from licenscope.notifications.base import Notifier
+from licenscope.notifications.registry import NotificationRegistry
+from licenscope.parsers import build_registry
+
+_CONFIG = """
+[delivery]
+max_attempts = 1
+critical_days = 7
+
+[[sources]]
+kind = "file"
+parser = "regex"
+options = {{ path = "{path}" }}
+parser_options = {{ pattern = "(?P<system>\\\\w+) expires (?P<expires_at>\\\\S+)" }}
+
+[[notifications]]
+kind = "steady"
+
+[[notifications]]
+kind = "flaky"
+"""
+
+
+class SteadyNotifier(Notifier):
+    name = "steady"
+    sent: list[list[str]] = []
+
+    def send(self, records, *, context) -> None:
+        self.sent.append([record.system for record in records])
+
+
+class FlakyNotifier(Notifier):
+    """Rejects its first delivery, then accepts everything."""
+
+    name = "flaky"
+    sent: list[list[str]] = []
+
+    def send(self, records, *, context) -> None:
+        self.sent.append([record.system for record in records])
+        if len(self.sent) == 1:
+            raise NotificationError("flaky notification failed")
+
+
+class EarlyNotificationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        SteadyNotifier.sent = []
+        FlakyNotifier.sent = []
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        licenses = Path(directory.name) / "licenses.txt"
+        licenses.write_text("jira expires 2000-01-01\nwiki expires 2999-01-01\n")
+        config = Path(directory.name) / "licenscope.toml"
+        config.write_text(_CONFIG.format(path=licenses.as_posix()))
+        self.config = ConfigLoader().load(str(config))
+        notifications = NotificationRegistry()
+        notifications.register(SteadyNotifier)
+        notifications.register(FlakyNotifier)
+        self.checker = LicenseChecker(
+            parser_registry=build_registry(), notification_registry=notifications
+        )
+        self.addCleanup(self.checker.close)
+
+    def test_final_round_resends_only_to_failed_notifiers(self) -> None:
+        self.checker.run(self.config)
+
+        self.assertEqual(SteadyNotifier.sent, [["jira"], ["wiki"]])
+        self.assertEqual(FlakyNotifier.sent, [["jira"], ["jira", "wiki"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from licenscope.core.models import LicenseRecord
+from licenscope.util.state import CHANGE_EXPIRY, CHANGE_NEW, StateStore
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SOURCE = "source"
+
+
+class StateStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = StateStore(
+            Path(directory.name) / "state.db", window=timedelta(days=30)
+        )
+        self.addCleanup(self.store.close)
+
+    def run_once(self, records, *, delivered: bool, now=NOW):
+        changes = self.store.diff(SOURCE, records, now=now)
+        self.store.commit(
+            {SOURCE: records},
+            changes if delivered else [],
+            now=now,
+            undelivered=() if delivered else changes,
+        )
+        return changes
+
+    def test_failed_delivery_is_reported_again(self) -> None:
+        records = [LicenseRecord("foo", NOW + timedelta(days=365))]
+        failed = self.run_once(records, delivered=False)
+        self.assertEqual([change.reason for change in failed], [CHANGE_NEW])
+
+        retried = self.run_once(records, delivered=True)
+        self.assertEqual([change.reason for change in retried], [CHANGE_NEW])
+        self.assertEqual(self.run_once(records, delivered=True), [])
+
+    def test_failed_expiry_change_keeps_previous_expiry(self) -> None:
+        before = NOW + timedelta(days=365)
+        after = NOW + timedelta(days=730)
+        self.run_once([LicenseRecord("foo", before)], delivered=True)
+        self.run_once([LicenseRecord("foo", after)], delivered=False)
+
+        retried = self.run_once([LicenseRecord("foo", after)], delivered=True)
+        self.assertEqual([change.reason for change in retried], [CHANGE_EXPIRY])
+        self.assertEqual(retried[0].previous_expires_at, before)
+
+    def test_licenses_sharing_a_system_do_not_flap(self) -> None:
+        records = [
+            LicenseRecord("foo", NOW + timedelta(days=365)),
+            LicenseRecord("foo", NOW + timedelta(days=730)),
+        ]
+        first = self.run_once(records, delivered=True)
+        self.assertEqual([change.reason for change in first], [CHANGE_NEW] * 2)
+        self.assertEqual(self.run_once(records, delivered=True), [])
+
+    def test_partial_delivery_holds_only_undelivered_license(self) -> None:
+        delivered = LicenseRecord("foo", NOW + timedelta(days=365))
+        failed = LicenseRecord("foo", NOW + timedelta(days=730))
+        changes = self.store.diff(SOURCE, [delivered, failed], now=NOW)
+        self.store.commit(
+            {SOURCE: [delivered, failed]},
+            [changes[0]],
+            now=NOW,
+            undelivered=[changes[1]],
+        )
+
+        retried = self.store.diff(SOURCE, [delivered, failed], now=NOW)
+        self.assertEqual([change.record for change in retried], [failed])
+        self.assertEqual(retried[0].reason, CHANGE_NEW)
+
+
+if __name__ == "__main__":
+    unittest.main()